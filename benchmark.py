@@ -0,0 +1,475 @@
+from qir import *
+from qir import bytecode, decompile, errors
+from qir.simplify import Simplifier, find_shared
+import dis
+import time
+import types
+import timeit
+
+
+def case_1(x, z):
+    y = x + 2
+    if y % 2 == 0:
+        z = True
+    else:
+        z = False
+    return z
+
+
+def case_2(x):
+    for z in range(x, 0, -1):
+        w = print(z)
+    return None
+
+
+def case_3(x):
+    y = 0
+    while x + y < 12:
+        if x % 2 == 9:
+            break
+        elif x % 2 == 8:
+            continue
+        y -= 6
+    return 6
+
+
+def case_4(salary):
+    return [{'name': e.name}
+            for e in employees
+            if e.salary < 3]
+
+
+def case_5(x):
+    for a in xs:
+        for b in ys:
+            x = x + a * b
+    return x
+
+
+def generate_linear(size):
+    """
+    Generate a function with a single, very long basic block.
+    """
+    lines = ['def linear(x, y):', '    z = 0']
+
+    for i in range(size):
+        lines.append('    z = (z + x * y - y % 7) ** 2 <= x[z].attr')
+
+    lines.append('    return z')
+
+    namespace = {}
+    exec('\n'.join(lines), namespace)
+    return namespace['linear']
+
+
+def generate_nested(depth):
+    """
+    Generate a function with depth nested for loops.
+    """
+    lines = ['def nested(x):']
+
+    for i in range(depth):
+        lines.append('    ' * (i + 1) + 'for i%d in x:' % i)
+
+    lines.append('    ' * (depth + 1) + 'x = x + i0')
+    lines.append('    return x')
+
+    namespace = {}
+    exec('\n'.join(lines), namespace)
+    return namespace['nested']
+
+
+class BaselineLinearBlock(decompile.LinearBlock):
+    """
+    A LinearBlock which executes its instructions with the if/elif chain on
+    opnames that LinearBlock.execute used before OPCODE_HANDLERS, so that we
+    can compare both implementations on the same blocks.
+
+    The chain is copied as is, and only converts the symbolic stacks of the
+    current decompiler from and to the Python lists it used to work on, which
+    takes converting seconds in total so that measure_baseline can leave it
+    out. It also keeps some bugs of the time, e.g. BUILD_LIST builds its list
+    in the reverse order, so its results are only meant to be timed.
+    """
+    converting = 0.0
+
+    def execute(self, starting_stack=decompile.EMPTY_STACK, starting_env={}):
+        decompile.Block.execute(self, starting_stack, starting_env)
+
+        start = time.perf_counter()
+        stack = self.stack.to_list()
+        BaselineLinearBlock.converting += time.perf_counter() - start
+
+        bindings = []
+        self.discarded = []
+
+        for instruction in self.instructions:
+            name = instruction.opname
+
+            # General instructions
+            if name == 'NOP':
+                pass
+
+            elif name == 'POP_TOP':
+                stack.pop()
+
+            elif name == 'ROT_TWO':
+                stack[-1], stack[-2] = stack[-2], stack[-1]
+
+            elif name == 'ROT_THREE':
+                stack[-1], stack[-2], stack[-3] =\
+                    stack[-2], stack[-3], stack[-1]
+
+            elif name == 'DUP_TOP':
+                stack.append(stack[-1])
+
+            elif name == 'DUP_TOP_TWO':
+                stack.append(stack[-2])
+                stack.append(stack[-2])
+
+            # Binary and in-place operations
+            elif name in decompile.BINARY_OPERATIONS:
+                right = stack.pop()
+                left = stack.pop()
+                stack.append(decompile.BINARY_OPERATIONS[name](left, right))
+
+            elif name in decompile.INPLACE_OPERATIONS:
+                right = stack.pop()
+                left = stack.pop()
+                stack.append(decompile.INPLACE_OPERATIONS[name](left, right))
+
+            elif (name == 'COMPARE_OP' and
+                  instruction.argval in decompile.COMPARE_OPERATIONS):
+                right = stack.pop()
+                left = stack.pop()
+                stack.append(decompile.COMPARE_OPERATIONS[instruction.argval](
+                    left, right))
+
+            elif name == 'BINARY_SUBSCR':
+                key = stack.pop()
+                container = stack.pop()
+                stack.append(TupleDestr(container, key))
+
+            elif name == 'STORE_SUBSCR':
+                key = stack.pop()
+                container = stack.pop()
+                value = stack.pop()
+                stack.append(TupleCons(key, value, container))
+
+            elif name == 'DELETE_SUBSCR':
+                container = stack.pop()
+                value = stack.pop()
+                stack.append(TupleCons(key, Null(), container))
+
+            # Miscellaneous opcodes
+            elif name in ['RETURN_VALUE', 'YIELD_VALUE']:
+                self.returns = stack.pop()
+
+            elif name in ['LIST_APPEND', 'SET_ADD']:
+                value = stack.pop()
+                tail = stack[-1 * instruction.argval]
+                stack[-1 * instruction.argval] = ListCons(value, tail)
+
+            elif name == 'MAP_ADD':
+                key = stack.pop()
+                value = stack.pop()
+                tail = stack[-1 * instruction.argval]
+                stack[-1 * instruction.argval] = TupleCons(key, value, tail)
+
+            elif name == 'POP_BLOCK':
+                pass
+
+            elif name == 'LOAD_CONST':
+                stack.append(encode(instruction.argval))
+
+            elif (name == 'LOAD_NAME' or
+                  name == 'LOAD_GLOBAL' or
+                  name == 'LOAD_FAST' or
+                  name == 'LOAD_DEREF'):
+                stack.append(Identifier(instruction.argval))
+
+            elif name == 'LOAD_CLOSURE':
+                pass
+
+            elif name == 'LOAD_ATTR':
+                container = stack.pop()
+                stack.append(TupleDestr(container, String(instruction.argval)))
+
+            elif (name == 'STORE_NAME' or
+                  name == 'STORE_FAST'):
+                value = stack.pop()
+                bindings.append((instruction.argval, value))
+
+            elif name == 'STORE_GLOBAL':
+                raise NotImplementedError
+
+            elif (name == 'DELETE_NAME' or
+                  name == 'DELETE_FAST'):
+                bindings.append((instruction.argval, Null()))
+
+            elif name == 'DELETE_GLOBAL':
+                raise NotImplementedError
+
+            elif name == 'CALL_FUNCTION':
+                count = instruction.argval
+                inner = stack[-(count + 1)]
+
+                for i in range(count):
+                    inner = Application(inner, stack.pop())
+
+                stack.pop()
+                stack.append(inner)
+
+            elif (name == 'BUILD_TUPLE' or
+                  name == 'BUILD_LIST' or
+                  name == 'BUILD_SET'):
+                pos = (-1) * instruction.argval
+                values = stack[pos:]
+                stack = stack[:pos]
+
+                container = ListNil()
+                for value in values:
+                    container = ListCons(value, container)
+
+                stack.append(container)
+
+            elif name == 'BUILD_MAP':
+                pos = (-1) * instruction.argval
+                values = stack[pos:]
+                stack = stack[:pos]
+
+                container = TupleNil()
+                for key, value in zip(values[0::2], values[1::2]):
+                    container = TupleCons(key, value, container)
+
+                stack.append(container)
+
+            elif name == 'BUILD_STRING':
+                pos = (-1) * instruction.argval
+                values = stack[pos:]
+                stack = stack[:pos]
+
+                string = ''.join(map(lambda x: x.value, values))
+                stack.append(String(string))
+
+            elif name == 'MAKE_FUNCTION':
+                if instruction.argval > 0:
+                    raise errors.NotYetImplementedError
+
+                stack.pop()
+
+            elif name == 'MAKE_CLOSURE':
+                if instruction.argval > 0:
+                    raise errors.NotYetImplementedError
+
+                stack.pop()
+                stack.pop(-2)
+
+            elif name == 'SETUP_LOOP':
+                pass
+
+            elif name == 'GET_ITER':
+                pass
+
+            # Other opcodes
+            else:
+                raise NotImplementedError(name)
+
+        start = time.perf_counter()
+        self.stack = decompile.EMPTY_STACK
+
+        for element in stack:
+            self.stack = self.stack.push(element)
+
+        BaselineLinearBlock.converting += time.perf_counter() - start
+        self.bindings = bindings
+
+
+def prepare_decompiler(instructions, block_class):
+    """
+    Build the control flow graph of the given instructions, whose linear
+    blocks are executed by block_class, up to the execution of the blocks.
+    """
+    decompiler = decompile.Decompiler()
+    decompiler.build_graph(instructions)
+
+    for block in decompiler.blocks:
+        if type(block) is decompile.LinearBlock:
+            block.__class__ = block_class
+
+    decompiler.sort_blocks()
+    decompiler.detach_unreachable()
+    decompiler.build_loops()
+    return decompiler
+
+
+def measure_baseline(function, number):
+    """
+    Measure the average cost per instruction of execute_blocks with the
+    LinearBlock.execute of the baseline, without its stack conversions, and
+    with the current one, in microseconds, or None for the baseline if it
+    can't execute the function.
+    """
+    instructions = bytecode.read_instructions(function.__code__)
+    count = len(instructions)
+
+    current = prepare_decompiler(instructions, decompile.LinearBlock)
+    with_current = min(timeit.repeat(
+        lambda: current.execute_blocks(), number=number, repeat=5))
+
+    baseline = prepare_decompiler(instructions, BaselineLinearBlock)
+
+    try:
+        timings = []
+
+        for _ in range(5):
+            BaselineLinearBlock.converting = 0.0
+            total = timeit.timeit(
+                lambda: baseline.execute_blocks(), number=number)
+            timings.append(total - BaselineLinearBlock.converting)
+
+        with_baseline = min(timings) / number / count * 1e6
+    except Exception:
+        with_baseline = None
+
+    return count, with_baseline, with_current / number / count * 1e6
+
+
+def baseline_simplify(expression):
+    """
+    The simplify of the baseline, which runs passes until the expression
+    doesn't change anymore.
+    """
+    while True:
+        simplified = Simplifier(find_shared(expression)).simplify(expression)
+
+        if simplified is expression:
+            return expression
+
+        expression = simplified
+
+
+def measure_rewriting(function, number):
+    """
+    Measure the average time of decompiling a function without rewriting its
+    expression, with the simplify of the baseline, and with the current one,
+    in milliseconds.
+    """
+    code = function.__code__
+    rewritings = (decompile.simplify, decompile.introduce_joins)
+    timings = []
+
+    try:
+        for (simplify, introduce_joins) in [(lambda e: e, lambda e: e),
+                                            (baseline_simplify,
+                                             rewritings[1]),
+                                            rewritings]:
+            decompile.simplify = simplify
+            decompile.introduce_joins = introduce_joins
+            timings.append(min(timeit.repeat(
+                lambda: decompile.decompile(code), number=number,
+                repeat=5)) / number * 1e3)
+    finally:
+        (decompile.simplify, decompile.introduce_joins) = rewritings
+
+    return timings
+
+
+def find_code_objects(path):
+    """
+    Find all the code objects defined in a file, without executing it.
+    """
+    with open(path, encoding='utf-8') as file:
+        pending = [compile(file.read(), path, 'exec')]
+
+    found = []
+
+    while len(pending) > 0:
+        code = pending.pop()
+        found.append(code)
+        pending.extend(value for value in code.co_consts
+                       if isinstance(value, types.CodeType))
+
+    return found
+
+
+def measure_front_end(codes, number):
+    """
+    Measure the average cost per instruction of reading the instructions of
+    the given code objects, with dis and with our own bytecode reader.
+    """
+    count = sum(len(bytecode.read_instructions(code)) for code in codes)
+
+    with_dis = min(timeit.repeat(
+        lambda: [list(dis.get_instructions(code)) for code in codes],
+        number=number, repeat=5))
+
+    with_reader = min(timeit.repeat(
+        lambda: [bytecode.read_instructions(code) for code in codes],
+        number=number, repeat=5))
+
+    return count, with_dis / number / count * 1e6, \
+        with_reader / number / count * 1e6
+
+
+def measure(function, number):
+    """
+    Measure the average cost per instruction of decompiling a function, and
+    of the symbolic execution of its blocks alone, in microseconds.
+    """
+    code = function.__code__
+    instructions = bytecode.read_instructions(code)
+    count = len(instructions)
+
+    total = min(timeit.repeat(
+        lambda: decompile.decompile(code), number=number, repeat=5))
+
+    decompiler = decompile.Decompiler()
+    decompiler.build_graph(instructions)
+    decompiler.sort_blocks()
+    decompiler.detach_unreachable()
+    decompiler.build_loops()
+
+    execution = min(timeit.repeat(
+        lambda: decompiler.execute_blocks(), number=number, repeat=5))
+
+    return count, total / number / count * 1e6, \
+        execution / number / count * 1e6
+
+
+if __name__ == '__main__':
+    cases = [case_1, case_2, case_3, case_4, case_5, generate_linear(500),
+             generate_nested(4), generate_nested(8), generate_nested(16)]
+
+    for case in cases:
+        count, total, execution = measure(case, 20)
+        print('%-10s %6d instructions %8.3f us/instruction '
+              '(%.3f us in execute_blocks)' %
+              (case.__name__, count, total, execution))
+
+    print()
+
+    for case in cases:
+        count, with_baseline, with_current = measure_baseline(case, 20)
+        baseline = ('%8.3f us' % with_baseline if with_baseline is not None
+                    else '     n/a   ')
+        print('%-10s %6d instructions %s/instruction in execute_blocks with '
+              'the baseline LinearBlock.execute, %.3f us with the current '
+              'one' % (case.__name__, count, baseline, with_current))
+
+    print()
+
+    for case in cases:
+        without, with_baseline, with_current = measure_rewriting(case, 20)
+        print('%-10s %8.3f ms to decompile without rewriting, %.3f ms with '
+              'the baseline simplify, %.3f ms with the current one' %
+              (case.__name__, without, with_baseline, with_current))
+
+    print()
+
+    for path in ['tests.py', 'examples.py']:
+        count, with_dis, with_reader = measure_front_end(
+            find_code_objects(path), 200)
+        print('%-12s %6d instructions %8.3f us/instruction with dis, '
+              '%.3f us with bytecode.read_instructions' %
+              (path, count, with_dis, with_reader))
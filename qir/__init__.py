@@ -1,9 +1,11 @@
 from .values import Null, Number, Double, String, Boolean
-from .operators import Scan, Filter, Project, Sort, Limit, Group, Join
-from .algebra import Div, Minus, Mod, Plus, Star, Power, And, Not, Or, Equal, LowerOrEqual, LowerThan
+from .operators import Scan, Filter, Project, Sort, Limit, Offset, Group, GroupBy, IndexBy, Distinct, Flatten, Join, SemiJoin, AntiJoin, Sum, Count, Min, Max, Any, All
+from .algebra import Div, Minus, Mod, Plus, Star, Power, And, Not, Or, Equal, LowerOrEqual, LowerThan, GreaterOrEqual, GreaterThan, IsNull, In
 from .functions import Identifier, Lambda, Fixed, Application, Conditional
-from .lists import ListNil, ListCons, ListDestr
+from .lists import ListNil, ListCons, ListDestr, Range
 from .tuples import TupleNil, TupleCons, TupleDestr
 from .specials import Builtin, Database
 from .utils import serialize, unserialize, encode, decode, substitute
-from .magic import local, batch
\ No newline at end of file
+from .simplify import simplify
+from .magic import local, batch, query, Query
+from .cache import DecompilationCache, precompile, enable_disk_cache
\ No newline at end of file
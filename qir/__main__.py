@@ -0,0 +1,76 @@
+import sys
+import argparse
+import importlib
+
+from . import cache
+
+
+def precompile(arguments):
+    """
+    Decompile all the functions of the given modules ahead of time, so that
+    their QIR expressions are read from the persistent cache when they are
+    first used in another process.
+
+    Other processes only read the persistent cache when it is enabled, e.g.
+    by setting the QIRCACHE environment variable to 1, or to the directory
+    given with -d if the entries were stored there. Without -d, the entries
+    are stored in the directory that QIRCACHE names, if any.
+    """
+    # Just like `python -m`, we want to be able to import the modules that
+    # are in the current directory.
+    sys.path.insert(0, '')
+
+    directory = arguments.directory
+    configured = cache.environment_disk_cache()
+
+    if directory is None and configured is not None:
+        directory = configured.directory
+
+    disk = cache.DiskCache(directory, writable=True)
+    decompilation_cache = cache.DecompilationCache(disk=disk)
+    failures = 0
+
+    for name in arguments.modules:
+        module = importlib.import_module(name)
+        results = cache.precompile(
+            module, arguments.workers, decompilation_cache)
+
+        for result in results:
+            if result.error is None:
+                print('Compiled %s in %.1f ms' %
+                      (result.name, result.duration * 1000))
+            else:
+                failures += 1
+                print('Failed to compile %s: %s' % (result.name, result.error),
+                      file=sys.stderr)
+
+    return 1 if failures > 0 else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m qir')
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.required = True
+
+    precompile_parser = subparsers.add_parser(
+        'precompile',
+        help='warm the persistent QIR cache for the functions of modules')
+    precompile_parser.add_argument(
+        'modules', nargs='+', metavar='module')
+    precompile_parser.add_argument(
+        '-d', '--directory', default=None,
+        help='store the cache entries in this directory instead of '
+             'next to the source files, in which case QIRCACHE must be set '
+             'to this directory for other processes to read them')
+    precompile_parser.add_argument(
+        '-j', '--workers', type=int, default=None,
+        help='number of worker processes (defaults to the number of '
+             'processors)')
+    precompile_parser.set_defaults(function=precompile)
+
+    arguments = parser.parse_args()
+    return arguments.function(arguments)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
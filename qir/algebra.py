@@ -18,7 +18,8 @@ class UnaryOperator(base.Expression):
         if not isinstance(evaluated, values.Value):
             raise errors.NotLocallyEvaluableError
 
-        return utils.encode(self.__class__.operate(evaluated.value))
+        # Null is a Value, but it has no value attribute.
+        return utils.encode(self.__class__.operate(evaluated.decode()))
 
 
 class Not(UnaryOperator):
@@ -26,6 +27,17 @@ class Not(UnaryOperator):
         return not x
 
 
+class IsNull(UnaryOperator):
+    def evaluate_locally(self, environment={}):
+        # Unlike the other operators, IsNull also applies to lists, tuples
+        # and functions, which are never null.
+        evaluated = self.element.evaluate_locally(environment)
+        return values.Boolean(isinstance(evaluated, values.Null))
+
+    def operate(x):
+        return x is None
+
+
 class BinaryOperator(base.Expression):
     """
     A QIR binary algebraïc operator.
@@ -45,8 +57,8 @@ class BinaryOperator(base.Expression):
             raise errors.NotLocallyEvaluableError
 
         return utils.encode(self.__class__.operate(
-            evaluated_left.value,
-            evaluated_right.value))
+            evaluated_left.decode(),
+            evaluated_right.decode()))
 
 
 class Div(BinaryOperator):
@@ -79,12 +91,44 @@ class Power(BinaryOperator):
         return x ** y
 
 
-class And(BinaryOperator):
+class ShortCircuitOperator(BinaryOperator):
+    """
+    A QIR binary operator which, just like in Python, only evaluates its
+    right operand when its left operand doesn't determine the result, e.g.
+    so that `u.age is not None and u.age >= 18` never compares None.
+
+    This class is abstract, and should not be instantiated directly.
+    """
+    def evaluate_locally(self, environment={}):
+        evaluated_left = self.left.evaluate_locally(environment)
+
+        if not isinstance(evaluated_left, values.Value):
+            raise errors.NotLocallyEvaluableError
+
+        decoded_left = evaluated_left.decode()
+
+        if bool(decoded_left) == self.__class__.stops_on:
+            return utils.encode(decoded_left)
+
+        evaluated_right = self.right.evaluate_locally(environment)
+
+        if not isinstance(evaluated_right, values.Value):
+            raise errors.NotLocallyEvaluableError
+
+        return utils.encode(self.__class__.operate(
+            decoded_left, evaluated_right.decode()))
+
+
+class And(ShortCircuitOperator):
+    stops_on = False
+
     def operate(x, y):
         return x and y
 
 
-class Or(BinaryOperator):
+class Or(ShortCircuitOperator):
+    stops_on = True
+
     def operate(x, y):
         return x or y
 
@@ -112,3 +156,44 @@ class GreaterOrEqual(BinaryOperator):
 class GreaterThan(BinaryOperator):
     def operate(x, y):
         return x > y
+
+
+class In(base.Expression):
+    """
+    A QIR expression representing the membership of a value in a list, e.g.
+    the IN (...) predicate of SQL.
+
+    When evaluated, In(element, list) will output whether one of the elements
+    of the list corresponding to list is equal to element. For convenience,
+    the list can also be a string, in which case In checks whether element is
+    one of its substrings, just like Python does.
+    """
+    fields = (
+        ('element', base.Expression),
+        ('list', base.Expression))
+
+    def evaluate_locally(self, environment={}):
+        from . import lists
+        from . import operators
+
+        element = self.element.evaluate_locally(environment)
+        container = self.list.evaluate_locally(environment)
+
+        if not isinstance(element, values.Value):
+            raise errors.NotLocallyEvaluableError
+
+        decoded = element.decode()
+
+        if isinstance(container, values.String):
+            if not isinstance(decoded, str):
+                raise TypeError
+
+            return values.Boolean(decoded in container.value)
+
+        # Ranges can check the membership without walking their elements.
+        if isinstance(container, lists.Range):
+            return values.Boolean(decoded in container.bounds())
+
+        return values.Boolean(any(
+            candidate.decode() == decoded
+            for candidate in operators.walk(container)))
@@ -0,0 +1,259 @@
+from . import base
+from . import lists
+from . import errors
+from . import values
+from . import specials
+from . import functions
+from . import operators
+
+import builtins
+import warnings
+import collections
+
+
+# The number of elements we assume for lists whose size we can't know
+# statically, e.g. tables for which no cardinality was given.
+DEFAULT_CARDINALITY = 1000
+
+# An access to a data source, which is either a Table (kind table) or the call
+# of a function which wasn't translated into the QIR (kind call), and which
+# could itself query a database. loops is the list of the inputs of the
+# operators which evaluate the access once per element, from the outermost
+# to the innermost one, where None stands for the input of a Python loop.
+Access = collections.namedtuple('Access', ['kind', 'expression', 'loops'])
+
+Report = collections.namedtuple('Report', ['accesses', 'round_trips'])
+
+
+def analyze(expression, cardinalities=None):
+    """
+    Find the accesses to data sources in a QIR expression which are evaluated
+    once per element of a list, i.e. which would cause a query avalanche, and
+    estimate the number of round trips to the database that the evaluation
+    of the expression takes.
+
+    Functions which are applied by operators to every element of their
+    inputs (e.g. the format of a Project) and the bodies of loops are
+    evaluated once per element, so a Table, or a call to a function which
+    wasn't inlined, under such a function can issue one query for every
+    element, unless the QIR server manages to normalize it away.
+
+    cardinalities: An optional mapping from the names of the tables to their
+    numbers of rows, which defaults to DEFAULT_CARDINALITY for the others.
+
+    Returns a Report with the list of the Access which are evaluated once per
+    element, and the estimated number of round trips.
+    """
+    if cardinalities is None:
+        cardinalities = {}
+
+    accesses = []
+
+    # The values bound to variables, which we use to estimate the number of
+    # elements of the inputs which are variables, e.g. the .0 parameter of
+    # the comprehensions that weren't inlined.
+    bindings = {}
+
+    # The result only depends on the enclosing loops and bound names, so we
+    # visit every distinct expression once for each of them, without using
+    # recursion for the same reasons as simplify.transform.
+    pending = [(expression, (), frozenset())]
+    visited = set()
+
+    while len(pending) > 0:
+        (current, loops, bound) = pending.pop()
+        key = (id(current), tuple(id(loop) for loop in loops), bound)
+
+        if key in visited:
+            continue
+
+        visited.add(key)
+
+        if len(loops) > 0:
+            kind = access_kind(current, bound)
+
+            if kind is not None:
+                accesses.append(Access(kind, current, loops))
+
+        if (isinstance(current, functions.Application) and
+            isinstance(current.function, functions.Lambda)):
+            bindings[current.function.parameter.name] = current.argument
+
+        (per_element, inputs) = find_per_element_fields(current)
+
+        if isinstance(current, functions.Lambda):
+            bound = bound | {current.parameter.name}
+
+        for field in current.fields:
+            name = field[0]
+            child = getattr(current, name)
+
+            if not isinstance(child, base.Expression):
+                continue
+
+            if name in per_element:
+                pending.append((child, loops + tuple(inputs), bound))
+            else:
+                pending.append((child, loops, bound))
+
+    round_trips = 1
+
+    for access in accesses:
+        product = 1
+
+        for loop in access.loops:
+            product *= cardinality(loop, cardinalities, bindings)
+
+        round_trips += product
+
+    return Report(accesses, round_trips)
+
+
+def access_kind(expression, bound):
+    """
+    Return the kind of access to a data source of an expression, or None.
+    """
+    if isinstance(expression, specials.Table):
+        return 'table'
+
+    if not isinstance(expression, functions.Application):
+        return None
+
+    function = expression.function
+
+    # Python's own builtins, e.g. len() on a string, don't query anything.
+    if isinstance(function, functions.Identifier):
+        if function.name in bound or hasattr(builtins, function.name):
+            return None
+
+        return 'call'
+
+    if isinstance(function, specials.Bytecode):
+        return 'call'
+
+    return None
+
+
+def find_per_element_fields(expression):
+    """
+    Return the names of the fields of an expression which are evaluated once
+    for every element of some lists, along with the list of those lists.
+    """
+    if isinstance(expression, operators.Project):
+        return (('format',), [expression.input])
+    elif isinstance(expression, operators.Filter):
+        return (('filter',), [expression.input])
+    elif isinstance(expression, (operators.Sort, operators.Group)):
+        return (('rows',), [expression.input])
+    elif isinstance(expression, operators.Grouping):
+        return (('key', 'value'), [expression.input])
+    elif isinstance(expression, (operators.Join, operators.SemiJoin,
+                                 operators.AntiJoin)):
+        return (('filter',), [expression.left, expression.right])
+
+    # The decompiler translates loops into the application of the fixed-point
+    # combinator to a function which is called once per iteration.
+    elif (isinstance(expression, functions.Application) and
+          isinstance(expression.function, functions.Fixed)):
+        return (('argument',), [None])
+
+    return ((), [])
+
+
+def cardinality(expression, cardinalities, bindings={}, seen=frozenset()):
+    """
+    Estimate the number of elements of a list.
+    """
+    def estimate(expression):
+        return cardinality(expression, cardinalities, bindings, seen)
+
+    # The same name can be bound in different places, so we must make sure
+    # not to follow a cycle of bindings.
+    if (isinstance(expression, functions.Identifier) and
+        expression.name in bindings and expression.name not in seen):
+        return cardinality(
+            bindings[expression.name], cardinalities, bindings,
+            seen | {expression.name})
+
+    elif isinstance(expression, lists.Range):
+        bounds = [expression.start, expression.stop, expression.step]
+
+        if all(isinstance(bound, values.Number) for bound in bounds):
+            return len(expression.bounds())
+
+    elif isinstance(expression, (lists.ListNil, lists.ListCons)):
+        count = 0
+
+        while isinstance(expression, lists.ListCons):
+            count += 1
+            expression = expression.tail
+
+        if isinstance(expression, lists.ListNil):
+            return count
+
+    elif isinstance(expression, specials.Table):
+        return cardinalities.get(expression.name, DEFAULT_CARDINALITY)
+
+    elif isinstance(expression, operators.Scan):
+        return estimate(expression.table)
+
+    elif isinstance(expression, (operators.Filter, operators.Project,
+                                 operators.Sort, operators.Offset,
+                                 operators.Distinct)):
+        return estimate(expression.input)
+
+    elif isinstance(expression, (operators.SemiJoin, operators.AntiJoin)):
+        return estimate(expression.left)
+
+    elif isinstance(expression, operators.Join):
+        return estimate(expression.left) * estimate(expression.right)
+
+    elif (isinstance(expression, operators.Limit) and
+          isinstance(expression.limit, values.Number) and
+          expression.limit.value >= 0):
+        return min(expression.limit.value, estimate(expression.input))
+
+    return DEFAULT_CARDINALITY
+
+
+def describe(access):
+    """
+    Describe an Access in a human-readable way.
+    """
+    if access.kind == 'table':
+        target = 'table %s' % access.expression.name
+    elif isinstance(access.expression.function, functions.Identifier):
+        target = 'call to %s' % access.expression.function.name
+    else:
+        target = 'call to a Python function'
+
+    return '%s, evaluated once per element of %d nested list(s)' % (
+        target, len(access.loops))
+
+
+def check(expression, name, mode='warn', cardinalities=None):
+    """
+    Analyze a QIR expression and, if it would cause a query avalanche, either
+    emit a QueryAvalancheWarning (if mode is warn) or raise a
+    QueryAvalancheError (if mode is error).
+
+    name is the name of the function the expression comes from, which is
+    used in the message. Returns the Report of the analysis.
+    """
+    if mode not in ['warn', 'error']:
+        raise ValueError('Expected mode to be warn or error, got %s' % mode)
+
+    report = analyze(expression, cardinalities)
+
+    if len(report.accesses) == 0:
+        return report
+
+    message = '%s may take about %d round trips to the database:\n%s' % (
+        name, report.round_trips,
+        '\n'.join('- ' + describe(access) for access in report.accesses))
+
+    if mode == 'error':
+        raise errors.QueryAvalancheError(message)
+
+    warnings.warn(message, errors.QueryAvalancheWarning)
+    return report
@@ -7,6 +7,36 @@ SERVER_HOST = '127.0.0.1'
 SERVER_PORT = 8080
 
 
+def create_stub():
+    """
+    Open a channel to the remote QIR server and return a stub for it.
+    """
+    address = SERVER_HOST + ':' + str(SERVER_PORT)
+    channel = grpc.insecure_channel(address)
+    return qir_pb2_grpc.EvaluatorStub(channel)
+
+
+def iterate_with_fallback(remote, local):
+    """
+    Yield the rows produced by remote(), or by local() if remote() fails
+    before producing its first row.
+
+    We can't fall back once rows were handed to the consumer, as we would
+    have to produce them again, so later errors are propagated instead.
+    """
+    try:
+        rows = remote()
+        first = next(rows)
+    except StopIteration:
+        return
+    except Exception:
+        yield from local()
+        return
+
+    yield first
+    yield from rows
+
+
 # TODO:
 # - Implement the method chaining syntax.
 # - Make it easier to configure the target server.
@@ -75,10 +105,7 @@ class Expression:
         """
         # TODO: Handle the environment properly. This will suck.
         try:
-            address = SERVER_HOST + ':' + str(SERVER_PORT)
-            channel = grpc.insecure_channel(address)
-            stub = qir_pb2_grpc.EvaluatorStub(channel)
-
+            stub = create_stub()
             return utils.unserialize(stub.Evaluate(utils.serialize(self)))
 
         except errors.NotSerializableError:
@@ -105,6 +132,55 @@ class Expression:
 
         return self.__class__(*evaluated)
 
+    def iterate(self, environment={}):
+        """
+        Lazily evaluate a QIR expression which corresponds to a list, and
+        yield its decoded elements one at a time.
+
+        Just like evaluate, we first try to evaluate the expression on a
+        remote QIR server, and otherwise evaluate it directly in Python.
+        """
+        return iterate_with_fallback(
+            lambda: self.iterate_remotely(environment),
+            lambda: self.iterate_locally(environment))
+
+    def iterate_remotely(self, environment={}):
+        """
+        Lazily evaluate a QIR expression which corresponds to a list on a
+        remote QIR server, and yield its decoded elements one at a time.
+
+        The server streams the elements back as soon as they are produced, and
+        we cancel the call as soon as the consumer stops asking for elements,
+        so that the rest of the list is neither computed nor transferred.
+        """
+        from . import utils
+
+        try:
+            message = utils.serialize(self)
+        except errors.NotSerializableError:
+            raise errors.NotRemotelyEvaluableError
+
+        responses = create_stub().EvaluateStream(message)
+
+        try:
+            for response in responses:
+                yield utils.unserialize(response).decode()
+        finally:
+            responses.cancel()
+
+    def iterate_locally(self, environment={}):
+        """
+        Lazily evaluate a QIR expression which corresponds to a list directly
+        in Python, and yield its decoded elements one at a time.
+
+        Only the elements which are asked for are computed, as long as the
+        operators of the expression can produce their elements lazily.
+        """
+        from . import operators
+
+        for element in operators.stream(self, environment):
+            yield element.decode()
+
     def decode(self):
         print(self)
         raise errors.NotDecodableError()
@@ -0,0 +1,598 @@
+import os
+import sys
+import time
+import types
+import pickle
+import marshal
+import hashlib
+import tempfile
+import threading
+import collections
+import concurrent.futures
+
+DEFAULT_MAXSIZE = 512
+
+# The name of the directories in which persistent cache entries are stored,
+# next to the source files of the decompiled functions.
+CACHE_DIRECTORY = '__qircache__'
+
+# The environment variable which enables the persistent cache of the
+# default_cache: either 1 to store the entries next to the source files, or
+# the path of the directory in which to store all of them.
+CACHE_VARIABLE = 'QIRCACHE'
+
+# The first element of the keys of the entries built by bind_function,
+# which can't be mistaken for the name of a code object.
+BOUND = object()
+
+CacheInfo = collections.namedtuple(
+    'CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+PrecompileResult = collections.namedtuple(
+    'PrecompileResult', ['name', 'duration', 'error'])
+
+
+def constant_key(value):
+    """
+    Compute a hashable key for a constant found in code.co_consts.
+
+    We can't use the constants directly, as 1 == 1.0 == True in Python even
+    though they would be encoded into different QIR values, so we also keep
+    track of the type of every constant.
+
+    The order in which frozensets are walked changes between processes when
+    the hash of strings is randomized, so we sort the keys of their elements
+    to get the same key in every process.
+    """
+    if isinstance(value, types.CodeType):
+        return code_key(value)
+    elif isinstance(value, tuple):
+        return (type(value), tuple(constant_key(item) for item in value))
+    elif isinstance(value, frozenset):
+        return (type(value), tuple(sorted(
+            (constant_key(item) for item in value), key=repr)))
+    else:
+        return (type(value), value)
+
+
+def code_key(code):
+    """
+    Compute a hashable key which identifies the content of a code object.
+
+    The key contains everything that the decompiler reads from the code
+    object, as well as the version of the interpreter, so two code objects
+    with the same key are always decompiled into the same QIR expression.
+    """
+    return (
+        code.co_name,
+        code.co_argcount,
+        code.co_kwonlyargcount,
+        code.co_flags,
+        code.co_code,
+        tuple(constant_key(value) for value in code.co_consts),
+        code.co_names,
+        code.co_varnames,
+        code.co_cellvars,
+        code.co_freevars,
+        sys.version_info[:2])
+
+
+def source_digest():
+    """
+    Compute a digest of the source code of the qir package.
+
+    The QIR expression that we get from decompiling a code object depends on
+    the version of the decompiler, so we must make sure that persistent cache
+    entries written by another version of the package are never used.
+    """
+    digest = hashlib.sha1()
+    directory = os.path.dirname(os.path.abspath(__file__))
+
+    for name in sorted(os.listdir(directory)):
+        if name.endswith('.py'):
+            with open(os.path.join(directory, name), 'rb') as file:
+                digest.update(file.read())
+
+    return digest.hexdigest()
+
+
+class DiskCache():
+    """
+    A persistent cache of decompiled code objects.
+
+    Much like CPython does with __pycache__, we store the serialized QIR
+    expression of every decompiled code object in a __qircache__ directory
+    next to the file it was defined in, so that restarted processes don't
+    have to decompile it again. Entries are named after a hash of the content
+    of the code object and the version of the interpreter.
+
+    The default_cache only uses a DiskCache once it is enabled, either with
+    enable_disk_cache or through the QIRCACHE environment variable.
+
+    directory: If given, all the entries are stored in that directory instead.
+    writable: Whether to write new entries, which defaults to the opposite of
+    sys.dont_write_bytecode, just like CPython.
+    """
+    def __init__(self, directory=None, writable=None):
+        if writable is None:
+            writable = not sys.dont_write_bytecode
+
+        self.directory = directory
+        self.writable = writable
+        self.digest = None
+
+    def path(self, code):
+        """
+        Return the path of the file which stores the entry for code, or None
+        if the code object wasn't defined in a file.
+        """
+        if self.directory is not None:
+            directory = self.directory
+        elif os.path.isfile(code.co_filename):
+            directory = os.path.join(
+                os.path.dirname(os.path.abspath(code.co_filename)),
+                CACHE_DIRECTORY)
+        else:
+            return None
+
+        if self.digest is None:
+            self.digest = source_digest()
+
+        content = repr((code_key(code), self.digest)).encode('utf-8')
+        name = hashlib.sha1(content).hexdigest()
+        tag = sys.implementation.cache_tag
+
+        return os.path.join(directory, '%s.%s.qir' % (name, tag))
+
+    def get(self, code):
+        """
+        Return the stored expression for the code object, or None.
+        """
+        import qir_pb2
+        from google.protobuf.message import DecodeError
+        from . import errors
+        from . import utils
+
+        path = self.path(code)
+
+        if path is None:
+            return None
+
+        try:
+            with open(path, 'rb') as file:
+                message = qir_pb2.Expression.FromString(file.read())
+
+            return utils.unserialize(message)
+
+        # A missing or corrupted entry is simply a cache miss.
+        except (OSError, DecodeError, errors.NotUnserializableError):
+            return None
+
+    def put(self, code, expression):
+        """
+        Store the expression for the code object, if it can be serialized.
+
+        Just like CPython, we silently give up if we aren't allowed to write
+        in the cache directory.
+        """
+        from . import errors
+        from . import utils
+
+        path = self.path(code)
+
+        if path is None or not self.writable:
+            return
+
+        try:
+            content = utils.serialize(expression).SerializeToString()
+        except (errors.NotSerializableError, TypeError, ValueError):
+            return
+
+        try:
+            directory = os.path.dirname(path)
+            os.makedirs(directory, exist_ok=True)
+
+            # We write to a temporary file first so that concurrent processes
+            # never read a partially written entry.
+            descriptor, temporary = tempfile.mkstemp(dir=directory)
+            with os.fdopen(descriptor, 'wb') as file:
+                file.write(content)
+
+            os.replace(temporary, path)
+
+        except OSError:
+            pass
+
+    def invalidate(self, code):
+        """
+        Remove the stored entry for the code object, if any.
+        """
+        path = self.path(code)
+
+        if path is not None:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+class DecompilationCache():
+    """
+    A bounded, thread-safe cache of decompiled code objects.
+
+    Decompiling a code object into a QIR expression is expensive, so we keep
+    the results of the most recently used code objects around and evict the
+    least recently used ones once the cache is full.
+
+    disk: An optional DiskCache to look into before decompiling a code object
+    which is not in memory, and to which new results are written.
+
+    Code objects which the decompiler can't translate are remembered as well,
+    along with the error they raised (a NotImplementedError or a
+    PredecessorStacksError), so that calling them again raises it right away
+    instead of going through the decompiler. Other errors, e.g. a
+    RecursionError or a MemoryError, might not happen on the next attempt,
+    so they are never remembered.
+    """
+    def __init__(self, maxsize=DEFAULT_MAXSIZE, disk=None):
+        self.maxsize = maxsize
+        self.disk = disk
+        self.hits = 0
+        self.misses = 0
+
+        self.entries = collections.OrderedDict()
+        self.failures = collections.OrderedDict()
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, code):
+        """
+        Return the cached expression for the code object, or None.
+        """
+        return self.lookup(code_key(code))
+
+    def put(self, code, expression):
+        """
+        Store the expression for the code object, evicting the least recently
+        used entry if the cache is full.
+        """
+        self.store(code_key(code), expression)
+
+    def lookup(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.entries.move_to_end(key)
+
+            return entry
+
+    def store(self, key, entry):
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def decompile(self, code):
+        """
+        Return the QIR expression for the code object, decompiling it only if
+        it is not already in the cache.
+        """
+        key = code_key(code)
+        expression = self.lookup(key)
+
+        if expression is not None:
+            return expression
+
+        with self.lock:
+            failure = self.failures.get(key)
+
+        # We drop the traceback of the previous raise, which would otherwise
+        # grow every time the error is raised again.
+        if failure is not None:
+            raise failure.with_traceback(None)
+
+        if self.disk is not None:
+            expression = self.disk.get(code)
+
+        if expression is None:
+            # We don't hold the lock while decompiling, as the decompiler
+            # might call us recursively for nested code objects (e.g. the
+            # code of a comprehension), and because we don't want a slow
+            # decompilation to block the other threads.
+            from . import decompile
+
+            try:
+                expression = decompile.decompile(code)
+            except decompile.UNSUPPORTED_ERRORS as error:
+                self.store_failure(key, error)
+                raise
+
+            if self.disk is not None:
+                self.disk.put(code, expression)
+
+        self.store(key, expression)
+        return expression
+
+    def store_failure(self, key, error):
+        """
+        Remember that the code object with the given key can't be decompiled.
+        """
+        with self.lock:
+            self.failures[key] = error.with_traceback(None)
+            self.failures.move_to_end(key)
+
+            while len(self.failures) > self.maxsize:
+                self.failures.popitem(last=False)
+
+    def decompile_function(self, function, inline=False, resolve=False):
+        """
+        Return the QIR expression for a function.
+
+        inline: Whether to inline the user-defined functions that it calls.
+        resolve: Whether to resolve its global and free variables into
+        constants.
+
+        See bind_function for details.
+        """
+        if inline or resolve:
+            return self.bind_function(function, inline, resolve)[0]
+        else:
+            return self.decompile(function.__code__)
+
+    def bind_function(self, function, inline=False, resolve=False):
+        """
+        Return the QIR expression for a function in which calls to other
+        user-defined functions are inlined and global and free variables are
+        resolved into constants, along with the list of the dependencies
+        (inlining.Dependency and resolution.Capture) it was built from.
+
+        The entry is computed again whenever one of the inlined functions is
+        redefined, one of the resolved variables is bound to another value,
+        or when it is invalidated.
+        """
+        from . import inlining
+        from . import resolution
+
+        # The same code object could refer to different functions in two
+        # different modules, so the key also depends on the namespace.
+        code = function.__code__
+        key = (BOUND, code_key(code), id(function.__globals__), inline,
+               resolve)
+
+        # The free variables of closures are specific to every function
+        # object, so we don't share their entries.
+        shared = not resolve or function.__closure__ is None
+
+        if shared:
+            entry = self.lookup(key)
+
+            if entry is not None and inlining.is_up_to_date(entry[1]):
+                return entry
+
+        if inline:
+            entry = inlining.inline_calls(function, self, resolve)
+        else:
+            entry = resolution.resolve_names(function, self.decompile(code))
+
+        if shared:
+            self.store(key, entry)
+
+        return entry
+
+    def invalidate(self, target=None):
+        """
+        Remove a function or code object from the cache, both in memory and
+        on disk, along with the entries of the functions in which it was
+        inlined.
+
+        If no target is given, the whole in-memory cache is cleared.
+        """
+        from . import inlining
+
+        if isinstance(target, types.FunctionType):
+            target = target.__code__
+
+        with self.lock:
+            if target is None:
+                self.entries.clear()
+                self.failures.clear()
+            else:
+                key = code_key(target)
+                self.entries.pop(key, None)
+                self.failures.pop(key, None)
+
+                for (entry_key, entry) in list(self.entries.items()):
+                    if (entry_key[0] is BOUND and
+                        (entry_key[1] == key or
+                         any(code_key(dependency.code) == key
+                             for dependency in entry[1]
+                             if isinstance(dependency,
+                                           inlining.Dependency)))):
+                        del self.entries[entry_key]
+
+        if target is not None and self.disk is not None:
+            self.disk.invalidate(target)
+
+    def info(self):
+        with self.lock:
+            return CacheInfo(
+                self.hits, self.misses, self.maxsize, len(self.entries))
+
+
+def environment_disk_cache():
+    """
+    Return the DiskCache enabled by the QIRCACHE environment variable, or
+    None if it isn't set.
+    """
+    value = os.environ.get(CACHE_VARIABLE, '')
+
+    if value in ('', '0'):
+        return None
+    elif value == '1':
+        return DiskCache()
+    else:
+        return DiskCache(value)
+
+
+def enable_disk_cache(directory=None, writable=None):
+    """
+    Make the default_cache read and write its entries in a persistent
+    DiskCache, see DiskCache for the meaning of the arguments.
+
+    The persistent cache is disabled by default, as it writes files next to
+    the source files of the user, unless it is enabled either by calling this
+    function or by setting the QIRCACHE environment variable.
+    """
+    default_cache.disk = DiskCache(directory, writable)
+
+
+default_cache = DecompilationCache(disk=environment_disk_cache())
+
+
+def find_functions(module):
+    """
+    Find all the functions which are defined in a module, including the ones
+    which are wrapped in a Query by the @query decorator.
+    """
+    from .magic import Query
+
+    found = []
+
+    for value in vars(module).values():
+        if isinstance(value, Query):
+            value = value.function
+
+        if (isinstance(value, types.FunctionType) and
+            value.__module__ == module.__name__):
+            found.append(value)
+
+    return found
+
+
+def decompile_marshaled(content):
+    """
+    Decompile a marshaled code object and return the serialized QIR
+    expression, the time it took and the exception that was raised, if any.
+
+    This runs in the worker processes of precompile, which is why both the
+    code object and the expression are exchanged as bytes: code objects can't
+    be pickled, and QIR expressions are much more compact as Protocol Buffer
+    messages.
+    """
+    from . import decompile
+    from . import errors
+    from . import utils
+
+    start = time.perf_counter()
+
+    try:
+        expression = decompile.decompile(marshal.loads(content))
+
+    # The error is sent back to the parent process, which remembers it in
+    # the failures of its cache if it is unsupported, so it has to be
+    # pickled.
+    except Exception as error:
+        try:
+            pickle.dumps(error)
+        except Exception:
+            error = RuntimeError(repr(error))
+
+        return None, time.perf_counter() - start, error.with_traceback(None)
+
+    try:
+        serialized = utils.serialize(expression).SerializeToString()
+        return serialized, time.perf_counter() - start, None
+
+    except (errors.NotSerializableError, TypeError, ValueError):
+        # The expression will be decompiled again by the parent process.
+        return None, time.perf_counter() - start, None
+
+
+def precompile(target, workers=None, cache=None):
+    """
+    Decompile many functions ahead of time, in parallel, and store their QIR
+    expressions in a decompilation cache.
+
+    target: Either a module, in which case all the functions defined in that
+    module are decompiled, or an iterable of functions.
+    workers: The number of worker processes to use, which defaults to the
+    number of processors. With a single worker, everything is decompiled in
+    the current process.
+    cache: The DecompilationCache to populate, which defaults to the cache
+    used by encode().
+
+    Returns a list of PrecompileResult with the qualified name of every
+    function, the time it took to decompile it, and the representation of
+    the error that occurred, if any.
+    """
+    import qir_pb2
+    from . import decompile
+    from . import utils
+
+    if cache is None:
+        cache = default_cache
+
+    if isinstance(target, types.ModuleType):
+        functions = find_functions(target)
+    else:
+        functions = list(target)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    names = [function.__module__ + '.' + function.__qualname__
+             for function in functions]
+    results = []
+
+    def decompile_locally(function, name):
+        start = time.perf_counter()
+
+        try:
+            cache.decompile(function.__code__)
+            return PrecompileResult(name, time.perf_counter() - start, None)
+        except Exception as error:
+            return PrecompileResult(
+                name, time.perf_counter() - start, repr(error))
+
+    if workers <= 1 or len(functions) <= 1:
+        for function, name in zip(functions, names):
+            results.append(decompile_locally(function, name))
+
+        return results
+
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        outcomes = executor.map(
+            decompile_marshaled,
+            [marshal.dumps(function.__code__) for function in functions])
+
+        for function, name, outcome in zip(functions, names, outcomes):
+            serialized, duration, error = outcome
+
+            if error is not None:
+                if isinstance(error, decompile.UNSUPPORTED_ERRORS):
+                    cache.store_failure(code_key(function.__code__), error)
+
+                results.append(PrecompileResult(name, duration, repr(error)))
+            elif serialized is None:
+                results.append(decompile_locally(function, name))
+            else:
+                code = function.__code__
+                expression = utils.unserialize(
+                    qir_pb2.Expression.FromString(serialized))
+
+                cache.put(code, expression)
+
+                if cache.disk is not None:
+                    cache.disk.put(code, expression)
+
+                results.append(PrecompileResult(name, duration, None))
+
+    return results
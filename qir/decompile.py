@@ -1,4 +1,9 @@
 from . import *
+from . import bytecode
+from .values import Value
+from .specials import Native
+from .simplify import Simplifier
+from .joins import introduce_joins, JoinIntroducer
 
 import dis
 import types
@@ -27,100 +32,321 @@ BRANCH_OPNAMES = \
     BRANCH_POP_OPNAMES + \
     BRANCH_MAY_POP_OPNAMES
 
+LOAD_OPNAMES = [
+    'LOAD_NAME',
+    'LOAD_FAST',
+    'LOAD_DEREF',
+    'LOAD_CLOSURE']
+
 
 class PredecessorStacksError(Exception):
     pass
 
 
-class Decompiler():
+# The errors which the decompiler raises on the code objects it can't
+# translate, and which it would raise again for the same code object.
+UNSUPPORTED_ERRORS = (NotImplementedError, PredecessorStacksError)
+
+
+class SymbolicStack():
+    """
+    An immutable stack of QIR expressions, used for symbolic execution.
+
+    The stack is a linked list of cells which share their tails, so pushing
+    and popping never copy anything, and blocks can start from the final
+    stack of their predecessors in constant time. Each cell also caches the
+    length and - once it was computed - the hash of the stack it represents,
+    which makes comparing different stacks cheap in the common case.
+    """
+    __slots__ = ('top', 'rest', 'length', 'cached_hash')
+
+    def __init__(self, top=None, rest=None):
+        self.top = top
+        self.rest = rest
+
+        if rest is None:
+            self.length = 0
+            self.cached_hash = 0
+        else:
+            self.length = rest.length + 1
+            self.cached_hash = None
+
+    def __len__(self):
+        return self.length
+
+    def __hash__(self):
+        if self.cached_hash is None:
+            # We compute the missing hashes from the deepest cell upwards, so
+            # that long stacks can't exceed the recursion limit.
+            missing = []
+            current = self
+
+            while current.cached_hash is None:
+                missing.append(current)
+                current = current.rest
+
+            for cell in reversed(missing):
+                cell.cached_hash = hash((cell.top, cell.rest.cached_hash))
+
+        return self.cached_hash
+
+    def __eq__(self, other):
+        if not isinstance(other, SymbolicStack):
+            return NotImplemented
+
+        first, second = self, other
+
+        if first is second:
+            return True
+
+        if first.length != second.length or hash(first) != hash(second):
+            return False
+
+        # We can stop as soon as both stacks share the same tail.
+        while first is not second:
+            if not (first.top is second.top or first.top == second.top):
+                return False
+
+            first, second = first.rest, second.rest
+
+        return True
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __iter__(self):
+        """
+        Iterate over the elements of the stack, from the bottom to the top.
+        """
+        return iter(self.to_list())
+
+    def __repr__(self):
+        return repr(self.to_list())
+
+    def to_list(self):
+        elements = []
+        current = self
+
+        while current.rest is not None:
+            elements.append(current.top)
+            current = current.rest
+
+        elements.reverse()
+        return elements
+
+    def push(self, value):
+        return SymbolicStack(value, self)
+
+    def peek(self, depth):
+        """
+        Return the element at the given depth, where 1 is the top.
+        """
+        current = self
+
+        for i in range(depth - 1):
+            current = current.rest
+
+        return current.top
+
+    def pop_many(self, count):
+        """
+        Pop the count topmost elements of the stack, and return them from the
+        deepest to the topmost one, along with the remaining stack.
+        """
+        values = []
+        current = self
+
+        for i in range(count):
+            values.append(current.top)
+            current = current.rest
+
+        values.reverse()
+        return values, current
+
+    def replace(self, depth, value):
+        """
+        Return a copy of the stack where the element at the given depth, where
+        1 is the top, was replaced with value. Only the cells above that
+        element are copied.
+        """
+        values, rest = self.pop_many(depth)
+        rest = rest.push(value)
+
+        for other in values[1:]:
+            rest = rest.push(other)
+
+        return rest
+
+
+EMPTY_STACK = SymbolicStack()
+
+
+class Region():
+    """
+    An acyclic part of the control flow graph, starting at first_block.
+
+    This is either the whole function once all of its loops were collapsed
+    into LoopBlocks, or the body of a single loop once its back edges were
+    redirected to a placeholder.
+    """
+    def __init__(self, first_block=None):
+        self.first_block = first_block
+
+        # The blocks of the region, in topological ordering.
+        self.ordering = []
+
+    def sort_blocks(self):
+        """
+        Compute a topological ordering of the control flow graph.
+
+        This is possible as we have removed cycles from the graph by hiding
+        them into LoopBlocks, and so the graph is a DAG. On a graph which
+        still has cycles, this computes a reverse postorder instead.
+
+        We use an explicit stack instead of recursion so that very large
+        functions can't exceed the recursion limit. Every entry of the stack
+        holds a block and an iterator over the successors that remain to be
+        visited, so each edge is only considered once.
+        """
+        marked = {self.first_block}
+        ordering = []
+
+        stack = [(self.first_block, iter(self.first_block.successors))]
+
+        while len(stack) > 0:
+            block, successors = stack[-1]
+
+            for (next, _) in successors:
+                if next not in marked:
+                    marked.add(next)
+                    stack.append((next, iter(next.successors)))
+                    break
+            else:
+                stack.pop()
+                ordering.append(block)
+
+        self.ordering = list(reversed(ordering))
+
+    def execute_blocks(self, starting_stack=EMPTY_STACK, starting_env={}):
+        """
+        Partially execute each block in topological ordering.
+        """
+        for block in self.ordering:
+            block.execute(starting_stack, starting_env)
+
+    def express_blocks(self):
+        """
+        Turn each block into a QIR expression in reversed topological ordering.
+        """
+        for block in reversed(self.ordering):
+            block.express()
+
+
+class Decompiler(Region):
     def __init__(self):
+        super().__init__()
+
         self.blocks = []
 
         # In order to be able to compute the graph in linear time, we keep a
         # mapping of the block in which any instruction is contained.
         self.block_mapping = {}
 
+        # A mapping from the offset of the first instruction of every while
+        # loop to the offset of the instruction that follows the loop, as
+        # given by their SETUP_LOOP instruction.
+        self.loop_ends = {}
+
+        # The LoopBlocks of the function, from the innermost to the outermost.
+        self.loops = []
+
         # Whether to use comprehension mode, which is designed to handle the
         # decompilation of list, set and map comprehensions. In this mode, a
-        # FOR_ITER instruction will be turned into a ComprehensionLoopBlock
-        # instead of a ForLoopBlock.
+        # loop over a FOR_ITER instruction will be turned into a
+        # ComprehensionLoopBlock instead of a ForLoopBlock.
         self.comprehension_mode = False
 
-    @property
-    def first_block(self):
-        return self.blocks[0]
+        # Whether to use generator mode, which is used for the decompilation
+        # of generator expressions. As if they were list comprehensions, the
+        # values that they yield are appended to a list which lies at the
+        # bottom of the stack, and which they return.
+        self.generator_mode = False
 
-    @property
-    def previous_block(self):
-        return self.blocks[-2]
+        # The names of the local, cell and free variables of the function,
+        # which shadow the builtins that we translate into QIR nodes.
+        self.local_names = frozenset()
 
     @property
     def current_block(self):
         return self.blocks[-1]
 
-    def build_graph(self, instructions, ignore_loop=False):
+    def append_block(self, block):
         """
-        Separate the instructions into blocks and build a control flow graph.
+        Add a new block to the graph, right after the current one.
+        """
+        # We add an edge between the previous block and this one.
+        if len(self.blocks) > 0:
+            self.current_block.next = block
+        else:
+            self.first_block = block
 
-        instructions: The list of instructions to process.
-        ignore_loop: Whether to ignore a SETUP_LOOP or a FOR_ITER instruction
-        if it is the first instruction of the list. This is useful to avoid
-        infinite recursion when using a separate Decompiler instance to
-        process the inside of a LoopBlock.
+        self.blocks.append(block)
+
+    def build_graph(self, instructions):
         """
+        Separate the instructions into blocks and build a control flow graph.
 
-        # The offset before which all instructions should be added to the
-        # current block as is, no matter their type.
-        ignore_until = False
+        This is done in a single pass over the instructions of the whole
+        function, loops included: they are only identified afterwards, by
+        build_loops, from the shape of the graph.
+
+        instructions: The list of instructions to process, as returned by
+        bytecode.read_instructions.
+        """
 
         # Whether to start a new block on the next instruction, even if it
         # is not a jump target.
         force_new = True
 
-        for i, instruction in enumerate(instructions):
-            if instruction.offset < ignore_until:
-                self.current_block.add(instruction)
+        # The offsets of the instructions following the loops that contain
+        # the current instruction, from the outermost to the innermost. This
+        # is used to find where BREAK_LOOP instructions jump to.
+        setup_ends = []
 
-            elif (instruction.opname == 'FOR_ITER' and
-                  (not ignore_loop or i > 0)):
-                if self.comprehension_mode:
-                    block_type = ComprehensionLoopBlock
-                else:
-                    block_type = ForLoopBlock
+        for i, instruction in enumerate(instructions):
+            while (len(setup_ends) > 0 and
+                   instruction.offset >= setup_ends[-1]):
+                setup_ends.pop()
 
-                self.blocks.append(block_type(self, instruction))
-                ignore_until = instruction.argval
-                force_new = True
+            if instruction.opname == 'SETUP_LOOP':
+                setup_ends.append(instruction.argval)
+                self.loop_ends[instructions[i + 1].offset] = \
+                    instruction.argval
 
-            # We must determine whether the SETUP_LOOP instruction introduces
-            # a for or a while loop in O(1), so what we can do is check
-            # whether the next instruction is a jump target, in which case
-            # either that instruction is FOR_ITER, and the loop is a for loop,
-            # or the loop is a while loop.
-            elif (instruction.opname == 'SETUP_LOOP' and
-                  instructions[i + 1].opname != 'FOR_ITER' and
-                  instructions[i + 1].is_jump_target and
-                  (not ignore_loop or i > 0)):
-                self.blocks.append(WhileLoopBlock(self, instruction))
-                ignore_until = instruction.argval
+            if instruction.opname in JUMP_OPNAMES:
+                self.append_block(JumpBlock(self, instruction))
                 force_new = True
 
-            elif instruction.opname in JUMP_OPNAMES:
-                self.blocks.append(JumpBlock(self, instruction))
+            # Breaks are translated into BREAK_LOOP instructions instead of
+            # the standard JUMP_ABSOLUTE, so we must find their target.
+            elif instruction.opname == 'BREAK_LOOP':
+                self.append_block(
+                    JumpBlock(self, instruction, setup_ends[-1]))
                 force_new = True
 
             elif instruction.opname in BRANCH_OPNAMES:
-                self.blocks.append(BranchBlock(self, instruction))
+                self.append_block(BranchBlock(self, instruction))
                 force_new = True
 
             elif instruction.opname == 'FOR_ITER':
-                self.blocks.append(ForIterBlock(self, instruction))
+                self.append_block(ForIterBlock(self, instruction))
                 force_new = True
 
             else:
                 if instruction.is_jump_target or force_new:
                     force_new = False
-                    self.blocks.append(LinearBlock(self))
+                    self.append_block(LinearBlock(self))
 
                 self.current_block.add(instruction)
 
@@ -136,53 +362,181 @@ class Decompiler():
         # every block so that execute_blocks can run in linear time.
         for block in self.blocks:
             for (successor, edge_type) in block.successors:
-                successor.predecessors.append((block, edge_type))
+                successor.predecessors.add((block, edge_type))
 
-    def sort_blocks(self):
+    def detach_unreachable(self):
         """
-        Compute a topological ordering of the control flow graph.
+        Detaches all the blocks which are not reachable from the first block.
+        As the ordering that was computed earlier in sort_blocks only explores
+        the first block's connected component, we can easily deduce which
+        blocks should be removed.
+        """
+        reachable = set(self.ordering)
 
-        This is possible as we have removed cycles from the graph by hiding
-        them into LoopBlocks, and so the graph is a DAG.
+        for block in self.blocks:
+            if block not in reachable:
+                block.detach()
+
+    def compute_dominators(self):
         """
-        marked = [False] * len(self.blocks)
-        ordering = []
+        Compute the immediate dominator of every reachable block.
 
-        def visit(block):
-            marked[block.index] = True
+        This uses the iterative algorithm by Cooper, Harvey and Kennedy, which
+        only needs a couple of passes over the blocks in reverse postorder on
+        the reducible graphs that CPython generates. It must be called after
+        sort_blocks, while the graph still contains its loops.
+        """
+        numbers = {block: i for (i, block) in enumerate(self.ordering)}
+        dominators = {self.first_block: self.first_block}
 
-            for (next, _) in block.successors:
-                if not marked[next.index]:
-                    visit(next)
+        def intersect(first, second):
+            while first is not second:
+                while numbers[first] > numbers[second]:
+                    first = dominators[first]
+                while numbers[second] > numbers[first]:
+                    second = dominators[second]
 
-            ordering.append(block.index)
+            return first
 
-        visit(self.first_block)
-        self.ordering = list(reversed(ordering))
+        changed = True
 
-    def detach_unreachable(self):
+        while changed:
+            changed = False
+
+            for block in self.ordering[1:]:
+                dominator = None
+
+                for (predecessor, _) in block.predecessors:
+                    if predecessor not in dominators:
+                        continue
+                    elif dominator is None:
+                        dominator = predecessor
+                    else:
+                        dominator = intersect(predecessor, dominator)
+
+                if dominators.get(block) is not dominator:
+                    dominators[block] = dominator
+                    changed = True
+
+        self.numbers, self.dominators = numbers, dominators
+
+    def dominates(self, dominator, block):
         """
-        Detaches all the blocks which are not reachable from the first block.
-        As the topological ordering that was computed earlier in sort_blocks
-        only explores the first block's connected component, we can easily
-        deduce which blocks should be removed.
+        Whether every path from the first block to block goes through
+        dominator, using the immediate dominators from compute_dominators.
         """
-        for i in set(range(len(self.blocks))) - set(self.ordering):
-            self.blocks[i].detach()
+        while self.numbers[block] > self.numbers[dominator]:
+            block = self.dominators[block]
 
-    def execute_blocks(self, starting_stack=[], starting_env={}):
+        return block is dominator
+
+    def build_loops(self):
         """
-        Partially execute each block in topological ordering.
+        Identify the loops of the graph, and collapse each of them into a
+        LoopBlock, from the innermost to the outermost.
+
+        A loop is identified by its header, which is the target of at least
+        one back edge, i.e. an edge from a block that the header dominates.
+        Because we process the loops in reverse postorder of their headers,
+        the inner loops are always collapsed before the loops that contain
+        them, so the LoopBlocks form a loop nesting tree and every block is
+        only visited by the innermost loop that contains it.
         """
-        for index in self.ordering:
-            self.blocks[index].execute(starting_stack, starting_env)
+        self.compute_dominators()
 
-    def express_blocks(self):
+        headers = []
+
+        for block in self.ordering:
+            if any(self.dominates(block, predecessor)
+                   for (predecessor, _) in block.predecessors):
+                headers.append(block)
+
+        for header in reversed(headers):
+            self.loops.append(self.collapse_loop(header))
+
+        # The first block can't be the header of a loop, as CPython always
+        # emits at least a SETUP_LOOP or a GET_ITER instruction before it,
+        # so we only have to sort the blocks which remain at the top level.
+        self.sort_blocks()
+
+    def collapse_loop(self, header):
         """
-        Turn each block into a QIR expression in reversed topological ordering.
+        Replace the loop starting at header with a LoopBlock.
+
+        The body of the loop is made of the blocks which are reachable from
+        the header without jumping back to it or leaving the range of offsets
+        that CPython uses for the loop. Back edges are then redirected to a
+        loop placeholder, and edges leaving the body to an after placeholder.
         """
-        for index in reversed(self.ordering):
-            self.blocks[index].express()
+        if isinstance(header, ForIterBlock):
+            end = header.instruction.argval
+        elif header.offset in self.loop_ends:
+            end = self.loop_ends[header.offset]
+        else:
+            end = 1 + max(
+                predecessor.offset for (predecessor, _) in header.predecessors
+                if self.dominates(header, predecessor))
+
+        # We first find the blocks of the body.
+        body = {header}
+        stack = [header]
+
+        while len(stack) > 0:
+            block = stack.pop()
+
+            for (next, _) in block.successors:
+                if (next not in body and
+                        header.offset <= next.offset < end):
+                    body.add(next)
+                    stack.append(next)
+
+        if isinstance(header, ForIterBlock) and self.comprehension_mode:
+            block_type = ComprehensionLoopBlock
+        elif isinstance(header, ForIterBlock):
+            block_type = ForLoopBlock
+        else:
+            block_type = WhileLoopBlock
+
+        loop = block_type(self, header, self.block_mapping.get(end))
+        self.blocks.append(loop)
+
+        # We then identify the edges which jump back to the header, and make
+        # them point to a placeholder block instead. This block, once
+        # expressed, will turn into a call to on_loop. The other edges to the
+        # header now lead to the LoopBlock.
+        loop_placeholder = PlaceholderBlock(
+            self, Application(Identifier('on_loop'), Null()))
+
+        for (predecessor, edge_type) in header.predecessors:
+            if predecessor in body:
+                predecessor.redirect(edge_type, loop_placeholder)
+            else:
+                predecessor.redirect(edge_type, loop)
+
+        header.predecessors = set()
+
+        # We also replace all the edges which leave the body with edges to a
+        # placeholder block which will turn into a call to on_after.
+        after_placeholder = PlaceholderBlock(
+            self, Application(Identifier('on_after'), Null()))
+
+        for block in body:
+            for (next, edge_type) in block.successors:
+                if next not in body and not isinstance(next, PlaceholderBlock):
+                    next.predecessors.discard((block, edge_type))
+                    block.redirect(edge_type, after_placeholder)
+
+        # Finally, the LoopBlock flows into the instruction after the loop.
+        if loop.next is not None:
+            loop.next.predecessors.add((loop, NORMAL_FLOW))
+
+        loop.contains_append = any(block.contains_append for block in body)
+        loop.region.sort_blocks()
+
+        loop.loop_placeholder, loop.after_placeholder =\
+            loop_placeholder, after_placeholder
+
+        return loop
 
 
 class Block():
@@ -198,9 +552,9 @@ class Block():
         # The block to which we should jump once we reach the end of this one.
         self.next = None
 
-        # The blocks from which we could come from.
+        # The set of (block, edge_type) pairs from which we could come from.
         # This reverse map will be filled automatically by build_graph.
-        self.predecessors = []
+        self.predecessors = set()
 
         # Whether the block contains a RETURN_VALUE instruction.
         self.contains_return = False
@@ -211,9 +565,12 @@ class Block():
         # The expression that the block returns, if any.
         self.returns = None
 
-        # We add an edge between the previous block and this one.
-        if self.index > 0:
-            self.context.current_block.next = self
+    @property
+    def offset(self):
+        """
+        The offset of the first instruction of the block.
+        """
+        return self.instructions[0].offset
 
     @property
     def successors(self):
@@ -222,6 +579,20 @@ class Block():
         else:
             return []
 
+    def redirect(self, edge_type, target):
+        """
+        Make the edge of the given type that leaves this block lead to target.
+
+        The caller is responsible for removing the edge from the predecessors
+        of the block it previously led to.
+        """
+        if edge_type == NORMAL_FLOW:
+            self.next = target
+        else:
+            self.next_jumped = target
+
+        target.predecessors.add((self, edge_type))
+
     def add(self, instruction):
         if not self.contains_return:
             self.instructions.append(instruction)
@@ -239,6 +610,10 @@ class Block():
         if instruction.opname in ['LIST_APPEND', 'SET_ADD', 'MAP_ADD']:
             self.contains_append = True
 
+        if (instruction.opname == 'YIELD_VALUE' and
+            self.context.generator_mode):
+            self.contains_append = True
+
     def close(self):
         # If the block contains a RETURN_VALUE instruction, we don't want to
         # jump to any other block at the end of this one.
@@ -250,7 +625,7 @@ class Block():
         Detach the block from its neighbours and remove it from the graph.
         """
         for (successor, edge_type) in self.successors:
-            successor.predecessors.remove((self, edge_type))
+            successor.predecessors.discard((self, edge_type))
 
         for (predecessor, edge_type) in self.predecessors:
             if edge_type == NORMAL_FLOW:
@@ -258,11 +633,11 @@ class Block():
             else:
                 predecessor.next_jumped = None
 
-        self.predecessors = []
+        self.predecessors = set()
         self.next = None
         self.next_jumped = None
 
-    def execute(self, starting_stack=[], starting_env={}):
+    def execute(self, starting_stack=EMPTY_STACK, starting_env={}):
         """
         Ensure that all the block's direct predecessors share the same final
         stack state, and if so make it the initial state of the block's stack.
@@ -273,7 +648,11 @@ class Block():
         """
         stacks = []
 
-        for (predecessor, edge_type) in self.predecessors:
+        # We sort the predecessors so that errors are reproducible.
+        predecessors = sorted(
+            self.predecessors, key=lambda predecessor: predecessor[0].index)
+
+        for (predecessor, edge_type) in predecessors:
             # Getting the predecessor's final stack state is slightly tricky
             # when that predecessor is a BranchBlock, as the stack might be
             # popped right before the jump depending on the precise branching
@@ -285,22 +664,19 @@ class Block():
                         edge_type == NORMAL_FLOW) or
                     (name in BRANCH_MAY_POP_OPNAMES and
                         edge_type == JUMP_FLOW)):
-                    stacks.append(predecessor.stack[:])
+                    stacks.append(predecessor.stack)
                 else:
-                    stacks.append(predecessor.stack[:-1])
+                    stacks.append(predecessor.stack.rest)
             else:
-                stacks.append(predecessor.stack[:])
+                stacks.append(predecessor.stack)
 
         if len(stacks) < 1:
-            self.stack = starting_stack[:]
+            self.stack = starting_stack
         elif any(stacks[0] != stack for stack in stacks[1:]):
             # Just a little bit of debugging.
-            for index in self.context.ordering:
-                if index == self.index:
-                    break
-
-                block = self.context.blocks[index]
-                print('[%d] %s' % (index, str(block.stack)))
+            for block in self.context.blocks:
+                if hasattr(block, 'stack'):
+                    print('[%d] %s' % (block.index, str(block.stack)))
 
             raise PredecessorStacksError((self.index, stacks))
         else:
@@ -323,225 +699,580 @@ INPLACE_OPERATIONS = {
     'INPLACE_ADD': Plus,
     'INPLACE_SUBTRACT': Minus}
 
+# The builtin functions which are turned into aggregates when they are called
+# on a list, e.g. the result of a comprehension.
+AGGREGATE_BUILTINS = {
+    'sum': Sum,
+    'len': Count,
+    'min': Min,
+    'max': Max,
+    'any': Any,
+    'all': All}
+
+# The expressions which always evaluate to a list.
+LIST_EXPRESSIONS = (
+    ListNil, ListCons, Range,
+    Scan, Filter, Project, Sort, Limit, Offset, Distinct, Flatten, Join,
+    SemiJoin, AntiJoin)
+
 COMPARE_OPERATIONS = {
     '==': Equal,
+    '!=': lambda left, right: Not(Equal(left, right)),
     '<=': LowerOrEqual,
-    '<': LowerThan}
+    '<': LowerThan,
+    '>=': GreaterOrEqual,
+    '>': GreaterThan}
 
 class LinearBlock(Block):
-    def execute(self, starting_stack=[], starting_env={}):
+    def close(self):
+        super().close()
+
+        # The instructions don't change anymore, so we look their handlers up
+        # once here rather than every time the block is executed.
+        self.handlers = [(OPCODE_HANDLERS.get(instruction.opcode), instruction)
+                         for instruction in self.instructions]
+
+    def execute(self, starting_stack=EMPTY_STACK, starting_env={}):
         super().execute(starting_stack, starting_env)
 
         stack = self.stack
         bindings = []
 
-        for instruction in self.instructions:
-            name = instruction.opname
+        # The expressions whose values are popped and never used, e.g. the
+        # calls of functions made as statements, along with the number of
+        # variable bindings which were made before them.
+        self.discarded = []
 
-            # General instructions
-            if name == 'NOP':
-                pass
+        for (handler, instruction) in self.handlers:
+            if handler is None:
+                raise NotImplementedError(instruction.opname)
 
-            elif name == 'POP_TOP':
-                stack.pop()
+            stack = handler(self, instruction, stack, bindings)
 
-            elif name == 'ROT_TWO':
-                stack[-1], stack[-2] = stack[-2], stack[-1]
-
-            elif name == 'ROT_THREE':
-                stack[-1], stack[-2], stack[-3] =\
-                    stack[-2], stack[-3], stack[-1]
-
-            elif name == 'DUP_TOP':
-                stack.append(stack[-1])
-
-            elif name == 'DUP_TOP_TWO':
-                stack.append(stack[-2])
-                stack.append(stack[-2])
-
-            # Binary and in-place operations
-            elif name in BINARY_OPERATIONS:
-                right = stack.pop()
-                left = stack.pop()
-                stack.append(BINARY_OPERATIONS[name](left, right))
-
-            elif name in INPLACE_OPERATIONS:
-                right = stack.pop()
-                left = stack.pop()
-                stack.append(INPLACE_OPERATIONS[name](left, right))
-
-            elif (name == 'COMPARE_OP' and
-                  instruction.argval in COMPARE_OPERATIONS):
-                right = stack.pop()
-                left = stack.pop()
-                stack.append(
-                    COMPARE_OPERATIONS[instruction.argval](left, right))
-
-            elif name == 'BINARY_SUBSCR':
-                key = stack.pop()
-                container = stack.pop()
-                stack.append(TupleDestr(container, key))
-
-            elif name == 'STORE_SUBSCR':
-                key = stack.pop()
-                container = stack.pop()
-                value = stack.pop()
-                stack.append(TupleCons(key, value, container))
-
-            elif name == 'DELETE_SUBSCR':
-                container = stack.pop()
-                value = stack.pop()
-                stack.append(TupleCons(key, Null(), container))
-
-            # Miscellaneous opcodes
-            elif name in ['RETURN_VALUE', 'YIELD_VALUE']:
-                self.returns = stack.pop()
-
-            elif name in ['LIST_APPEND', 'SET_ADD']:
-                value = stack.pop()
-                tail = stack[-1 * instruction.argval]
-                stack[-1 * instruction.argval] = ListCons(value, tail)
-
-            elif name == 'MAP_ADD':
-                key = stack.pop()
-                value = stack.pop()
-                tail = stack[-1 * instruction.argval]
-                stack[-1 * instruction.argval] = TupleCons(key, value, tail)
-
-            elif name == 'POP_BLOCK':
-                pass
-
-            elif name == 'LOAD_CONST':
-                stack.append(encode(instruction.argval))
-
-            elif (name == 'LOAD_NAME' or
-                  name == 'LOAD_GLOBAL' or
-                  name == 'LOAD_FAST' or
-                  name == 'LOAD_DEREF'):
-                stack.append(Identifier(instruction.argval))
-
-            elif name == 'LOAD_CLOSURE':
-                pass
-
-            elif name == 'LOAD_ATTR':
-                container = stack.pop()
-                stack.append(TupleDestr(container, String(instruction.argval)))
-
-            elif (name == 'STORE_NAME' or
-                  name == 'STORE_FAST'):
-                value = stack.pop()
-                bindings.append((instruction.argval, value))
-
-            elif name == 'STORE_GLOBAL':
-                raise NotImplementedError
-
-            elif (name == 'DELETE_NAME' or
-                  name == 'DELETE_FAST'):
-                bindings.append((instruction.argval, Null()))
-
-            elif name == 'DELETE_GLOBAL':
-                raise NotImplementedError
-
-            elif name == 'CALL_FUNCTION':
-                count = instruction.argval
-                inner = stack[-(count + 1)]
-
-                # Because the QIR functions are currified, we have to make as
-                # many applications as there are arguments. The good news is,
-                # as the right-most argument is on top of the stack, this is
-                # all pretty straightforward.
-                for i in range(count):
-                    inner = Application(inner, stack.pop())
+        self.stack = stack
+        self.bindings = bindings
 
-                stack.pop()
-                stack.append(inner)
+    def express(self):
+        if self.returns is not None:
+            inner = self.returns
+        elif self.next is None:
+            inner = Null()
+        else:
+            inner = self.next.expression
 
-            elif (name == 'BUILD_TUPLE' or
-                  name == 'BUILD_LIST' or
-                  name == 'BUILD_SET'):
-                pos = (-1) * instruction.argval
-                values = stack[pos:]
-                stack = stack[:pos]
+        # Wrap the expression inside all the variable bindings.
+        for (name, value) in reversed(self.bindings):
+            inner = Application(Lambda(Identifier(name), inner), value)
 
-                container = ListNil()
-                for value in values:
-                    container = ListCons(value, container)
+        self.expression = inner
 
-                stack.append(container)
 
-            elif name == 'BUILD_MAP':
-                pos = (-1) * instruction.argval
-                values = stack[pos:]
-                stack = stack[:pos]
+# A mapping from opcode numbers to the functions which symbolically execute
+# the corresponding instructions inside a LinearBlock. Every handler is called
+# with the block, the instruction, the block's SymbolicStack and the list of
+# variable bindings of the block, and returns the new stack.
+OPCODE_HANDLERS = {}
 
-                container = TupleNil()
-                for key, value in zip(values[0::2], values[1::2]):
-                    container = TupleCons(key, value, container)
 
-                stack.append(container)
+def handles(*opnames):
+    """
+    Register the decorated function as the handler of the given opcodes.
 
-            elif name == 'BUILD_STRING':
-                pos = (-1) * instruction.argval
-                values = stack[pos:]
-                stack = stack[:pos]
+    Opcodes which don't exist in the running version of CPython are ignored.
+    """
+    def decorator(handler):
+        for opname in opnames:
+            if opname in dis.opmap:
+                OPCODE_HANDLERS[dis.opmap[opname]] = handler
 
-                string = ''.join(map(lambda x: x.value, values))
-                stack.append(String(string))
+        return handler
 
-            elif name == 'MAKE_FUNCTION':
-                if instruction.argval > 0:
-                    raise errors.NotYetImplementedError
+    return decorator
 
-                stack.pop()
 
-            elif name == 'MAKE_CLOSURE':
-                if instruction.argval > 0:
-                    raise errors.NotYetImplementedError
+# General instructions
+@handles('NOP', 'POP_BLOCK', 'SETUP_LOOP', 'GET_ITER')
+def handle_nop(block, instruction, stack, bindings):
+    return stack
 
-                stack.pop()
-                stack.pop(-2)
 
-            elif name == 'SETUP_LOOP':
-                pass
+@handles('POP_TOP')
+def handle_pop_top(block, instruction, stack, bindings):
+    block.discarded.append((len(bindings), stack.top))
+    return stack.rest
 
-            elif name == 'GET_ITER':
-                pass
 
-            # Other opcodes
-            else:
-                raise NotImplementedError(name)
+@handles('ROT_TWO')
+def handle_rot_two(block, instruction, stack, bindings):
+    (second, first), rest = stack.pop_many(2)
+    return rest.push(first).push(second)
 
-        self.stack = stack
-        self.bindings = bindings
 
-    def express(self):
-        if self.returns is not None:
-            inner = self.returns
-        elif self.next is None:
-            inner = Null()
+@handles('ROT_THREE')
+def handle_rot_three(block, instruction, stack, bindings):
+    (third, second, first), rest = stack.pop_many(3)
+    return rest.push(first).push(third).push(second)
+
+
+@handles('DUP_TOP')
+def handle_dup_top(block, instruction, stack, bindings):
+    return stack.push(stack.top)
+
+
+@handles('DUP_TOP_TWO')
+def handle_dup_top_two(block, instruction, stack, bindings):
+    return stack.push(stack.rest.top).push(stack.top)
+
+
+# Binary and in-place operations
+def make_operation_handler(operation):
+    def handle_operation(block, instruction, stack, bindings):
+        rest = stack.rest
+        return rest.rest.push(operation(rest.top, stack.top))
+
+    return handle_operation
+
+
+for opname, operation in BINARY_OPERATIONS.items():
+    handles(opname)(make_operation_handler(operation))
+
+for opname, operation in INPLACE_OPERATIONS.items():
+    handles(opname)(make_operation_handler(operation))
+
+
+@handles('COMPARE_OP')
+def handle_compare_op(block, instruction, stack, bindings):
+    (left, right), rest = stack.pop_many(2)
+
+    if instruction.argval in ['in', 'not in']:
+        membership = make_membership(left, right, instruction)
+
+        if instruction.argval == 'not in':
+            membership = Not(membership)
+
+        return rest.push(membership)
+
+    # The only identity checks which mean something in the QIR are those
+    # against None, e.g. `x is None`.
+    if instruction.argval in ['is', 'is not']:
+        if isinstance(right, Null):
+            check = IsNull(left)
+        elif isinstance(left, Null):
+            check = IsNull(right)
         else:
-            inner = self.next.expression
+            raise NotImplementedError(instruction.opname)
 
-        # Wrap the expression inside all the variable bindings.
-        for (name, value) in reversed(self.bindings):
-            inner = Application(Lambda(Identifier(name), inner), value)
+        if instruction.argval == 'is not':
+            check = Not(check)
+
+        return rest.push(check)
+
+    operation = COMPARE_OPERATIONS.get(instruction.argval)
+
+    if operation is None:
+        raise NotImplementedError(instruction.opname)
+
+    return rest.push(operation(left, right))
+
+
+def make_membership(left, right, instruction):
+    """
+    Build the QIR expression for `left in right`.
+    """
+    # Checking whether a value belongs to a subquery is the same as checking
+    # whether any element of the subquery is equal to it, which
+    # introduce_joins can then turn into a SemiJoin.
+    if is_list_expression(right) and not is_constant_list(right):
+        identifier = Identifier('cv_' + str(instruction.offset))
+        return Any(Project(
+            Lambda(identifier, Equal(left, identifier)), right))
+
+    # Otherwise, e.g. for constant tuples and sets or for the parameters of
+    # the query, we use an In node, which databases evaluate as IN (...).
+    return In(left, right)
+
+
+def is_constant_list(expression):
+    """
+    Check whether an expression is a list constructor whose elements are
+    all constants, or a Range with constant bounds.
+    """
+    if isinstance(expression, Range):
+        return all(isinstance(bound, Value) for bound in
+                   [expression.start, expression.stop, expression.step])
+
+    while isinstance(expression, ListCons):
+        if not isinstance(expression.head, Value):
+            return False
+
+        expression = expression.tail
+
+    return isinstance(expression, ListNil)
+
+
+@handles('UNARY_NOT')
+def handle_unary_not(block, instruction, stack, bindings):
+    return stack.rest.push(Not(stack.top))
+
+
+@handles('BINARY_SUBSCR')
+def handle_binary_subscr(block, instruction, stack, bindings):
+    (container, key), rest = stack.pop_many(2)
+
+    if isinstance(key, Native) and isinstance(key.value, slice):
+        return rest.push(make_limit(container, key.value))
+
+    return rest.push(TupleDestr(container, key))
 
-        self.expression = inner
+
+@handles('BUILD_SLICE')
+def handle_build_slice(block, instruction, stack, bindings):
+    # There is no QIR expression for slices, so we keep the bounds in a
+    # Native node which BINARY_SUBSCR turns into a Limit or an Offset right
+    # away.
+    values, rest = stack.pop_many(instruction.argval)
+    return rest.push(Native(slice(*values)))
+
+
+def make_limit(container, bounds):
+    """
+    Build the Limit and Offset nodes for container[start:stop].
+
+    The start must be absent or a non-negative number, and the stop must
+    be a number when there is a start, as we otherwise can't compute the
+    length of the slice. Other slices have no equivalent in the QIR, and
+    slicing other values than lists (e.g. strings) must be left to Python.
+    """
+    def is_absent(bound):
+        return bound is None or isinstance(bound, Null)
+
+    (start, stop, step) = (bounds.start, bounds.stop, bounds.step)
+
+    if not is_list_expression(container) or not is_absent(step):
+        raise NotImplementedError('BUILD_SLICE')
+
+    if is_absent(start) or (isinstance(start, Number) and start.value == 0):
+        if is_absent(stop):
+            return container
+
+        return Limit(stop, container)
+
+    if not (isinstance(start, Number) and start.value > 0):
+        raise NotImplementedError('BUILD_SLICE')
+
+    container = Offset(start, container)
+
+    if is_absent(stop):
+        return container
+    elif not isinstance(stop, Number):
+        raise NotImplementedError('BUILD_SLICE')
+
+    # A negative stop counts from the end of the list, just like the
+    # negative limits of Limit, so it doesn't depend on the start.
+    if stop.value < 0:
+        return Limit(stop, container)
+
+    return Limit(Number(max(stop.value - start.value, 0)), container)
+
+
+@handles('STORE_SUBSCR')
+def handle_store_subscr(block, instruction, stack, bindings):
+    (value, container, key), rest = stack.pop_many(3)
+    return rest.push(TupleCons(key, value, container))
+
+
+@handles('DELETE_SUBSCR')
+def handle_delete_subscr(block, instruction, stack, bindings):
+    (container, key), rest = stack.pop_many(2)
+    return rest.push(TupleCons(key, Null(), container))
+
+
+# Miscellaneous opcodes
+@handles('RETURN_VALUE', 'YIELD_VALUE')
+def handle_return_value(block, instruction, stack, bindings):
+    if block.context.generator_mode:
+        return handle_generator_value(block, instruction, stack, bindings)
+
+    block.returns = stack.top
+    return stack.rest
+
+
+def handle_generator_value(block, instruction, stack, bindings):
+    # The list of the yielded values lies at the bottom of the stack.
+    depth = len(stack)
+
+    if instruction.opname == 'RETURN_VALUE':
+        block.returns = stack.peek(depth)
+        return stack.rest
+
+    # YIELD_VALUE replaces the value with the one sent to the generator,
+    # which is always None inside of a generator expression.
+    value, rest = stack.top, stack.rest
+    tail = rest.peek(depth - 1)
+    return rest.replace(depth - 1, ListCons(value, tail)).push(Null())
+
+
+@handles('LIST_APPEND', 'SET_ADD')
+def handle_list_append(block, instruction, stack, bindings):
+    value, rest = stack.top, stack.rest
+    tail = rest.peek(instruction.argval)
+    return rest.replace(instruction.argval, ListCons(value, tail))
+
+
+@handles('MAP_ADD')
+def handle_map_add(block, instruction, stack, bindings):
+    (value, key), rest = stack.pop_many(2)
+    tail = rest.peek(instruction.argval)
+    return rest.replace(instruction.argval, TupleCons(key, value, tail))
+
+
+@handles('LOAD_CONST')
+def handle_load_const(block, instruction, stack, bindings):
+    return stack.push(encode(instruction.argval))
+
+
+@handles('LOAD_NAME', 'LOAD_GLOBAL', 'LOAD_FAST', 'LOAD_DEREF',
+         'LOAD_CLOSURE')
+def handle_load_name(block, instruction, stack, bindings):
+    return stack.push(Identifier(instruction.argval))
+
+
+@handles('LOAD_ATTR')
+def handle_load_attr(block, instruction, stack, bindings):
+    container = stack.top
+    return stack.rest.push(
+        TupleDestr(container, String(instruction.argval)))
+
+
+@handles('STORE_NAME', 'STORE_FAST', 'STORE_DEREF')
+def handle_store_name(block, instruction, stack, bindings):
+    bindings.append((instruction.argval, stack.top))
+    return stack.rest
+
+
+@handles('DELETE_NAME', 'DELETE_FAST')
+def handle_delete_name(block, instruction, stack, bindings):
+    bindings.append((instruction.argval, Null()))
+    return stack
+
+
+@handles('STORE_GLOBAL', 'DELETE_GLOBAL')
+def handle_store_global(block, instruction, stack, bindings):
+    raise NotImplementedError(instruction.opname)
+
+
+@handles('CALL_FUNCTION')
+def handle_call_function(block, instruction, stack, bindings):
+    arguments, rest = stack.pop_many(instruction.argval)
+    inner = rest.top
+
+    is_builtin = (isinstance(inner, Identifier) and
+                  inner.name not in block.context.local_names)
+
+    # Calls to range() are turned into Range nodes, which stay small no
+    # matter how many integers they stand for.
+    if is_builtin and inner.name == 'range' and 1 <= len(arguments) <= 3:
+        return rest.rest.push(make_range(arguments))
+
+    # Likewise, the database can remove the duplicates of a list.
+    if (is_builtin and inner.name in ['set', 'frozenset'] and
+        len(arguments) == 1 and is_list_expression(arguments[0])):
+        return rest.rest.push(Distinct(arguments[0]))
+
+    # Sorting other values, e.g. the characters of a string or the keys of a
+    # dict, must be left to Python.
+    if (is_builtin and inner.name == 'sorted' and len(arguments) == 1 and
+        is_list_expression(arguments[0])):
+        return rest.rest.push(
+            make_sort(arguments[0], None, None, instruction))
+
+    # Aggregating a list can be done by the database, instead of sending us
+    # the whole list. We don't translate calls on other values, as len()
+    # could as well be counting the characters of a string.
+    if (is_builtin and inner.name in AGGREGATE_BUILTINS and
+        len(arguments) == 1 and is_list_expression(arguments[0])):
+        aggregate = AGGREGATE_BUILTINS[inner.name]
+        return rest.rest.push(aggregate(arguments[0]))
+
+    # Because the QIR functions are currified, we have to make as many
+    # applications as there are arguments, starting with the left-most one
+    # to match the order of the Lambdas produced by decompile().
+    for argument in arguments:
+        inner = Application(inner, argument)
+
+    return rest.rest.push(inner)
+
+
+def is_list_expression(expression):
+    """
+    Check whether an expression always evaluates to a list, i.e. whether it
+    is a list constructor, an operator which outputs a list, or the call of
+    a comprehension which builds a list, whose only parameter is always
+    named .0 by CPython.
+
+    Dict comprehensions are translated into an IndexBy, which evaluates to a
+    tuple and not to a list, so their calls don't count. Set comprehensions
+    do, as their Distinct evaluates to the list of the elements of the set.
+    """
+    return (isinstance(expression, LIST_EXPRESSIONS) or
+            (isinstance(expression, Application) and
+             isinstance(expression.function, Lambda) and
+             expression.function.parameter.name == '.0' and
+             isinstance(expression.function.body, LIST_EXPRESSIONS)))
+
+
+def make_range(arguments):
+    """
+    Build the Range node for a call to range() with the given arguments.
+    """
+    if len(arguments) == 1:
+        return Range(Number(0), arguments[0], Number(1))
+    elif len(arguments) == 2:
+        return Range(arguments[0], arguments[1], Number(1))
+    else:
+        return Range(*arguments)
+
+
+@handles('CALL_FUNCTION_KW')
+def handle_call_function_kw(block, instruction, stack, bindings):
+    # The names of the keyword arguments are a constant tuple, which was
+    # encoded into a list of strings.
+    names, rest = stack.top.decode(), stack.rest
+    arguments, rest = rest.pop_many(instruction.argval)
+    inner = rest.top
+
+    positional = arguments[:len(arguments) - len(names)]
+    keywords = dict(zip(names, arguments[len(positional):]))
+
+    # QIR functions only take positional arguments, so we only support the
+    # keyword arguments of the builtins that we translate.
+    if (isinstance(inner, Identifier) and inner.name == 'sorted' and
+        inner.name not in block.context.local_names and
+        len(positional) == 1 and set(keywords) <= {'key', 'reverse'} and
+        is_list_expression(positional[0])):
+        return rest.rest.push(make_sort(
+            positional[0], keywords.get('key'), keywords.get('reverse'),
+            instruction))
+
+    raise NotImplementedError(instruction.opname)
+
+
+def make_sort(input, key, reverse, instruction):
+    """
+    Build the Sort node for sorted(input, key=key, reverse=reverse).
+    """
+    if key is None or isinstance(key, Null):
+        # We use the offset of the instruction to avoid name clashes.
+        identifier = Identifier('cv_' + str(instruction.offset))
+        key = Lambda(identifier, identifier)
+
+    if reverse is None:
+        ascending = Boolean(True)
+    else:
+        ascending = Not(reverse)
+
+    return Sort(ListCons(key, ListNil()), ascending, input)
+
+
+@handles('BUILD_TUPLE', 'BUILD_LIST', 'BUILD_SET')
+def handle_build_list(block, instruction, stack, bindings):
+    values, rest = stack.pop_many(instruction.argval)
+
+    container = ListNil()
+    for value in reversed(values):
+        container = ListCons(value, container)
+
+    # The elements of a set literal could be equal at runtime.
+    if instruction.opname == 'BUILD_SET' and len(values) > 1:
+        container = Distinct(container)
+
+    return rest.push(container)
+
+
+@handles('BUILD_MAP')
+def handle_build_map(block, instruction, stack, bindings):
+    # The keys and values of the argval entries are interleaved.
+    values, rest = stack.pop_many(2 * instruction.argval)
+
+    container = TupleNil()
+    for key, value in zip(values[0::2], values[1::2]):
+        container = TupleCons(key, value, container)
+
+    return rest.push(container)
+
+
+@handles('BUILD_CONST_KEY_MAP')
+def handle_build_const_key_map(block, instruction, stack, bindings):
+    # The keys are a constant tuple, which was encoded into a ListCons.
+    values, rest = stack.pop_many(instruction.argval + 1)
+    keys = values.pop()
+
+    container = TupleNil()
+    for value in values:
+        container = TupleCons(keys.head, value, container)
+        keys = keys.tail
+
+    return rest.push(container)
+
+
+@handles('BUILD_STRING')
+def handle_build_string(block, instruction, stack, bindings):
+    values, rest = stack.pop_many(instruction.argval)
+
+    string = ''.join(map(lambda x: x.value, values))
+    return rest.push(String(string))
+
+
+# The flag of MAKE_FUNCTION which means that a tuple of cells lies below the
+# code object, starting with CPython 3.6.
+MAKE_FUNCTION_CLOSURE = 0x08
+
+
+@handles('MAKE_FUNCTION')
+def handle_make_function(block, instruction, stack, bindings):
+    if instruction.argval & ~MAKE_FUNCTION_CLOSURE:
+        raise errors.NotYetImplementedError
+
+    # The decompiled code reads the free variables by name, so we can drop
+    # the tuple of cells just like MAKE_CLOSURE does.
+    if instruction.argval & MAKE_FUNCTION_CLOSURE:
+        (_, code, _), rest = stack.pop_many(3)
+        return rest.push(code)
+
+    return stack.rest
+
+
+@handles('MAKE_CLOSURE')
+def handle_make_closure(block, instruction, stack, bindings):
+    if instruction.argval > 0:
+        raise errors.NotYetImplementedError
+
+    # We drop the qualified name on top of the stack, and the tuple of cells
+    # which lies below the code object.
+    (_, code, _), rest = stack.pop_many(3)
+    return rest.push(code)
 
 
 class JumpBlock(Block):
-    def __init__(self, context, instruction):
+    def __init__(self, context, instruction, target=None):
         super().__init__(context)
         self.instruction = instruction
         self.add(instruction)
 
+        # The offset of the instruction to jump to, which defaults to the
+        # argument of the instruction.
+        if target is None:
+            target = instruction.argval
+
+        self.target = target
+
     def close(self):
         super().close()
 
         # Because we will always take the jump, we can replace the edge which
         # was created between this block and the one that follows it with a
         # new edge between this block and the one it should jump to.
-        self.next = self.context.block_mapping[self.instruction.argval]
+        self.next = self.context.block_mapping[self.target]
 
     def express(self):
         self.expression = self.next.expression
@@ -568,7 +1299,7 @@ class BaseBranchBlock(Block):
 
 class BranchBlock(BaseBranchBlock):
     def express(self):
-        condition = self.stack[-1]
+        condition = self.stack.top
 
         if self.instruction.opname in \
                 ['POP_JUMP_IF_FALSE', 'JUMP_IF_FALSE_OR_POP']:
@@ -584,127 +1315,51 @@ class BranchBlock(BaseBranchBlock):
 
 
 class ForIterBlock(BaseBranchBlock):
-    def execute(self, starting_stack=[], starting_env={}):
+    def execute(self, starting_stack=EMPTY_STACK, starting_env={}):
         super().execute(starting_stack, starting_env)
 
         # We must push a reference to the current value of the iterator on the
         # stack, so that blocks inside the loop's body can use it. We use the
         # instruction's offset as a way to avoid name clashes in nested loops.
-        self.stack.append(Identifier('cv_' + str(self.instruction.offset)))
+        self.stack = self.stack.push(
+            Identifier('cv_' + str(self.instruction.offset)))
 
     def express(self):
         self.expression = self.next.expression
 
 
 class LoopBlock(Block):
-    def __init__(self, context, instruction):
+    """
+    A block which stands for a whole loop in the control flow graph.
+
+    The body of the loop is kept as a separate Region, in which the edges
+    that jumped back to the header now lead to loop_placeholder, and the
+    edges that left the loop now lead to after_placeholder. Both are set by
+    Decompiler@collapse_loop.
+    """
+    def __init__(self, context, header, follow):
         super().__init__(context)
-        self.instruction = instruction
-        self.add(instruction)
-
-    def execute(self, starting_stack=[], starting_env={}):
-        super().execute(starting_stack, starting_env)
-
-        # We use a separate instance of the decompiler to process the code
-        # inside the loop. We have to add a placeholder for the instruction
-        # following the end of the loop.
-        instructions = self.instructions + \
-            [dis.Instruction('AFTER_LOOP', -1, None, None,
-             None, self.instruction.argval, None, True)]
-
-        # For some reason, breaks are translated into BREAK_LOOP instructions
-        # instead of the standard JUMP_ABSOLUTE, so we must fix that manually.
-        for i in range(len(instructions)):
-            instr = instructions[i]
-
-            if instr.opname == 'BREAK_LOOP':
-                instructions[i] = dis.Instruction(
-                    'JUMP_ABSOLUTE', 113, self.instruction.argval,
-                    self.instruction.argval, None, instr.offset,
-                    instr.starts_line, instr.is_jump_target)
-
-        decompiler = Decompiler()
-        decompiler.comprehension_mode = self.context.comprehension_mode
-        decompiler.build_graph(instructions, True)
-
-        start_block = decompiler.first_block
-        last_block = decompiler.current_block
-
-        decompiler.sort_blocks()
-        decompiler.detach_unreachable()
-
-        # display_graph(decompiler)
-
-        # We then identify the edges which jump back to the start_block, and
-        # make them point to a placeholder block instead. This block, once
-        # expressed, will turn into a call to on_loop.
-        loop_placeholder = PlaceholderBlock(
-            decompiler, Application(Identifier('on_loop'), Null()))
-
-        decompiler.blocks.append(loop_placeholder)
-
-        previous_predecessors = start_block.predecessors
-        start_block.predecessors = []
-
-        for (predecessor, edge_type) in previous_predecessors:
-            if predecessor.index < start_block.index:
-                start_block.predecessors.append((predecessor, edge_type))
-            elif edge_type == JUMP_FLOW:
-                predecessor.next_jumped = loop_placeholder
-                loop_placeholder.predecessors.append(
-                    (predecessor, JUMP_FLOW))
-            else:
-                predecessor.next = loop_placeholder
-                loop_placeholder.predecessors.append(
-                    (predecessor, NORMAL_FLOW))
-
-        # We also replace all the references to the last block, which only
-        # contains the AFTER_LOOP instruction that we added earlier, with a
-        # placeholder block which will turn into a call to on_after.
-        after_placeholder = PlaceholderBlock(
-            decompiler, Application(Identifier('on_after'), Null()))
-
-        after_placeholder.index = last_block.index
-        decompiler.blocks[last_block.index] = after_placeholder
-
-        for (predecessor, edge_type) in last_block.predecessors:
-            if edge_type == JUMP_FLOW:
-                predecessor.next_jumped = after_placeholder
-                after_placeholder.predecessors.append(
-                    (predecessor, JUMP_FLOW))
-            else:
-                predecessor.next = after_placeholder
-                after_placeholder.predecessors.append(
-                    (predecessor, NORMAL_FLOW))
-
-        # This is not pretty, but we must remove the edge that is created
-        # between a block and the one which follows it.
-        loop_placeholder.next = None
-        after_placeholder.next = None
+        self.header = header
+        self.next = follow
+        self.region = Region(header)
 
-        # display_graph(decompiler)
+        if isinstance(header, ForIterBlock):
+            self.instruction = header.instruction
 
-        self.loop_placeholder, self.after_placeholder, self.decompiler =\
-            loop_placeholder, after_placeholder, decompiler
+    @property
+    def offset(self):
+        return self.header.offset
 
 
 class WhileLoopBlock(LoopBlock):
-    def __init__(self, context, instruction):
-        super().__init__(context, instruction)
-
-        # We don't want SETUP_LOOP to appear in the instructions, as the first
-        # block of the loop's body should be the jump target.
-        if instruction.opname == 'SETUP_LOOP':
-            del self.instructions[0]
-
-    def execute(self, starting_stack=[], starting_env={}):
+    def execute(self, starting_stack=EMPTY_STACK, starting_env={}):
         super().execute(starting_stack, starting_env)
-        self.decompiler.execute_blocks(self.stack[:])
+        self.region.execute_blocks(self.stack)
 
     def express(self):
-        self.decompiler.express_blocks()
+        self.region.express_blocks()
 
-        on_loop = self.decompiler.first_block.expression
+        on_loop = self.region.first_block.expression
         on_after = self.next.expression
 
         # Using the Y fixed-point combinator, we return a recursive function
@@ -724,20 +1379,277 @@ class WhileLoopBlock(LoopBlock):
 
 
 class ForLoopBlock(LoopBlock):
-    def execute(self, starting_stack=[], starting_env={}):
+    def execute(self, starting_stack=EMPTY_STACK, starting_env={}):
         super().execute(starting_stack, starting_env)
-        self.decompiler.execute_blocks(self.stack[:])
+        self.region.execute_blocks(self.stack)
 
         # We have to remove the iterator from the stack to reproduce what
         # FOR_ITER does once it jumps out of the loop, but we must also store
         # it somewhere in order to get it back in express().
-        self.iterator = self.stack.pop()
+        self.iterator = self.stack.top
+        self.stack = self.stack.rest
+
+        self.accumulation = self.find_accumulation()
+
+    def find_accumulation(self):
+        """
+        Recognize a loop whose only effect is to accumulate values into a
+        variable, and return the binding (name, value) of that variable once
+        the loop is over, or None.
+
+        There are three kinds of such loops:
+        - `for x in xs: if p(x): out.append(f(x))`, where out is an empty
+          list before the loop, after which out is bound to
+          Project(f, Filter(p, xs));
+        - `for x in xs: if p(x): total += f(x)`, where total is a number
+          before the loop, after which total is bound to
+          total + Sum(Project(f, Filter(p, xs)));
+        - `for x in xs: if p(x): groups[k(x)].append(f(x))`, where groups
+          is an empty defaultdict(list) before the loop, or the same loop
+          with `groups.setdefault(k(x), []).append(f(x))` where groups is an
+          empty dict, after which groups is bound to
+          GroupBy(k, f, Filter(p, xs)).
+
+        Unlike the Y combinator, these operators can be evaluated by the
+        database. We must however make sure that the loop doesn't do anything
+        else that the rest of the function could observe, so we give up on
+        loops which contain other statements, break or return statements or
+        nested loops, and on loops which bind variables that are read outside
+        of the loop or that keep their value from an iteration to the next.
+        """
+        identifier = 'cv_' + str(self.instruction.offset)
+        blocks = [block for block in self.region.ordering
+                  if not isinstance(block, PlaceholderBlock)]
+
+        if any(not isinstance(block, (ForIterBlock, LinearBlock,
+                                      BranchBlock, JumpBlock)) or
+               block.contains_return for block in blocks):
+            return None
+
+        # Breaking out of the loop would skip some of the elements.
+        if any(predecessor is not self.header
+               for (predecessor, _) in self.after_placeholder.predecessors):
+            return None
+
+        # We look for the only statement which accumulates a value.
+        candidates = []
+        bound_names = set()
+
+        for block in blocks:
+            if not isinstance(block, LinearBlock):
+                continue
+
+            for (position, expression) in block.discarded:
+                append = find_append(expression)
+
+                if append is None:
+                    return None
+
+                candidates.append((block, position) + append)
+
+            for (position, (name, value)) in enumerate(block.bindings):
+                bound_names.add(name)
+
+                if (isinstance(value, Plus) and
+                    isinstance(value.left, Identifier) and
+                    value.left.name == name):
+                    candidates.append(
+                        (block, position, 'sum', name, [value.right]))
+
+        if len(candidates) != 1:
+            return None
+
+        (accumulator, position, kind, name, values) = candidates[0]
+
+        if kind != 'sum' and name in bound_names:
+            return None
+
+        # The accumulation must happen on a single path through the body,
+        # which we find by counting the paths that lead to every block.
+        counts = {}
+
+        for block in self.region.ordering:
+            if block is self.region.first_block:
+                counts[block] = 1
+            else:
+                counts[block] = min(2, sum(
+                    counts.get(predecessor, 0)
+                    for (predecessor, _) in block.predecessors))
+
+        if counts.get(accumulator) != 1:
+            return None
+
+        path = [accumulator]
+
+        while path[-1] is not self.region.first_block:
+            path.append(next(
+                predecessor for (predecessor, _) in path[-1].predecessors
+                if counts.get(predecessor, 0) > 0))
+
+        path.reverse()
+
+        # Just like in ComprehensionLoopBlock, we substitute the variables
+        # bound along the path with their values, and we build the
+        # conjunction of the conditions under which the path is taken.
+        environment = {}
+        conditions = []
+
+        for (i, block) in enumerate(path):
+            if isinstance(block, LinearBlock):
+                bindings = block.bindings
+
+                if block is accumulator:
+                    bindings = bindings[:position]
+
+                for (key, binding) in bindings:
+                    environment[key] = substitute(binding, environment)
+
+            elif isinstance(block, BranchBlock):
+                condition = substitute(block.stack.top, environment)
+                is_normal_flow = (path[i + 1] is block.next)
+
+                if ((is_normal_flow and block.instruction.opname in
+                     ['POP_JUMP_IF_TRUE', 'JUMP_IF_TRUE_OR_POP']) or
+                    (not is_normal_flow and block.instruction.opname in
+                     ['POP_JUMP_IF_FALSE', 'JUMP_IF_FALSE_OR_POP'])):
+                        condition = Not(condition)
+
+                conditions.append(condition)
+
+        values = [substitute(value, environment) for value in values]
+
+        # The bindings which are not on the path are simply dropped, so they
+        # must not call anything.
+        simplifier = Simplifier()
+
+        for block in blocks:
+            if isinstance(block, LinearBlock) and block not in path:
+                if any(simplifier.summarize(binding).impure
+                       for (_, binding) in block.bindings):
+                    return None
+
+        # Once substituted, the value and the conditions must only depend on
+        # the current element and on variables bound before the loop.
+        forbidden = bound_names | {name}
+
+        for expression in values + [self.iterator] + conditions:
+            if any(variable in forbidden for variable in
+                   simplifier.summarize(expression).variables):
+                return None
+
+        # As the variables bound inside of the loop won't be bound anymore
+        # (except for the accumulator), they must not be read anywhere else.
+        # Because loops are encoded using functions which don't capture their
+        # environment, we can't rely on the free variables of the rest of the
+        # expression, so we look at the instructions of the other blocks.
+        region = set(self.region.ordering)
+
+        for block in self.context.blocks:
+            if block in region:
+                continue
+
+            for instruction in block.instructions:
+                if (instruction.opname in LOAD_OPNAMES and
+                    instruction.argval in bound_names and
+                    instruction.argval != name):
+                    return None
+
+        # Finally, we need the value of the accumulator before the loop,
+        # which must be bound right before it.
+        predecessors = list(self.predecessors)
+
+        if (len(predecessors) != 1 or
+            not isinstance(predecessors[0][0], LinearBlock)):
+            return None
+
+        initial = None
+        initial_position = None
+        bindings = predecessors[0][0].bindings
+
+        for (position, (key, binding)) in enumerate(bindings):
+            if key == name:
+                initial = binding
+                initial_position = position
+
+        if not self.is_initial(kind, initial):
+            return None
+
+        source = self.iterator
+
+        if len(conditions) > 0:
+            condition = reduce(lambda a, b: And(a, b), conditions)
+            source = Filter(Lambda(Identifier(identifier), condition), source)
+
+        if kind in ('group', 'setdefault'):
+            (key, value) = values
+
+            # The call to defaultdict() can't be evaluated by the database,
+            # but the empty defaultdict is then just an empty tuple.
+            bindings[initial_position] = (name, TupleNil())
+            return (name, GroupBy(
+                Lambda(Identifier(identifier), key),
+                Lambda(Identifier(identifier), value),
+                source))
+
+        (value,) = values
+
+        if not (isinstance(value, Identifier) and value.name == identifier):
+            source = Project(Lambda(Identifier(identifier), value), source)
+
+        if kind == 'append':
+            return (name, source)
+        else:
+            return (name, Plus(Identifier(name), Sum(source)))
+
+    def is_initial(self, kind, initial):
+        """
+        Check whether initial is a valid value of an accumulator of the given
+        kind (see find_append) before the loop.
+        """
+        if kind == 'append':
+            return isinstance(initial, ListNil)
+        elif kind == 'sum':
+            return isinstance(initial, (Number, Double))
+        elif kind == 'setdefault':
+            return isinstance(initial, TupleNil)
+
+        # The accumulator must be built by defaultdict(list), or by
+        # collections.defaultdict(list).
+        if not (isinstance(initial, Application) and
+                isinstance(initial.argument, Identifier) and
+                initial.argument.name == 'list' and
+                'list' not in self.context.local_names):
+            return False
+
+        function = initial.function
+
+        if isinstance(function, TupleDestr):
+            return (isinstance(function.input, Identifier) and
+                    function.input.name == 'collections' and
+                    isinstance(function.key, String) and
+                    function.key.value == 'defaultdict')
+
+        return (isinstance(function, Identifier) and
+                function.name == 'defaultdict')
 
     def express(self):
-        self.decompiler.express_blocks()
+        # If the loop only accumulates values into a variable, we just have
+        # to bind that variable to the result of the operators.
+        if self.accumulation is not None:
+            (name, value) = self.accumulation
+
+            if self.next is None:
+                inner = Null()
+            else:
+                inner = self.next.expression
+
+            self.expression = Application(Lambda(Identifier(name), inner), value)
+            return
+
+        self.region.express_blocks()
 
         identifier = 'cv_' + str(self.instruction.offset)
-        on_loop = self.decompiler.first_block.expression
+        on_loop = self.region.first_block.expression
         on_after = self.next.expression
 
         # We have to use the Y fixed-point combinator together with calls to
@@ -777,8 +1689,48 @@ class ForLoopBlock(LoopBlock):
                 on_after))
 
 
+def find_append(expression):
+    """
+    Recognize a statement which appends a value to a list, and return
+    (kind, name, values) where name is the variable which holds the list, or
+    None. There are three kinds of such statements:
+    - `out.append(v)`, where kind is append and values is [v];
+    - `groups[k].append(v)`, where kind is group and values is [k, v];
+    - `groups.setdefault(k, []).append(v)`, where kind is setdefault and
+      values is [k, v].
+    """
+    if not (isinstance(expression, Application) and
+            isinstance(expression.function, TupleDestr) and
+            isinstance(expression.function.key, String) and
+            expression.function.key.value == 'append'):
+        return None
+
+    target = expression.function.input
+    value = expression.argument
+
+    if isinstance(target, Identifier):
+        return ('append', target.name, [value])
+
+    if (isinstance(target, TupleDestr) and
+        isinstance(target.input, Identifier)):
+        return ('group', target.input.name, [target.key, value])
+
+    # groups.setdefault(k, []) is decoded as ((groups.setdefault k) []).
+    if (isinstance(target, Application) and
+        isinstance(target.argument, ListNil) and
+        isinstance(target.function, Application) and
+        isinstance(target.function.function, TupleDestr) and
+        isinstance(target.function.function.input, Identifier) and
+        isinstance(target.function.function.key, String) and
+        target.function.function.key.value == 'setdefault'):
+        return ('setdefault', target.function.function.input.name,
+                [target.function.argument, value])
+
+    return None
+
+
 class ComprehensionLoopBlock(LoopBlock):
-    def execute(self, starting_stack=[], starting_env={}):
+    def execute(self, starting_stack=EMPTY_STACK, starting_env={}):
         super().execute(starting_stack, starting_env)
 
         identifier = 'cv_' + str(self.instruction.offset)
@@ -786,27 +1738,60 @@ class ComprehensionLoopBlock(LoopBlock):
         # Even though the graph might contain multiple paths leading to the
         # loop_placeholder block, only one of them contains the LIST_APPEND
         # (or SET_ADD or MAP_ADD) instruction.
-        def find_append_path(start, already_found):
+        def find_append_path(end):
             """
-            Find the path in the graph which contains the LIST_APPEND, SET_ADD
-            or MAP_ADD instruction.
-
-            start: The block from which to start the path.
-            already_found: Whether the instruction was already found earlier.
+            Find the path in the graph from the first block to end which
+            contains the LIST_APPEND, SET_ADD or MAP_ADD instruction.
+
+            Instead of enumerating all the paths, which could take exponential
+            time, we first annotate every block in topological ordering with
+            whether it can be reached from the first block with or without
+            going through an append, and then walk back from end using those
+            annotations to choose the predecessors.
             """
-            if start.index == 0:
-                return [start] if already_found else None
+            reachable = {}
 
-            if start.contains_append:
-                already_found = True
+            def annotate(block):
+                if block is self.region.first_block:
+                    return {False}
 
-            for (predecessor, edge_type) in start.predecessors:
-                path = find_append_path(predecessor, already_found)
+                states = set()
+                for (predecessor, _) in block.predecessors:
+                    states |= reachable.get(predecessor, set())
 
-                if path is not None:
-                    return path + [start]
+                if block.contains_append and len(states) > 0:
+                    return {True}
 
-            return None
+                return states
+
+            for block in self.region.ordering:
+                reachable[block] = annotate(block)
+
+            if True not in annotate(end):
+                return None
+
+            # When walking back, we either need a predecessor that was reached
+            # through an append, or any reachable one once we've found it.
+            path = [end]
+            needed = True
+
+            while path[-1] is not self.region.first_block:
+                block = path[-1]
+
+                if block.contains_append:
+                    needed = None
+
+                candidates = sorted(
+                    (predecessor for (predecessor, _) in block.predecessors),
+                    key=lambda predecessor: predecessor.index)
+
+                path.append(next(
+                    predecessor for predecessor in candidates
+                    if (needed in reachable.get(predecessor, set()) or
+                        (needed is None and
+                         len(reachable.get(predecessor, set())) > 0))))
+
+            return list(reversed(path))
 
         # We keep an environment with the current bindings of all variables so
         # that we can try to substitute identifiers with their values in the
@@ -817,18 +1802,18 @@ class ComprehensionLoopBlock(LoopBlock):
         # to True in order for the path to be taken.
         append_when = []
 
-        path = find_append_path(self.loop_placeholder, False)
+        path = find_append_path(self.loop_placeholder)
 
         for i in range(len(path)):
             block = path[i]
-            block.execute(self.stack[:], environment)
+            block.execute(self.stack, environment)
 
             if isinstance(block, LinearBlock):
                 for (key, value) in block.bindings:
                     environment[key] = value
 
             elif isinstance(block, BranchBlock):
-                condition = substitute(block.stack[-1], environment)
+                condition = substitute(block.stack.top, environment)
                 is_normal_flow = (path[i + 1].index == block.next.index)
 
                 if ((is_normal_flow and block.instruction.opname in
@@ -842,7 +1827,8 @@ class ComprehensionLoopBlock(LoopBlock):
         # We have to remove the iterator from the stack to reproduce what
         # FOR_ITER does once it jumps out of the loop, but we must also store
         # it somewhere in order to use it later.
-        iterator = self.stack.pop()
+        iterator = self.stack.top
+        self.stack = self.stack.rest
 
         # If the conjunction is not empty, we must filter the iterator to keep
         # only the elements for which the path will be taken.
@@ -854,18 +1840,51 @@ class ComprehensionLoopBlock(LoopBlock):
         # The stack of the last block in the path (excluding loop_placeholder)
         # should now contain a ListCons(head, tail), where head is what gets
         # appened to the list in the comprehension's body; or, in the case of
-        # nested loops, a Project() expression.
-        source_list = next(item for item in path[-2].stack
-                           if isinstance(item, (ListCons, Project)))
-
-        if isinstance(source_list, ListCons):
-            source_expression = substitute(source_list.head, environment)
-        else:
-            source_expression = source_list
+        # nested loops, the Project() or Flatten() expression of the inner
+        # loop. The inner loop of a nested dict comprehension leaves nothing
+        # of the sort, as it adds its items to the dictionary itself.
+        source_list = next(
+            (item for item in path[-2].stack
+             if isinstance(item, (ListCons, Project, Flatten, TupleCons))),
+            None)
+
+        if source_list is None:
+            raise NotImplementedError('Nested loops in a dict comprehension')
+
+        # In a dict comprehension, the stack rather contains a TupleCons(key,
+        # value, tail), which we replace with an IndexBy() in which the value
+        # of every key is the last one, just like in Python.
+        if isinstance(source_list, TupleCons):
+            self.stack = self.stack.rest.push(IndexBy(
+                Lambda(Identifier(identifier),
+                       substitute(source_list.key, environment)),
+                Lambda(Identifier(identifier),
+                       substitute(source_list.value, environment)),
+                iterator))
+            return
+
+        # The inner loop adds its elements to the same list for every element
+        # of the outer loop, so we must concatenate its lists rather than
+        # building a list of them, which we do with a Join when we can.
+        # The input of the inner loop can also read the variables bound by
+        # the outer loop, e.g. in `for a in xs for b in a`, in which case we
+        # concatenate the inner lists with a Flatten instead.
+        if isinstance(source_list, (Project, Flatten)):
+            nested = substitute(source_list, environment)
+            flattened = JoinIntroducer().flatten(identifier, nested, iterator)
+
+            if flattened is None:
+                flattened = Flatten(Project(
+                    Lambda(Identifier(identifier), nested), iterator))
+
+            self.stack = self.stack.rest.push(flattened)
+            return
+
+        source_expression = substitute(source_list.head, environment)
 
         # The trick, now, is just to replace that list with a Project().
-        self.stack[-1] = Project(
-            Lambda(Identifier(identifier), source_expression), iterator)
+        self.stack = self.stack.rest.push(Project(
+            Lambda(Identifier(identifier), source_expression), iterator))
 
     def express(self):
         # We don't want to turn our loop comprehensions into expressions, but
@@ -881,8 +1900,9 @@ class PlaceholderBlock(Block):
     def __init__(self, context, expression):
         super().__init__(context)
         self.expression = expression
+        context.blocks.append(self)
 
-    def execute(self, starting_stack=[], starting_env={}):
+    def execute(self, starting_stack=EMPTY_STACK, starting_env={}):
         # We don't want to call super().execute() because that might raise a
         # PredecessorStacksError, as we use the same PlaceholderBlock in
         # different branches of While and For loops for instance.
@@ -892,19 +1912,97 @@ class PlaceholderBlock(Block):
         pass
 
 
+# The opcodes which the decompiler handles when building the control flow
+# graph, and which therefore don't need a handler.
+CONTROL_FLOW_OPNAMES = frozenset(
+    JUMP_OPNAMES + BRANCH_OPNAMES + ['BREAK_LOOP', 'FOR_ITER'])
+
+# The opcodes whose handlers always raise NotImplementedError.
+UNSUPPORTED_OPNAMES = frozenset(['STORE_GLOBAL', 'DELETE_GLOBAL'])
+
+
+def find_unsupported(code):
+    """
+    Return the name of the first instruction of a code object, or of the code
+    objects nested in it, which the decompiler can't translate, or None.
+
+    This only needs a single pass over the raw bytecode, so we can reject
+    most untranslatable functions before building their control flow graph,
+    instead of failing halfway through the symbolic execution of their
+    blocks. A None result doesn't guarantee that decompilation will succeed,
+    as some instructions are only supported with some operands, e.g.
+    identity checks against None.
+    """
+    pending = [code]
+
+    while len(pending) > 0:
+        current = pending.pop()
+
+        for (opcode, arg, _, _) in bytecode.read_raw(current):
+            opname = dis.opname[opcode]
+
+            if opname in CONTROL_FLOW_OPNAMES:
+                continue
+
+            if (opcode not in OPCODE_HANDLERS or
+                opname in UNSUPPORTED_OPNAMES):
+                return opname
+
+            if opname == 'COMPARE_OP':
+                operation = dis.cmp_op[arg]
+
+                if (operation not in COMPARE_OPERATIONS and
+                    operation not in ['in', 'not in', 'is', 'is not']):
+                    return opname
+
+            elif opname == 'MAKE_FUNCTION':
+                if arg & ~MAKE_FUNCTION_CLOSURE:
+                    return opname
+
+            elif opname == 'MAKE_CLOSURE':
+                if arg > 0:
+                    return opname
+
+        pending.extend(constant for constant in current.co_consts
+                       if isinstance(constant, types.CodeType))
+
+    return None
+
+
 def decompile(code):
+    # Failing early is much cheaper than failing during the execution of the
+    # blocks, and raises the same error.
+    unsupported = find_unsupported(code)
+
+    if unsupported is not None:
+        raise NotImplementedError(unsupported)
+
     decompiler = Decompiler()
     decompiler.comprehension_mode =\
         code.co_name in ['<listcomp>', '<setcomp>', '<dictcomp>', '<genexpr>']
+    decompiler.generator_mode = code.co_name == '<genexpr>'
+    decompiler.local_names = frozenset(
+        code.co_varnames + code.co_cellvars + code.co_freevars)
 
-    decompiler.build_graph(list(dis.get_instructions(code)))
+    decompiler.build_graph(bytecode.read_instructions(code))
     decompiler.sort_blocks()
     decompiler.detach_unreachable()
-    decompiler.execute_blocks()
+    decompiler.build_loops()
+
+    if decompiler.generator_mode:
+        decompiler.execute_blocks(EMPTY_STACK.push(ListNil()))
+    else:
+        decompiler.execute_blocks()
+
     decompiler.express_blocks()
 
     inner = decompiler.first_block.expression
 
+    # Set comprehensions add their elements to a set, which we translate
+    # like a list comprehension whose duplicates are then removed.
+    if code.co_name == '<setcomp>':
+        inner = Distinct(inner)
+
     # Wrap the inner expression around a Lambda function with the right
     # argument names. This works because, apparently, the names of the
     # arguments always come before the names of the local variables in
@@ -912,12 +2010,12 @@ def decompile(code):
     for name in reversed(code.co_varnames[:code.co_argcount]):
         inner = Lambda(Identifier(name), inner)
 
-    return inner
+    return introduce_joins(simplify(inner))
 
 
 def preview(code):
     decompiler = Decompiler()
-    decompiler.build_graph(list(dis.get_instructions(code)))
+    decompiler.build_graph(bytecode.read_instructions(code))
 
     dis.dis(code)
     display_graph(decompiler)
@@ -50,3 +50,18 @@ class NotEncodableError:
     This happens mostly with complex values such as (anonymous) functions,
     generators or modules.
     """
+
+
+class QueryAvalancheError(Exception):
+    """
+    An exception indicating that a QIR expression would access a data source
+    once for every element of a list, and thus issue a query per element
+    instead of a single one - which is known as a query avalanche.
+    """
+
+
+class QueryAvalancheWarning(UserWarning):
+    """
+    A warning indicating that a QIR expression would cause a query avalanche,
+    see QueryAvalancheError.
+    """
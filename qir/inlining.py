@@ -0,0 +1,217 @@
+from . import cache as caching
+from .joins import introduce_joins
+from .simplify import Simplifier, replace, simplify
+
+import types
+import inspect
+import builtins
+import collections
+
+
+class Dependency(collections.namedtuple(
+        'Dependency', ['namespace', 'name', 'code'])):
+    """
+    A dependency of an inlined QIR expression on the binding of a global
+    name: the expression stays valid as long as namespace[name] is a function
+    whose code is still code.
+    """
+    def is_up_to_date(self):
+        callee = find_callee(self.namespace, self.name)
+
+        if callee is None:
+            return False
+
+        # Comparing the code objects themselves is enough most of the time,
+        # but reloading a module creates new code objects with the same
+        # content, so we fall back to comparing their keys.
+        return (callee.__code__ is self.code or
+                caching.code_key(callee.__code__) ==
+                caching.code_key(self.code))
+
+
+def find_callee(namespace, name):
+    """
+    Return the user-defined function bound to name in namespace, or None.
+
+    Builtin functions are left alone, as they have no bytecode to decompile.
+    """
+    value = namespace.get(name)
+
+    if isinstance(value, types.FunctionType):
+        return value
+    else:
+        return None
+
+
+def call_arities(expression, name):
+    """
+    Return the set of the numbers of arguments that the free occurrences of
+    the variable name are applied to in an expression, where an occurrence
+    which isn't called at all counts as a call without arguments.
+    """
+    from . import base
+    from .functions import Application, Identifier, Lambda
+
+    arities = set()
+    pending = [expression]
+    visited = set()
+
+    while len(pending) > 0:
+        current = pending.pop()
+
+        if id(current) in visited or not isinstance(current, base.Expression):
+            continue
+
+        visited.add(id(current))
+
+        if isinstance(current, Lambda) and current.parameter.name == name:
+            continue
+
+        if isinstance(current, Identifier):
+            if current.name == name:
+                arities.add(0)
+            continue
+
+        # Calls are currified, so we walk down to the function which is
+        # being called to count its arguments.
+        (head, arguments) = (current, [])
+
+        while isinstance(head, Application):
+            arguments.append(head.argument)
+            head = head.function
+
+        if isinstance(head, Identifier) and head.name == name:
+            arities.add(len(arguments))
+            pending.extend(arguments)
+        else:
+            pending.extend(getattr(current, field[0])
+                           for field in current.fields)
+
+    return arities
+
+
+def can_inline(callee, arities):
+    """
+    Check whether a function can be inlined into calls with the given numbers
+    of arguments.
+
+    The QIR expression of a function only has one Lambda per positional
+    parameter, so we only inline functions without default values, keyword-
+    only parameters, *args or **kwargs, into calls which pass all of their
+    parameters: any other call would turn into a partial application.
+    """
+    code = callee.__code__
+
+    return (callee.__defaults__ is None and
+            code.co_kwonlyargcount == 0 and
+            not code.co_flags & (inspect.CO_VARARGS |
+                                 inspect.CO_VARKEYWORDS) and
+            arities == {code.co_argcount})
+
+
+def is_up_to_date(dependencies):
+    """
+    Check whether none of the functions that were inlined into an expression
+    were redefined since, and whether none of the names that were resolved
+    were bound to other values since.
+    """
+    return all(dependency.is_up_to_date() for dependency in dependencies)
+
+
+def is_shared(name, function, callee):
+    """
+    Check whether a free variable of the QIR expression of callee refers to
+    the same value when it is read in the namespace of function, i.e. whether
+    it is a builtin which neither of the modules of the functions shadows.
+    """
+    return (hasattr(builtins, name) and
+            name not in function.__globals__ and
+            name not in callee.__globals__)
+
+
+def inline_calls(function, cache, resolve=False, active=frozenset()):
+    """
+    Decompile a function and inline the functions that it calls.
+
+    Every free variable of the QIR expression of function which is bound to a
+    user-defined function in function.__globals__ gets replaced with the QIR
+    expression of that function, in which calls are inlined as well. This
+    turns calls to helper functions into plain variable bindings, which the
+    simplifier and the QIR server can then normalize into a single query.
+
+    cache: The DecompilationCache through which functions are decompiled.
+    resolve: Whether to resolve the other global and free variables of every
+    function into constants, see resolution.resolve_names.
+    active: The code objects of the functions that are being inlined, which
+    we must not inline again to avoid looping on recursive functions.
+
+    Returns the QIR expression and the list of the Dependency and
+    resolution.Capture it was built from.
+    """
+    from . import resolution
+
+    code = function.__code__
+    expression = cache.decompile(code)
+    dependencies = []
+
+    # We must resolve the names of each function on its own, as the global
+    # variables of a callee belong to the namespace of its module, and its
+    # free variables to its closure.
+    if resolve:
+        (expression, dependencies) = \
+            resolution.resolve_names(function, expression)
+
+    # The summary tells us which variables are free, and under which Lambdas
+    # they appear, which we need to check that inlining a function doesn't
+    # make one of its own free variables captured by a binding of the caller.
+    summary = Simplifier().summarize(expression)
+    names = resolution.global_names(code)
+    active = active | {code}
+    inlined = False
+
+    for name in sorted(summary.variables):
+        if name not in names:
+            continue
+
+        callee = find_callee(function.__globals__, name)
+
+        if (callee is None or callee.__code__ in active or
+            not can_inline(callee, call_arities(expression, name))):
+            continue
+
+        # The free variables of the callee would be read in the namespace of
+        # the caller once inlined, so the callees from other modules and the
+        # closures must have theirs resolved into constants first.
+        foreign = (callee.__globals__ is not function.__globals__ or
+                   callee.__closure__ is not None)
+
+        try:
+            (callee_expression, callee_dependencies) = \
+                inline_calls(callee, cache, resolve or foreign, active)
+        except Exception:
+            # We can still call the function if we can't decompile it.
+            continue
+
+        (_, binders) = summary.variables[name]
+        callee_summary = Simplifier().summarize(callee_expression)
+
+        # We give up if one of the free variables of the callee would be
+        # captured by a binding or a free variable of the caller, or if the
+        # callee is foreign and some of its free variables are left.
+        if any(variable in binders or variable in code.co_freevars or
+               (foreign and not is_shared(variable, function, callee))
+               for variable in callee_summary.variables):
+            continue
+
+        expression = replace(expression, name, callee_expression)
+        dependencies.append(
+            Dependency(function.__globals__, name, callee.__code__))
+        dependencies.extend(callee_dependencies)
+        inlined = True
+
+    # The inlined functions can contain comprehensions which are correlated
+    # to the loops of the caller, which we can only turn into joins now.
+    if inlined:
+        expression = introduce_joins(simplify(expression))
+
+    return (expression, dependencies)
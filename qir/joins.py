@@ -0,0 +1,436 @@
+from . import base
+from . import lists
+from . import values
+from . import tuples
+from . import algebra
+from . import functions
+from . import operators
+from .simplify import Simplifier, replace, transform, rebuild
+
+
+# The expressions which always evaluate to a boolean.
+BOOLEAN_EXPRESSIONS = (
+    values.Boolean, algebra.Not, algebra.And, algebra.Or, algebra.Equal,
+    algebra.LowerOrEqual, algebra.LowerThan, algebra.GreaterOrEqual,
+    algebra.GreaterThan, algebra.IsNull, algebra.In)
+
+
+def introduce_joins(expression):
+    """
+    Turn the existence checks on nested comprehensions of a QIR expression
+    into SemiJoin and AntiJoin operators, and the nested comprehensions which
+    are correlated by equality conditions into GroupBy operators.
+
+    The comprehensions with several for clauses, e.g.
+    `[f(e, d) for e in E for d in D if e.x == d.y]`, are already translated
+    into Joins by the decompiler (see JoinIntroducer.flatten), which the
+    database can evaluate using a hash or an index join.
+
+    `[e for e in E if any(p(e, d) for d in D)]` becomes
+    SemiJoin(λe. λd. p(e, d), E, D) instead of evaluating the inner
+    comprehension once for every element of E. Negated checks and all()
+    become AntiJoins.
+
+    Finally, the comprehensions which build a nested list for every element,
+    e.g. `[{'name': d.name, 'staff': [e.name for e in E if e.dept == d.id]}
+    for d in D]`, are decorrelated into a single GroupBy keyed by e.dept,
+    whose groups are then looked up by d.id while building the outer list.
+    """
+    return JoinIntroducer().introduce(expression)
+
+
+def conjuncts(condition):
+    """
+    Return the list of the operands of a conjunction.
+    """
+    if isinstance(condition, algebra.And):
+        return conjuncts(condition.left) + conjuncts(condition.right)
+    else:
+        return [condition]
+
+
+class JoinIntroducer():
+    """
+    The state of a call to introduce_joins().
+    """
+    def __init__(self):
+        self.simplifier = Simplifier()
+
+    def introduce(self, expression):
+        return transform(expression, self.introduce_node)
+
+    def depends_on(self, expression, name):
+        return name in self.simplifier.summarize(expression).variables
+
+    def is_equijoin(self, condition, outer, inner):
+        """
+        Check whether a condition is an equality between an expression which
+        only depends on outer and an expression which only depends on inner.
+        """
+        if not isinstance(condition, algebra.Equal):
+            return False
+
+        sides = [(self.depends_on(side, outer), self.depends_on(side, inner))
+                 for side in (condition.left, condition.right)]
+
+        return sides in ([(True, False), (False, True)],
+                         [(False, True), (True, False)])
+
+    def introduce_node(self, expression, arguments):
+        expression = rebuild(expression, arguments)
+
+        if (isinstance(expression, operators.Filter) and
+            isinstance(expression.filter, functions.Lambda)):
+            return self.introduce_semijoins(expression)
+
+        if not (isinstance(expression, operators.Project) and
+                isinstance(expression.format, functions.Lambda)):
+            return expression
+
+        return self.decorrelate(expression)
+
+    def flatten(self, outer, nested, input):
+        """
+        Build the concatenation of the lists nested, with outer ranging in
+        input, or return None if nested isn't a comprehension whose input
+        doesn't depend on outer.
+
+        This is the translation of a comprehension with two for clauses,
+        e.g. `[f(e, d) for e in E for d in D if p(e, d)]`, which becomes
+        Project(λr. f(r.left, r.right), Join(λe. λd. p(e, d), E, D)), or a
+        Join whose filter is always true when there is no condition.
+        """
+        if not (isinstance(nested, operators.Project) and
+                isinstance(nested.format, functions.Lambda)):
+            return None
+
+        inner = nested.format.parameter.name
+        right = nested.input
+        condition = values.Boolean(True)
+
+        # The renaming below assumes that the inner element and the filter
+        # use the same name, which the decompiler always does.
+        if (isinstance(right, operators.Filter) and
+            isinstance(right.filter, functions.Lambda) and
+            right.filter.parameter.name == inner):
+            condition = right.filter.body
+            right = right.input
+
+        if inner == outer or self.depends_on(right, outer):
+            return None
+
+        # Every element of the join is a tuple which holds the outer element
+        # under the key left and the inner element under the key right.
+        format = nested.format.body
+        row = outer + '_' + inner
+        suffix = 0
+
+        while self.depends_on(format, row):
+            suffix += 1
+            row = outer + '_' + inner + '_' + str(suffix)
+
+        for (name, key) in [(outer, 'left'), (inner, 'right')]:
+            format = replace(format, name, tuples.TupleDestr(
+                functions.Identifier(row), values.String(key)))
+
+        return operators.Project(
+            functions.Lambda(functions.Identifier(row), format),
+            operators.Join(
+                functions.Lambda(
+                    functions.Identifier(outer),
+                    functions.Lambda(functions.Identifier(inner), condition)),
+                input,
+                right))
+
+    def find_correlated(self, expression, outer, avoided):
+        """
+        Find the nested comprehensions in the body of the format of a Project
+        which only depend on its element outer through an equality condition.
+
+        Returns a list of (nested, name, lookup, key, guard, value, source),
+        such that nested is the list of the values of value with name ranging
+        in source, for which guard (which may be None) is true and key is
+        equal to lookup. Only lookup depends on outer.
+        """
+        found = []
+        pending = [expression.format.body]
+        visited = set()
+
+        # The comprehensions inside of other functions might be evaluated
+        # with different elements, or not at all, so we leave them alone.
+        while len(pending) > 0:
+            current = pending.pop()
+
+            if (id(current) in visited or
+                not isinstance(current, base.Expression) or
+                isinstance(current, functions.Lambda)):
+                continue
+
+            visited.add(id(current))
+            normalized = self.normalize(current, avoided)
+
+            if normalized is None:
+                pending.extend(
+                    getattr(current, field[0]) for field in current.fields)
+                continue
+
+            (name, guard, value, source) = normalized
+
+            if (name == outer or guard is None or
+                self.depends_on(source, outer) or
+                self.depends_on(value, outer)):
+                continue
+
+            equality = next((conjunct for conjunct in conjuncts(guard)
+                             if self.is_equijoin(conjunct, outer, name)),
+                            None)
+
+            if equality is None:
+                continue
+
+            remaining = [conjunct for conjunct in conjuncts(guard)
+                         if conjunct is not equality]
+
+            if any(self.depends_on(conjunct, outer)
+                   for conjunct in remaining):
+                continue
+
+            if self.depends_on(equality.left, outer):
+                (lookup, key) = (equality.left, equality.right)
+            else:
+                (lookup, key) = (equality.right, equality.left)
+
+            guard = None
+
+            for conjunct in remaining:
+                if guard is None:
+                    guard = conjunct
+                else:
+                    guard = algebra.And(guard, conjunct)
+
+            found.append((current, name, lookup, key, guard, value, source))
+
+        return found
+
+    def decorrelate(self, expression):
+        """
+        Turn the nested comprehensions in the format of a Project which are
+        correlated to its elements by an equality into a GroupBy.
+
+        Project(λd. f(Project(λe. g(e), Filter(λe. k(e) == l(d), E))), D)
+        becomes the binding of groups to
+        GroupBy(λe. k(e), λe. g(e), E)
+        in Project(λd. f(groups[l(d)] or []), D), so that the inner lists are
+        computed by a single query instead of one query per element of D,
+        and are then looked up by the value of l(d). The other conditions on
+        e are applied with a Filter before grouping.
+
+        The nested comprehensions whose values or other conditions also
+        depend on d are left alone, as their groups would have to be keyed
+        on the whole element d.
+        """
+        from .utils import identifiers
+
+        outer = expression.format.parameter.name
+        avoided = identifiers(expression)
+        correlated = self.find_correlated(expression, outer, avoided)
+
+        if len(correlated) == 0:
+            return expression
+
+        def fresh(name):
+            suffix = 0
+            candidate = name
+
+            while candidate in avoided:
+                suffix += 1
+                candidate = name + '_' + str(suffix)
+
+            avoided.add(candidate)
+            return candidate
+
+        lookups = {}
+        bindings = []
+
+        for (nested, inner, lookup, key, guard, value, source) in correlated:
+            if guard is not None:
+                source = operators.Filter(
+                    functions.Lambda(functions.Identifier(inner), guard),
+                    source)
+
+            groups = fresh('groups')
+            bindings.append((groups, operators.GroupBy(
+                functions.Lambda(functions.Identifier(inner), key),
+                functions.Lambda(functions.Identifier(inner), value),
+                source)))
+
+            # The elements without any match in E have no group, in which
+            # case their nested list is empty.
+            group = fresh('group')
+            lookups[id(nested)] = functions.Application(
+                functions.Lambda(
+                    functions.Identifier(group),
+                    functions.Conditional(
+                        algebra.IsNull(functions.Identifier(group)),
+                        lists.ListNil(),
+                        functions.Identifier(group))),
+                tuples.TupleDestr(functions.Identifier(groups), lookup))
+
+        def substitute_lookup(current, arguments):
+            if id(current) in lookups:
+                return lookups[id(current)]
+            else:
+                return rebuild(current, arguments)
+
+        body = transform(
+            expression.format.body, substitute_lookup,
+            lambda current: isinstance(current, functions.Lambda))
+
+        result = operators.Project(
+            functions.Lambda(functions.Identifier(outer), body),
+            expression.input)
+
+        for (groups, group) in reversed(bindings):
+            result = functions.Application(
+                functions.Lambda(functions.Identifier(groups), result),
+                group)
+
+        return result
+
+    def normalize(self, expression, avoided):
+        """
+        Decompose a list built by a chain of Project and Filter operators
+        into (name, guard, value, source), such that it is the list of the
+        values of value with name ranging in source, for which guard is
+        true. Returns None if expression is not such a chain.
+
+        The elements of different comprehensions can have the same names, so
+        name is chosen outside of the set of names avoided.
+        """
+        if isinstance(expression, operators.Project):
+            function = expression.format
+        elif isinstance(expression, operators.Filter):
+            function = expression.filter
+        else:
+            return None
+
+        if not isinstance(function, functions.Lambda):
+            return None
+
+        parameter = function.parameter.name
+        inner = self.normalize(expression.input, avoided)
+
+        if inner is None:
+            name = parameter
+            suffix = 0
+
+            while name in avoided:
+                suffix += 1
+                name = parameter + '_' + str(suffix)
+
+            (guard, value, source) = (
+                None, functions.Identifier(name), expression.input)
+            body = replace(function.body, parameter, value)
+        else:
+            (name, guard, value, source) = inner
+            body = replace(function.body, parameter, value)
+
+        if isinstance(expression, operators.Project):
+            return (name, guard, body, source)
+        elif guard is None:
+            return (name, body, value, source)
+        else:
+            return (name, algebra.And(guard, body), value, source)
+
+    def find_quantifier(self, condition, element):
+        """
+        Recognize a condition on element which checks whether some or all
+        of the elements of another list satisfy a predicate.
+
+        Returns (is_semijoin, name, predicate, source) such that the
+        condition holds iff there is (or isn't, if is_semijoin is False) an
+        element name in source for which predicate is true, or None.
+        """
+        negated = False
+
+        if isinstance(condition, algebra.Not):
+            negated = True
+            condition = condition.element
+
+        if not isinstance(condition, (operators.Any, operators.All)):
+            return None
+
+        normalized = self.normalize(
+            condition.input,
+            set(self.simplifier.summarize(condition.input).variables) |
+            {element})
+
+        if normalized is None:
+            return None
+
+        (name, guard, value, source) = normalized
+
+        # Python's any() and all() use the truthiness of the values, which
+        # we can only express on the values that are already booleans.
+        if (name == element or self.depends_on(source, element) or
+            not isinstance(value, BOOLEAN_EXPRESSIONS)):
+            return None
+
+        # all(v for x in s if g) is true iff there is no x in s such that
+        # g and not v.
+        if isinstance(condition, operators.All):
+            negated = not negated
+            value = algebra.Not(value)
+
+        if guard is not None:
+            value = algebra.And(guard, value)
+
+        return (not negated, name, value, source)
+
+    def introduce_semijoins(self, expression):
+        """
+        Turn the existence checks in the conjuncts of the condition of a
+        Filter into SemiJoins and AntiJoins, which are applied after the
+        other conjuncts.
+        """
+        element = expression.filter.parameter.name
+        remaining = []
+        quantifiers = []
+
+        for conjunct in conjuncts(expression.filter.body):
+            quantifier = self.find_quantifier(conjunct, element)
+
+            if quantifier is None:
+                remaining.append(conjunct)
+            else:
+                quantifiers.append(quantifier)
+
+        if len(quantifiers) == 0:
+            return expression
+
+        if len(remaining) > 0:
+            condition = remaining[0]
+
+            for conjunct in remaining[1:]:
+                condition = algebra.And(condition, conjunct)
+
+            result = operators.Filter(
+                functions.Lambda(functions.Identifier(element), condition),
+                expression.input)
+        else:
+            result = expression.input
+
+        for (is_semijoin, name, predicate, source) in quantifiers:
+            if is_semijoin:
+                operator = operators.SemiJoin
+            else:
+                operator = operators.AntiJoin
+
+            result = operator(
+                functions.Lambda(
+                    functions.Identifier(element),
+                    functions.Lambda(functions.Identifier(name), predicate)),
+                result,
+                source)
+
+        return result
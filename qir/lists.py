@@ -1,4 +1,5 @@
 from . import base
+from . import values
 from . import functions
 
 
@@ -33,7 +34,51 @@ class ListCons(ListConstr):
             self.tail.evaluate_locally(environment))
 
     def decode(self):
-        return (self.head().decode(),) + self.tail().decode()
+        # We walk the list iteratively, as long lists would otherwise exceed
+        # the recursion limit.
+        elements = []
+        current = self
+
+        while isinstance(current, ListCons):
+            elements.append(current.head.decode())
+            current = current.tail
+
+        return tuple(elements) + current.decode()
+
+
+class Range(ListConstr):
+    """
+    A QIR expression representing the list of the integers from start to
+    stop (excluded) with the given step, just like Python's range().
+
+    Unlike the equivalent chain of ListCons, its size doesn't depend on the
+    number of elements, and ListDestr only ever builds the elements that it
+    reaches, so iterating over it locally takes constant memory.
+    """
+    fields = (
+        ('start', base.Expression),
+        ('stop', base.Expression),
+        ('step', base.Expression))
+
+    def evaluate_locally(self, environment={}):
+        return Range(
+            self.start.evaluate_locally(environment),
+            self.stop.evaluate_locally(environment),
+            self.step.evaluate_locally(environment))
+
+    def bounds(self):
+        """
+        Return the Python range() corresponding to an evaluated Range.
+        """
+        if not all(isinstance(bound, values.Number)
+                   for bound in (self.start, self.stop, self.step)):
+            raise TypeError
+
+        # This raises a ValueError if step is zero, just like Python.
+        return range(self.start.value, self.stop.value, self.step.value)
+
+    def decode(self):
+        return tuple(self.bounds())
 
 
 class ListDestr(base.Expression):
@@ -61,5 +106,22 @@ class ListDestr(base.Expression):
                         input.head),
                     input.tail
                 ).evaluate(environment)
+        elif isinstance(input, Range):
+            bounds = input.bounds()
+
+            if len(bounds) == 0:
+                return self.on_nil.evaluate_locally(environment)
+
+            # We only build the first element, and a Range for the others.
+            return \
+                functions.Application(
+                    functions.Application(
+                        self.on_cons.evaluate_locally(environment),
+                        values.Number(bounds.start)),
+                    Range(
+                        values.Number(bounds.start + bounds.step),
+                        input.stop,
+                        input.step)
+                ).evaluate(environment)
         else:
             raise TypeError
@@ -1,10 +1,46 @@
 from . import base
 from . import utils
 
+import types
+import inspect
+import functools
+import threading
+
+
+def is_generator_expression(element):
+    return (isinstance(element, types.GeneratorType) and
+            element.gi_code.co_name == '<genexpr>')
+
+
+def iterate_generator(generator, remote):
+    """
+    Lazily evaluate a generator expression as a query, either remotely or
+    directly in Python, and yield its decoded elements one at a time.
+
+    Generator expressions which can't be translated, e.g. because they call
+    functions, are simply iterated in Python instead.
+    """
+    from . import decompile
+    from . import resolution
+
+    try:
+        expression = resolution.encode_generator(generator)
+    except decompile.UNSUPPORTED_ERRORS:
+        return generator
+
+    if remote:
+        return expression.iterate_remotely()
+    else:
+        return expression.iterate_locally()
+
 
 class LocalOperator:
     def __call__(self, element):
-        if isinstance(element, base.Expression):
+        # Generator expressions are evaluated lazily, and yield their decoded
+        # elements one at a time instead of returning a list.
+        if is_generator_expression(element):
+            return iterate_generator(element, False)
+        elif isinstance(element, base.Expression):
             return utils.decode(element.evaluate_locally())
         else:
             return utils.decode(utils.encode(element).evaluate_locally())
@@ -15,7 +51,9 @@ class LocalOperator:
 
 class BatchOperator:
     def __call__(self, element):
-        if isinstance(element, base.Expression):
+        if is_generator_expression(element):
+            return iterate_generator(element, True)
+        elif isinstance(element, base.Expression):
             return utils.decode(element.evaluate_remotely())
         else:
             return utils.decode(utils.encode(element).evaluate_remotely())
@@ -26,3 +64,295 @@ class BatchOperator:
 
 local = LocalOperator()
 batch = BatchOperator()
+
+
+class Query():
+    """
+    A Python function which is evaluated as a QIR query.
+
+    The function is decompiled lazily the first time it is called, and we keep
+    the body of the resulting QIR expression along with the names of its
+    parameters. Every subsequent call only has to encode its arguments and to
+    bind them to the parameters, just like a prepared statement, without ever
+    going through the decompiler again.
+
+    inline: Whether to inline the other user-defined functions called by the
+    function.
+    resolve: Whether to resolve the global and free variables of the function
+    into constants.
+    avalanche: If given, the function is decompiled right away and checked
+    for query avalanches (see avalanche.check), which either emits a warning
+    if avalanche is warn, or raises a QueryAvalancheError if it is error.
+
+    The query is then prepared again whenever one of the inlined functions is
+    redefined, or one of the resolved variables is bound to another value.
+
+    Functions which the decompiler can't translate are simply called in
+    Python, without trying to decompile them again on every call.
+    """
+    def __init__(self, function, inline=False, resolve=False, avalanche=None):
+        self.function = function
+        self.inline = inline
+        self.resolve = resolve
+        self.signature = inspect.signature(function)
+        self.template = None
+        self.body = None
+        self.parameters = None
+        self.dependencies = []
+        self.namespaces = []
+        self.translatable = None
+        self.lock = threading.Lock()
+
+        functools.update_wrapper(self, function)
+
+        if avalanche is not None:
+            self.check_avalanche(avalanche)
+
+    def prepare(self):
+        """
+        Decompile the function, if that wasn't done already.
+        """
+        if self.template is not None and self.is_up_to_date():
+            return
+
+        with self.lock:
+            if self.template is not None and self.is_up_to_date():
+                return
+
+            from . import cache
+            from . import resolution
+            from .functions import Lambda, Identifier
+
+            code = self.function.__code__
+
+            if self.inline or self.resolve:
+                (template, dependencies) = cache.default_cache.bind_function(
+                    self.function, self.inline, self.resolve)
+            else:
+                (template, dependencies) = (utils.encode(code), [])
+
+            if code.co_flags & (inspect.CO_VARARGS | inspect.CO_VARKEYWORDS):
+                raise NotImplementedError(
+                    'Variable arguments of %s' % self.function.__qualname__)
+
+            positional = code.co_varnames[:code.co_argcount]
+            parameters = code.co_varnames[
+                :code.co_argcount + code.co_kwonlyargcount]
+
+            # The decompiler wraps the body of the function in one Lambda per
+            # positional parameter, which we strip to get the body.
+            body = template
+            for _ in positional:
+                if not isinstance(body, Lambda):
+                    raise TypeError(
+                        'Expected %s to be decompiled into a Lambda, got %s' %
+                        (self.function.__qualname__, body))
+                body = body.body
+
+            # The keyword-only parameters are free in the body, so we bind
+            # them with Lambdas of their own, after the positional ones.
+            if len(parameters) > len(positional):
+                template = body
+                for name in reversed(parameters):
+                    template = Lambda(Identifier(name), template)
+
+            self.body = body
+            self.parameters = parameters
+            self.dependencies = dependencies
+            self.namespaces = [
+                (namespace, name) for (namespace, name)
+                in resolution.find_namespaces(self.function, body)
+                if name not in parameters]
+            self.template = template
+
+    def is_translatable(self):
+        """
+        Check whether the function can be translated into the QIR, preparing
+        it the first time.
+        """
+        if self.translatable is None:
+            # The decompiler doesn't only raise NotImplementedError, e.g. it
+            # raises PredecessorStacksError on some boolean expressions.
+            try:
+                self.prepare()
+                self.translatable = True
+            except Exception:
+                self.translatable = False
+
+        return self.translatable
+
+    def check_avalanche(self, mode='warn', cardinalities=None):
+        """
+        Check whether the function would cause a query avalanche, see
+        avalanche.check for details.
+
+        We don't use prepare(), as the helper functions that the function
+        calls might not be defined yet, in which case the template would
+        never inline them. Functions which can't be decompiled are left
+        alone, as they will be evaluated in Python anyway.
+        """
+        from . import cache
+        from . import inlining
+        from . import avalanche
+        from . import resolution
+
+        code = self.function.__code__
+
+        try:
+            if self.inline:
+                (expression, _) = inlining.inline_calls(
+                    self.function, cache.default_cache, self.resolve)
+            elif self.resolve:
+                (expression, _) = resolution.resolve_names(
+                    self.function, cache.default_cache.decompile(code))
+            else:
+                expression = cache.default_cache.decompile(code)
+
+        except Exception:
+            return None
+
+        return avalanche.check(
+            expression, self.function.__qualname__, mode, cardinalities)
+
+    def is_up_to_date(self):
+        """
+        Check whether none of the dependencies of the template changed.
+        """
+        if len(self.dependencies) == 0:
+            return True
+
+        from . import inlining
+        return inlining.is_up_to_date(self.dependencies)
+
+    def arguments(self, args, kwargs):
+        """
+        Encode the arguments of a call, in the order of the parameters.
+        """
+        if (len(kwargs) == 0 and len(args) == len(self.parameters) and
+            self.function.__code__.co_kwonlyargcount == 0):
+            values = args
+        else:
+            bound = self.signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            values = [bound.arguments[name] for name in self.parameters]
+
+        return [value if isinstance(value, base.Expression)
+                else utils.encode(value)
+                for value in values]
+
+    def bind(self, *args, **kwargs):
+        """
+        Return the QIR expression of a call to the query with the given
+        arguments, which can be sent to a remote QIR server.
+        """
+        from .functions import Application
+
+        self.prepare()
+        expression = self.template
+
+        for argument in self.arguments(args, kwargs):
+            expression = Application(expression, argument)
+
+        return expression
+
+    def environment(self, args, kwargs):
+        """
+        Build the environment in which the body of the query is evaluated
+        directly in Python: the encoded arguments, along with the current
+        values of the global and free variables that the body reads and which
+        weren't resolved into constants, as long as they can be encoded.
+        """
+        from . import resolution
+
+        self.prepare()
+        environment = {}
+
+        for (namespace, name) in self.namespaces:
+            (found, value) = resolution.lookup(namespace, name)
+            constant = resolution.encode_constant(value) if found else None
+
+            if constant is not None:
+                environment[name] = constant
+
+        environment.update(zip(self.parameters, self.arguments(args, kwargs)))
+        return environment
+
+    def local(self, *args, **kwargs):
+        """
+        Evaluate a call to the query directly in Python.
+        """
+        environment = self.environment(args, kwargs)
+        return utils.decode(self.body.evaluate_locally(environment))
+
+    def batch(self, *args, **kwargs):
+        """
+        Evaluate a call to the query on a remote QIR server.
+        """
+        return utils.decode(self.bind(*args, **kwargs).evaluate_remotely())
+
+    def __call__(self, *args, **kwargs):
+        """
+        Evaluate a call to the query, remotely if possible and otherwise
+        directly in Python, just like Expression.evaluate.
+
+        If the query can't be evaluated locally either, e.g. because it reads
+        a global variable which can't be encoded, we call the function itself.
+        """
+        if not self.is_translatable():
+            return self.function(*args, **kwargs)
+
+        try:
+            return self.batch(*args, **kwargs)
+        except Exception:
+            pass
+
+        try:
+            return self.local(*args, **kwargs)
+        except Exception:
+            return self.function(*args, **kwargs)
+
+    def iterate_locally(self, *args, **kwargs):
+        """
+        Lazily evaluate a call to a query which returns a list directly in
+        Python, and yield the decoded elements of the list one at a time.
+        """
+        environment = self.environment(args, kwargs)
+        return self.body.iterate_locally(environment)
+
+    def iterate_remotely(self, *args, **kwargs):
+        """
+        Lazily evaluate a call to a query which returns a list on a remote
+        QIR server, and yield the decoded elements of the list one at a time.
+        """
+        return self.bind(*args, **kwargs).iterate_remotely()
+
+    def iterate(self, *args, **kwargs):
+        """
+        Lazily evaluate a call to a query which returns a list, remotely if
+        possible and otherwise directly in Python, just like
+        Expression.iterate.
+
+        Consumers which stop early, e.g. after the first hundred elements,
+        never cause the rest of the list to be computed or transferred.
+        """
+        if not self.is_translatable():
+            return iter(self.function(*args, **kwargs))
+
+        return base.iterate_with_fallback(
+            lambda: self.iterate_remotely(*args, **kwargs),
+            lambda: base.iterate_with_fallback(
+                lambda: self.iterate_locally(*args, **kwargs),
+                lambda: iter(self.function(*args, **kwargs))))
+
+
+def query(function=None, inline=False, resolve=False, avalanche=None):
+    """
+    A decorator which turns a Python function into a QIR Query.
+
+    It can be used either as @query, or with options as e.g.
+    @query(inline=True, resolve=True, avalanche='error').
+    """
+    if function is None:
+        return lambda function: Query(function, inline, resolve, avalanche)
+    else:
+        return Query(function, inline, resolve, avalanche)
@@ -1,5 +1,87 @@
 from . import base
+from . import lists
+from . import tuples
 from . import errors
+from . import values
+from . import functions
+
+import heapq
+import itertools
+
+
+def stream(expression, environment={}):
+    """
+    Evaluate a QIR expression which corresponds to a list, and yield the
+    evaluated elements of that list one at a time.
+
+    Operators produce their elements lazily when they can, so that consumers
+    such as aggregates never have to hold the whole list in memory.
+    """
+    if isinstance(expression, Operator):
+        return expression.stream(environment)
+
+    # A let-binding around a list, e.g. the application of a generator
+    # expression to its source, doesn't prevent us from streaming the list.
+    elif (isinstance(expression, functions.Application) and
+          isinstance(expression.function, functions.Lambda)):
+        inner = environment.copy()
+        inner[expression.function.parameter.name] = \
+            expression.argument.evaluate_locally(environment)
+        return stream(expression.function.body, inner)
+
+    else:
+        return walk(expression.evaluate_locally(environment))
+
+
+def is_truthy(evaluated):
+    """
+    Return whether an evaluated QIR value is truthy, just like Python would
+    for the decoded value, e.g. when filtering a comprehension on `if x`.
+    """
+    if isinstance(evaluated, values.Boolean):
+        return evaluated.value
+    else:
+        return bool(evaluated.decode())
+
+
+def walk(evaluated):
+    """
+    Yield the elements of an evaluated list.
+    """
+    current = evaluated
+
+    while True:
+        if isinstance(current, lists.ListNil):
+            return
+        elif isinstance(current, lists.ListCons):
+            yield current.head
+            current = current.tail
+        elif isinstance(current, lists.Range):
+            for value in current.bounds():
+                yield values.Number(value)
+            return
+        else:
+            raise TypeError
+
+
+def collect(elements):
+    """
+    Build the QIR list of the given evaluated elements.
+    """
+    result = lists.ListNil()
+
+    for element in reversed(list(elements)):
+        result = lists.ListCons(element, result)
+
+    return result
+
+
+def apply(function, argument, environment={}):
+    """
+    Locally evaluate the application of a QIR function to an argument.
+    """
+    return functions.Application(function, argument).evaluate_locally(
+        environment)
 
 
 class Operator(base.Expression):
@@ -12,6 +94,14 @@ class Operator(base.Expression):
 
     This class is abstract, and should not be instantiated directly.
     """
+    def stream(self, environment={}):
+        """
+        Yield the evaluated elements of the list that the operator outputs.
+
+        Operators which can produce their elements one at a time override
+        this, the others build the whole list first.
+        """
+        return walk(self.evaluate_locally(environment))
 
 
 class Scan(Operator):
@@ -32,14 +122,19 @@ class Filter(Operator):
     A QIR expression representing the Filter operator of relational algebra.
 
     When evaluated, Filter(filter, input) will output the list of elements v
-    in the list corresponding to input such that filter(v) reduces to true.
+    in the list corresponding to input such that filter(v) is truthy.
     """
     fields = (
         ('filter', base.Expression),
         ('input', base.Expression))
 
     def evaluate_locally(self, environment={}):
-        raise errors.NotYetImplementedError
+        return collect(self.stream(environment))
+
+    def stream(self, environment={}):
+        for element in stream(self.input, environment):
+            if is_truthy(apply(self.filter, element, environment)):
+                yield element
 
 
 class Project(Operator):
@@ -55,7 +150,11 @@ class Project(Operator):
         ('input', base.Expression))
 
     def evaluate_locally(self, environment={}):
-        raise errors.NotYetImplementedError
+        return collect(self.stream(environment))
+
+    def stream(self, environment={}):
+        for element in stream(self.input, environment):
+            yield apply(self.format, element, environment)
 
 
 class Sort(Operator):
@@ -73,7 +172,48 @@ class Sort(Operator):
         ('input', base.Expression))
 
     def evaluate_locally(self, environment={}):
-        raise errors.NotYetImplementedError
+        (key, reverse) = self.ordering(environment)
+
+        return collect(sorted(
+            stream(self.input, environment), key=key, reverse=reverse))
+
+    def ordering(self, environment={}):
+        """
+        Return the key function and the reverse flag to pass to sorted() to
+        sort the elements of the input.
+
+        Every element of rows is a function which maps an element of the
+        input to a value, and the elements are compared on the tuples of the
+        decoded values.
+        """
+        keys = list(stream(self.rows, environment))
+        ascending = self.ascending.evaluate_locally(environment)
+
+        if not isinstance(ascending, values.Boolean):
+            raise TypeError
+
+        def key(element):
+            return tuple(apply(function, element, environment).decode()
+                         for function in keys)
+
+        return (key, not ascending.value)
+
+    def top(self, count, environment={}):
+        """
+        Return the list of the first count elements of the sorted input.
+
+        Instead of sorting the whole input, we keep the best count elements
+        in a heap, which takes O(n log(count)) time and O(count) memory.
+        heapq keeps equal elements in the order of the input, just like
+        sorted() does.
+        """
+        (key, reverse) = self.ordering(environment)
+        elements = stream(self.input, environment)
+
+        if reverse:
+            return collect(heapq.nlargest(count, elements, key=key))
+        else:
+            return collect(heapq.nsmallest(count, elements, key=key))
 
 
 class Limit(Operator):
@@ -88,7 +228,57 @@ class Limit(Operator):
         ('input', base.Expression))
 
     def evaluate_locally(self, environment={}):
-        raise errors.NotYetImplementedError
+        count = self.count(environment)
+
+        if isinstance(self.input, Sort) and count >= 0:
+            return self.input.top(count, environment)
+
+        return collect(self.stream(environment))
+
+    def stream(self, environment={}):
+        count = self.count(environment)
+
+        if isinstance(self.input, Sort) and count >= 0:
+            return walk(self.input.top(count, environment))
+
+        # A negative limit drops elements from the end, just like Python's
+        # slices, so we can't stop early.
+        if count < 0:
+            return iter(list(stream(self.input, environment))[:count])
+
+        return itertools.islice(stream(self.input, environment), count)
+
+    def count(self, environment={}):
+        limit = self.limit.evaluate_locally(environment)
+
+        if not isinstance(limit, values.Number):
+            raise TypeError
+
+        return limit.value
+
+
+class Offset(Operator):
+    """
+    A QIR expression representing the Offset operator of relational algebra.
+
+    When evaluated, Offset(offset, input) will output the list of elements in
+    the list corresponding to input, without its first offset elements.
+    """
+    fields = (
+        ('offset', base.Expression),
+        ('input', base.Expression))
+
+    def evaluate_locally(self, environment={}):
+        return collect(self.stream(environment))
+
+    def stream(self, environment={}):
+        offset = self.offset.evaluate_locally(environment)
+
+        if not isinstance(offset, values.Number) or offset.value < 0:
+            raise TypeError
+
+        return itertools.islice(
+            stream(self.input, environment), offset.value, None)
 
 
 class Group(Operator):
@@ -107,6 +297,180 @@ class Group(Operator):
         raise errors.NotYetImplementedError
 
 
+class Grouping(Operator):
+    """
+    A QIR operator which outputs a tuple mapping keys to values, such as the
+    dict built by a grouping loop or a dict comprehension.
+
+    When evaluated, the operator will compute key(v) and value(v) for every
+    element v in the list corresponding to input, and output a tuple which
+    maps every distinct key to the combination of the values of its elements.
+    The keys of the output are in the order in which they first appear in
+    the list corresponding to input, just like those of a Python dict.
+
+    This class is abstract, and should not be instantiated directly.
+    """
+    fields = (
+        ('key', base.Expression),
+        ('value', base.Expression),
+        ('input', base.Expression))
+
+    def evaluate_locally(self, environment={}):
+        key_function = self.key.evaluate_locally(environment)
+        value_function = self.value.evaluate_locally(environment)
+
+        # We build the groups in a single pass, using a hash table on the
+        # decoded keys. Keys which can't be hashed in Python, e.g. tuples,
+        # are compared with all the previous keys instead.
+        groups = []
+        index = {}
+
+        for element in stream(self.input, environment):
+            key = apply(key_function, element, environment)
+            decoded = key.decode()
+
+            try:
+                group = index.get(decoded)
+            except TypeError:
+                group = next(
+                    (group for group in groups if group[0] == decoded), None)
+
+            if group is None:
+                group = [decoded, key, self.initial()]
+                groups.append(group)
+
+                try:
+                    index[decoded] = group
+                except TypeError:
+                    pass
+
+            group[2] = self.combine(
+                group[2], apply(value_function, element, environment))
+
+        result = tuples.TupleNil()
+        lookups = {}
+
+        # The first key must be the innermost one to be decoded first.
+        for (decoded, key, value) in groups:
+            value = self.finish(value)
+            result = tuples.TupleCons(key, value, result)
+
+            if lookups is not None:
+                try:
+                    lookups[decoded] = value
+                except TypeError:
+                    lookups = None
+
+        if lookups is not None and len(groups) > 0:
+            result.lookups = lookups
+
+        return result
+
+    def stream(self, environment={}):
+        raise TypeError
+
+    def initial(self):
+        """ Return the combination of the values of an empty group. """
+        return None
+
+    def combine(self, combined, value):
+        """ Combine the values of a group with the value of a new element. """
+        raise NotImplementedError
+
+    def finish(self, combined):
+        """ Turn the combination of the values of a group into a QIR value. """
+        return combined
+
+
+class GroupBy(Grouping):
+    """
+    A QIR expression representing the grouping of the elements of a list.
+
+    When evaluated, GroupBy(key, value, input) will output a tuple which maps
+    key(v) for every element v in the list corresponding to input to the list
+    of the value(v) of the elements with that key, as built by
+    `for v in input: groups[key(v)].append(value(v))`.
+    """
+    def initial(self):
+        return []
+
+    def combine(self, combined, value):
+        combined.append(value)
+        return combined
+
+    def finish(self, combined):
+        return collect(combined)
+
+
+class IndexBy(Grouping):
+    """
+    A QIR expression representing the indexing of the elements of a list.
+
+    When evaluated, IndexBy(key, value, input) will output a tuple which maps
+    key(v) for every element v in the list corresponding to input to the
+    value(v) of the last element with that key, as built by
+    `{key(v): value(v) for v in input}`.
+    """
+    def combine(self, combined, value):
+        return value
+
+
+class Distinct(Operator):
+    """
+    A QIR expression representing the Distinct operator of relational algebra.
+
+    When evaluated, Distinct(input) will output the list of elements v in the
+    list corresponding to input, without the elements which are equal to a
+    previous one.
+    """
+    fields = (('input', base.Expression),)
+
+    def evaluate_locally(self, environment={}):
+        return collect(self.stream(environment))
+
+    def stream(self, environment={}):
+        # We remember the decoded elements we have seen in a hash set, and
+        # the elements which can't be hashed in Python, e.g. tuples, in a
+        # list which we have to walk instead.
+        seen = set()
+        unhashable = []
+
+        for element in stream(self.input, environment):
+            decoded = element.decode()
+
+            try:
+                if decoded in seen:
+                    continue
+
+                seen.add(decoded)
+
+            except TypeError:
+                if decoded in unhashable:
+                    continue
+
+                unhashable.append(decoded)
+
+            yield element
+
+
+class Flatten(Operator):
+    """
+    A QIR expression representing the concatenation of lists.
+
+    When evaluated, Flatten(input) will output the concatenation of the lists
+    in the list corresponding to input, in order, as built by
+    `[x for xs in input for x in xs]`.
+    """
+    fields = (('input', base.Expression),)
+
+    def evaluate_locally(self, environment={}):
+        return collect(self.stream(environment))
+
+    def stream(self, environment={}):
+        for element in stream(self.input, environment):
+            yield from walk(element)
+
+
 class Join(Operator):
     """
     A QIR expression representing the Join operator of relational algebra.
@@ -114,6 +478,10 @@ class Join(Operator):
     When evaluated, Join(filter, left, right) will output the join of the
     elements v1 in the list corresponding to left and the elements v2 in the
     list corresponding to right, such that filter(v1, v2) reduces to true.
+
+    Every element of the join is a tuple which holds v1 under the key left
+    and v2 under the key right, so that the fields of both elements can be
+    told apart even when they have the same names.
     """
     fields = (
         ('filter', base.Expression),
@@ -121,4 +489,284 @@ class Join(Operator):
         ('right', base.Expression))
 
     def evaluate_locally(self, environment={}):
-        raise errors.NotYetImplementedError
+        return collect(self.stream(environment))
+
+    def stream(self, environment={}):
+        matcher = Matcher(self.filter, self.right, environment)
+
+        for first in stream(self.left, environment):
+            for second in matcher.matches(first):
+                yield tuples.TupleCons(
+                    values.String('left'), first,
+                    tuples.TupleCons(
+                        values.String('right'), second, tuples.TupleNil()))
+
+
+class SemiJoin(Operator):
+    """
+    A QIR expression representing the semi-join operator of relational
+    algebra.
+
+    When evaluated, SemiJoin(filter, left, right) will output the list of
+    elements v1 in the list corresponding to left such that filter(v1, v2)
+    reduces to true for at least one element v2 in the list corresponding to
+    right.
+    """
+    fields = (
+        ('filter', base.Expression),
+        ('left', base.Expression),
+        ('right', base.Expression))
+
+    def evaluate_locally(self, environment={}):
+        return collect(self.stream(environment))
+
+    def stream(self, environment={}):
+        matcher = Matcher(self.filter, self.right, environment)
+
+        for element in stream(self.left, environment):
+            if any(True for _ in matcher.matches(element)):
+                yield element
+
+
+class AntiJoin(Operator):
+    """
+    A QIR expression representing the anti-join operator of relational
+    algebra.
+
+    When evaluated, AntiJoin(filter, left, right) will output the list of
+    elements v1 in the list corresponding to left such that filter(v1, v2)
+    reduces to true for no element v2 in the list corresponding to right.
+    """
+    fields = (
+        ('filter', base.Expression),
+        ('left', base.Expression),
+        ('right', base.Expression))
+
+    def evaluate_locally(self, environment={}):
+        return collect(self.stream(environment))
+
+    def stream(self, environment={}):
+        matcher = Matcher(self.filter, self.right, environment)
+
+        for element in stream(self.left, environment):
+            if not any(True for _ in matcher.matches(element)):
+                yield element
+
+
+class Matcher():
+    """
+    Find the elements of the right input of a join which match an element of
+    its left input, i.e. the elements v2 such that filter(v1, v2) reduces to
+    true.
+
+    The right input is only evaluated once. When the filter contains an
+    equality between an expression of v1 and an expression of v2, we also
+    build a hash table of the elements v2 indexed by their side of the
+    equality, so that finding the matches of v1 doesn't take time
+    proportional to the size of the right input. Otherwise, or if the values
+    can't be hashed, we fall back to comparing v1 with every element v2.
+
+    Matches are produced lazily, so callers which only need to know whether
+    there is one can stop at the first.
+    """
+    def __init__(self, filter, right, environment={}):
+        self.filter = filter.evaluate_locally(environment)
+        self.right = right
+        self.environment = environment
+
+        self.elements = None
+        self.index = None
+        self.keys = find_join_keys(self.filter)
+
+    def bind(self, first, second):
+        """
+        Return the environment in which the body of the filter is evaluated.
+        """
+        environment = self.environment.copy()
+
+        if first is not None:
+            environment[self.filter.parameter.name] = first
+
+        if second is not None:
+            environment[self.filter.body.parameter.name] = second
+
+        return environment
+
+    def prepare(self):
+        self.elements = list(stream(self.right, self.environment))
+
+        if self.keys is None:
+            return
+
+        index = {}
+
+        try:
+            for element in self.elements:
+                key = self.keys[1].evaluate_locally(
+                    self.bind(None, element)).decode()
+                index.setdefault(key, []).append(element)
+
+        except TypeError:
+            return
+
+        self.index = index
+
+    def matches(self, first):
+        if self.elements is None:
+            self.prepare()
+
+        candidates = self.elements
+
+        if self.index is not None:
+            try:
+                key = self.keys[0].evaluate_locally(
+                    self.bind(first, None)).decode()
+                candidates = self.index.get(key, [])
+
+            except TypeError:
+                pass
+
+        for second in candidates:
+            condition = self.filter.body.body.evaluate_locally(
+                self.bind(first, second))
+
+            if is_truthy(condition):
+                yield second
+
+
+def find_join_keys(filter):
+    """
+    Find an equality between an expression which only depends on the first
+    parameter of a join filter and an expression which only depends on the
+    second one, and return both expressions in that order, or None.
+    """
+    from . import algebra
+    from .simplify import Simplifier
+
+    if not (isinstance(filter, functions.Lambda) and
+            isinstance(filter.body, functions.Lambda)):
+        raise TypeError
+
+    first = filter.parameter.name
+    second = filter.body.parameter.name
+    simplifier = Simplifier()
+
+    pending = [filter.body.body]
+
+    while len(pending) > 0:
+        condition = pending.pop()
+
+        if isinstance(condition, algebra.And):
+            pending.extend([condition.right, condition.left])
+
+        elif isinstance(condition, algebra.Equal):
+            sides = [set(simplifier.summarize(side).variables) &
+                     {first, second}
+                     for side in (condition.left, condition.right)]
+
+            if sides == [{first}, {second}]:
+                return (condition.left, condition.right)
+            elif sides == [{second}, {first}]:
+                return (condition.right, condition.left)
+
+    return None
+
+
+class Aggregate(Operator):
+    """
+    A QIR aggregate, which reduces a list to a single value.
+
+    Aggregates are evaluated locally by streaming the elements of their
+    input, so they only ever hold the current element in memory.
+
+    This class is abstract, and should not be instantiated directly.
+    """
+    fields = (('input', base.Expression),)
+
+    def evaluate_locally(self, environment={}):
+        return self.aggregate(stream(self.input, environment))
+
+    def stream(self, environment={}):
+        raise TypeError
+
+
+def numbers(elements):
+    """
+    Yield the Python values of elements, which must all be QIR values.
+    """
+    for element in elements:
+        if not isinstance(element, values.Value):
+            raise TypeError
+
+        yield element.decode()
+
+
+class Sum(Aggregate):
+    """
+    A QIR expression representing the sum aggregate of relational algebra.
+
+    When evaluated, Sum(input) will output the sum of the elements in the
+    list corresponding to input, or 0 if that list is empty.
+    """
+    def aggregate(self, elements):
+        from . import utils
+        return utils.encode(sum(numbers(elements)))
+
+
+class Count(Aggregate):
+    """
+    A QIR expression representing the count aggregate of relational algebra.
+
+    When evaluated, Count(input) will output the number of elements in the
+    list corresponding to input.
+    """
+    def aggregate(self, elements):
+        return values.Number(sum(1 for _ in elements))
+
+
+class Min(Aggregate):
+    """
+    A QIR expression representing the min aggregate of relational algebra.
+
+    When evaluated, Min(input) will output the smallest element in the list
+    corresponding to input, which must not be empty.
+    """
+    def aggregate(self, elements):
+        from . import utils
+        return utils.encode(min(numbers(elements)))
+
+
+class Max(Aggregate):
+    """
+    A QIR expression representing the max aggregate of relational algebra.
+
+    When evaluated, Max(input) will output the largest element in the list
+    corresponding to input, which must not be empty.
+    """
+    def aggregate(self, elements):
+        from . import utils
+        return utils.encode(max(numbers(elements)))
+
+
+class Any(Aggregate):
+    """
+    A QIR expression representing the existential quantifier.
+
+    When evaluated, Any(input) will output true if at least one element in
+    the list corresponding to input is truthy. The elements after the first
+    truthy one are never computed.
+    """
+    def aggregate(self, elements):
+        return values.Boolean(any(numbers(elements)))
+
+
+class All(Aggregate):
+    """
+    A QIR expression representing the universal quantifier.
+
+    When evaluated, All(input) will output true if every element in the list
+    corresponding to input is truthy. The elements after the first falsy one
+    are never computed.
+    """
+    def aggregate(self, elements):
+        return values.Boolean(all(numbers(elements)))
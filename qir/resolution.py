@@ -0,0 +1,253 @@
+from . import base
+from . import utils
+from .simplify import Simplifier, replace, simplify
+
+import types
+import collections
+
+
+# The types of the values which can be encoded into QIR constants, either
+# directly or inside of containers.
+SCALAR_TYPES = (type(None), bool, int, float, str)
+CONTAINER_TYPES = (list, tuple, set, frozenset)
+
+# The containers which can't be mutated once they are built.
+IMMUTABLE_TYPES = (tuple, frozenset)
+
+
+class Capture(collections.namedtuple(
+        'Capture', ['namespace', 'name', 'value'])):
+    """
+    A dependency of a QIR expression on the value of a global or free
+    variable which was resolved into a constant.
+
+    namespace is either the dictionary of the global variables of a function,
+    or the cell which holds a free variable. Only immutable values are
+    resolved, so the constant stays valid as long as the variable isn't
+    bound to another value.
+    """
+    def is_up_to_date(self):
+        (found, value) = lookup(self.namespace, self.name)
+        return found and value is self.value
+
+
+def lookup(namespace, name):
+    """
+    Look the value of a variable up in a dictionary or a cell.
+
+    Returns whether the variable is bound, and its value.
+    """
+    if isinstance(namespace, dict):
+        if name in namespace:
+            return (True, namespace[name])
+        else:
+            return (False, None)
+
+    try:
+        return (True, namespace.cell_contents)
+
+    # An empty cell means that the variable was not assigned yet.
+    except ValueError:
+        return (False, None)
+
+
+def global_names(code):
+    """
+    Find the names of the global variables which can be read by a code
+    object, including by the code objects of its comprehensions.
+
+    A name which is bound by the function itself always refers to a local
+    variable, even if the decompiled expression sometimes reads it outside of
+    the Lambda that binds it (e.g. after a loop).
+    """
+    names = set()
+    pending = [code]
+
+    while len(pending) > 0:
+        current = pending.pop()
+        names.update(current.co_names)
+        pending.extend(value for value in current.co_consts
+                       if isinstance(value, types.CodeType))
+
+    return names - set(code.co_varnames) - set(code.co_cellvars)
+
+
+def is_encodable(value):
+    """
+    Check whether a value can be encoded into a QIR constant.
+    """
+    if isinstance(value, SCALAR_TYPES):
+        return True
+    elif isinstance(value, CONTAINER_TYPES):
+        return all(is_encodable(item) for item in value)
+    elif isinstance(value, dict):
+        return all(isinstance(key, str) and is_encodable(item)
+                   for (key, item) in value.items())
+    else:
+        return False
+
+
+def encode_constant(value):
+    """
+    Encode the value of a variable into a QIR constant, or return None if the
+    value must be left to the evaluator.
+
+    Values which already are QIR expressions, e.g. Table handles, are used
+    as they are.
+    """
+    if isinstance(value, base.Expression):
+        return value
+    elif is_encodable(value):
+        return utils.encode(value)
+    else:
+        return None
+
+
+def is_immutable(value):
+    """
+    Check whether a value which can be encoded into a QIR constant can never
+    be mutated, i.e. whether it is a scalar or an immutable container of
+    immutable values.
+    """
+    if isinstance(value, SCALAR_TYPES):
+        return True
+    elif isinstance(value, IMMUTABLE_TYPES):
+        return all(is_immutable(item) for item in value)
+    else:
+        return False
+
+
+def find_namespaces(function, expression):
+    """
+    Find the global and free variables of the QIR expression of a function.
+
+    Returns a list of (namespace, name) pairs, where namespace is either the
+    cell of a free variable or function.__globals__, see lookup.
+    """
+    code = function.__code__
+    cells = dict(zip(code.co_freevars, function.__closure__ or ()))
+    names = global_names(code)
+
+    summary = Simplifier().summarize(expression)
+    found = []
+
+    for name in sorted(summary.variables):
+        if name in cells:
+            found.append((cells[name], name))
+        elif name in names:
+            found.append((function.__globals__, name))
+
+    return found
+
+
+def resolve_names(function, expression):
+    """
+    Resolve the global and free variables of the QIR expression of a function
+    into constants.
+
+    The values are read from function.__globals__ and function.__closure__ at
+    the time of the call, so that they don't have to be looked up during
+    every evaluation - which the QIR server couldn't even do. Variables bound
+    to functions, modules and other values which can't be encoded are left
+    alone, and so are lists, sets and dictionaries: they could be mutated
+    without being rebound, and the constant would then silently be stale.
+
+    Returns the resolved QIR expression and the list of the Capture of the
+    variables which were resolved.
+    """
+    captures = []
+
+    for (namespace, name) in find_namespaces(function, expression):
+        (found, value) = lookup(namespace, name)
+
+        if not found:
+            continue
+
+        if not (isinstance(value, base.Expression) or is_immutable(value)):
+            continue
+
+        expression = replace(expression, name, encode_constant(value))
+        captures.append(Capture(namespace, name, value))
+
+    if len(captures) > 0:
+        expression = simplify(expression)
+
+    return (expression, captures)
+
+
+def encode_iterator(iterator):
+    """
+    Encode the iterator over the source of a generator expression.
+
+    Iterators over lists, tuples and ranges tell us which sequence they walk
+    and where they are through their __reduce__ method, which we use to
+    encode the sequence without consuming the iterator. We have to consume
+    other iterators, which are at least never advanced by the generator.
+    """
+    try:
+        reduced = iterator.__reduce__()
+    except TypeError:
+        reduced = None
+
+    if (isinstance(reduced, tuple) and len(reduced) == 3 and
+        reduced[0] is iter and len(reduced[1]) == 1 and
+        isinstance(reduced[1][0], (list, tuple, range)) and
+        isinstance(reduced[2], int)):
+        return utils.encode(reduced[1][0][reduced[2]:])
+
+    return utils.encode(list(iterator))
+
+
+def encode_generator(generator):
+    """
+    Encode a generator expression which wasn't started yet into the QIR
+    expression of the list it would produce, without running it.
+
+    The decompiler turns the code of a generator expression into λ.0. body,
+    where .0 is the iterator over its source. We resolve the free and global
+    variables it reads from its frame into constants, so that the expression
+    can also be sent to a remote QIR server, and apply it to the encoded
+    source.
+
+    Raises NotImplementedError, before touching the source, if some of those
+    variables can't be resolved, e.g. when they are bound to functions.
+    """
+    from .functions import Application
+
+    code = generator.gi_code
+    frame = generator.gi_frame
+
+    if (code.co_name != '<genexpr>' or frame is None or
+        frame.f_lasti != -1):
+        raise TypeError(
+            'Expected a generator expression which was not started, got %s' %
+            generator)
+
+    function = utils.encode(code)
+    names = global_names(code)
+    summary = Simplifier().summarize(function)
+    unresolved = []
+
+    for name in sorted(summary.variables):
+        if name in code.co_freevars:
+            namespace = frame.f_locals
+        elif name in names:
+            namespace = frame.f_globals
+        else:
+            namespace = {}
+
+        (found, value) = lookup(namespace, name)
+        constant = encode_constant(value) if found else None
+
+        if constant is None:
+            unresolved.append(name)
+        else:
+            function = replace(function, name, constant)
+
+    if len(unresolved) > 0:
+        raise NotImplementedError(
+            'The generator expression reads %s, which can\'t be resolved' %
+            ', '.join(unresolved))
+
+    return simplify(Application(
+        function, encode_iterator(frame.f_locals['.0'])))
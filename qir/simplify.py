@@ -0,0 +1,539 @@
+from . import base
+from . import values
+from . import algebra
+from . import functions
+from . import utils
+
+import collections
+
+
+# What we need to know about an expression to decide whether we can rewrite
+# the variable bindings around it: for each of its free variables, the number
+# of free occurrences (which stops at 2 as we don't need to know more) and
+# the names of the parameters of the Lambdas under which they appear; whether
+# it applies functions that it doesn't define itself; whether it contains
+# any function application at all; and the names of the free variables which
+# appear in sub-expressions shared with the rest of the expression.
+Summary = collections.namedtuple(
+    'Summary', ['variables', 'opaque', 'impure', 'shared'])
+
+
+def simplify(expression):
+    """
+    Simplify a QIR expression without changing its meaning.
+
+    This folds algebraïc operators whose operands are constants, prunes the
+    branches of conditionals whose conditions are constants, drops variable
+    bindings which are never used, and inlines the bindings of constants,
+    of other variables, and of values which are used only once.
+
+    A pass already carries the rewritings up and down the expression (e.g.
+    inlining a constant might make a condition constant), but it decides how
+    to rewrite a binding before simplifying its body, so we run another pass
+    only if one of these decisions might change (see Simplifier.unsettled),
+    and until the expression doesn't change anymore.
+    """
+    while True:
+        simplifier = Simplifier(find_shared(expression))
+        simplified = simplifier.simplify(expression)
+
+        if simplified is expression or not simplifier.unsettled:
+            return simplified
+
+        expression = simplified
+
+
+def find_shared(expression):
+    """
+    Return the sub-expressions of an expression which have several parents,
+    indexed by their id.
+
+    The decompiler shares the expression of a block between all of its
+    predecessors, e.g. the code which follows an if statement between both
+    of its branches. Identifiers are left out, as rewriting one of them
+    doesn't copy anything.
+    """
+    seen = set()
+    shared = {}
+    pending = [expression]
+
+    while len(pending) > 0:
+        current = pending.pop()
+
+        for field in current.fields:
+            child = getattr(current, field[0])
+
+            if (not isinstance(child, base.Expression) or
+                isinstance(child, functions.Identifier)):
+                continue
+
+            if id(child) in seen:
+                shared[id(child)] = child
+            else:
+                seen.add(id(child))
+                pending.append(child)
+
+    return shared
+
+
+def transform(expression, function, skip=None):
+    """
+    Rebuild a QIR expression from the bottom up.
+
+    function is called on every expression of the tree along with the list of
+    its already rebuilt arguments, and returns the expression which replaces
+    it. The expressions for which skip returns True are left untouched.
+
+    The decompiler shares the expression of a block between all of its
+    predecessors, so expressions are really directed acyclic graphs which
+    would be exponentially large as trees: we call function only once for
+    every distinct expression. We also don't use recursion, as the
+    expressions produced for long functions can be much deeper than the
+    recursion limit.
+    """
+    pending = [(expression, False)]
+    results = []
+    done = {}
+
+    while len(pending) > 0:
+        (current, expanded) = pending.pop()
+
+        if not isinstance(current, base.Expression):
+            results.append(current)
+
+        elif id(current) in done:
+            results.append(done[id(current)][1])
+
+        elif expanded:
+            count = len(current.fields)
+            arguments = results[len(results) - count:]
+            del results[len(results) - count:]
+
+            # We keep a reference to current so that its id can't be reused.
+            result = function(current, arguments)
+            done[id(current)] = (current, result)
+            results.append(result)
+
+        elif skip is not None and skip(current):
+            done[id(current)] = (current, current)
+            results.append(current)
+
+        else:
+            pending.append((current, True))
+            for field in reversed(current.fields):
+                pending.append((getattr(current, field[0]), False))
+
+    return results[0]
+
+
+def rebuild(expression, arguments):
+    """
+    Return expression with the given arguments, reusing it if they didn't
+    change.
+    """
+    if all(argument is getattr(expression, field[0])
+           for (field, argument) in zip(expression.fields, arguments)):
+        return expression
+    else:
+        return expression.__class__(*arguments)
+
+
+def replace(expression, name, value):
+    """
+    Replace the free occurrences of the variable name with value.
+
+    The caller must make sure that none of the free variables of value gets
+    captured by a Lambda in the process.
+    """
+    def binds_name(current):
+        return (isinstance(current, functions.Lambda) and
+                current.parameter.name == name)
+
+    def function(current, arguments):
+        if isinstance(current, functions.Identifier) and current.name == name:
+            return value
+        else:
+            return rebuild(current, arguments)
+
+    return transform(expression, function, binds_name)
+
+
+def rename_binders(expression, name, avoided):
+    """
+    Rename the parameters of the Lambdas which bind name in an expression to
+    names outside of the set of names avoided.
+    """
+    def function(current, arguments):
+        current = rebuild(current, arguments)
+
+        if not (isinstance(current, functions.Lambda) and
+                current.parameter.name == name):
+            return current
+
+        suffix = 1
+
+        while name + '_' + str(suffix) in avoided:
+            suffix += 1
+
+        renamed = functions.Identifier(name + '_' + str(suffix))
+        return functions.Lambda(renamed, replace(current.body, name, renamed))
+
+    return transform(expression, function)
+
+
+def is_constant(expression):
+    # Null is a Value, but it has no value attribute.
+    return (isinstance(expression, values.Value) and
+            not isinstance(expression, values.Null))
+
+
+def is_binding(expression):
+    return (isinstance(expression, functions.Application) and
+            isinstance(expression.function, functions.Lambda))
+
+
+def without(environment, name):
+    """
+    Return environment without the value of name, copying it only if needed.
+    """
+    if name not in environment:
+        return environment
+
+    environment = environment.copy()
+    del environment[name]
+    return environment
+
+
+# The steps of Simplifier.simplify, and the ways of rewriting a binding.
+(VISIT, BIND, REBIND, REBUILD, DONE) = range(5)
+(INLINE, DROP, KEEP, RENAME) = ('inline', 'drop', 'keep', 'rename')
+
+
+class Simplifier():
+    """
+    The state of a pass of simplify().
+
+    We remember the Summary of every expression we have seen, so that
+    deciding whether a binding can be rewritten doesn't take time
+    proportional to the size of its body, which would make simplifying long
+    functions quadratic. shared holds the sub-expressions with several
+    parents of the expression being simplified, as returned by find_shared.
+
+    unsettled tells whether the pass kept a binding which the next pass
+    would rewrite, i.e. one for which we would decide otherwise given its
+    simplified body (e.g. its variable isn't used anymore, or it was renamed
+    to be inlined later).
+    """
+    def __init__(self, shared={}):
+        self.summaries = {}
+        self.shared = shared
+        self.unsettled = False
+
+    def is_summarized(self, expression):
+        return id(expression) in self.summaries
+
+    def summarize(self, expression):
+        """
+        Return the Summary of an expression.
+        """
+        if not self.is_summarized(expression):
+            transform(expression, self.add_summary, self.is_summarized)
+
+        return self.summaries[id(expression)][1]
+
+    def add_summary(self, expression, arguments):
+        # The arguments which were already summarized were skipped, so we
+        # have to look their summaries up.
+        summaries = []
+
+        for argument in arguments:
+            if isinstance(argument, base.Expression):
+                summaries.append(self.summaries[id(argument)][1])
+            elif isinstance(argument, Summary):
+                summaries.append(argument)
+
+        summary = self.compute_summary(expression, summaries)
+
+        # Once again, we keep a reference to expression so that its id can't
+        # be reused by another expression.
+        self.summaries[id(expression)] = (expression, summary)
+        return summary
+
+    def compute_summary(self, expression, summaries):
+        if isinstance(expression, functions.Identifier):
+            return Summary(
+                {expression.name: (1, frozenset())}, False, False,
+                frozenset())
+
+        if isinstance(expression, functions.Lambda):
+            body = summaries[1]
+            parameter = expression.parameter.name
+
+            variables = {
+                name: (count, binders | {parameter})
+                for (name, (count, binders)) in body.variables.items()
+                if name != parameter}
+            (opaque, impure) = (body.opaque, body.impure)
+            shared = body.shared - {parameter}
+
+        else:
+            variables = {}
+
+            for summary in summaries:
+                for (name, (count, binders)) in summary.variables.items():
+                    if name in variables:
+                        (other_count, other_binders) = variables[name]
+                        variables[name] = (
+                            min(2, count + other_count),
+                            binders | other_binders)
+                    else:
+                        variables[name] = (count, binders)
+
+            is_application = isinstance(expression, functions.Application)
+
+            opaque = (
+                any(summary.opaque for summary in summaries) or
+                (is_application and
+                 not isinstance(expression.function, functions.Lambda)))
+            impure = (
+                any(summary.impure for summary in summaries) or
+                is_application)
+            shared = frozenset().union(
+                *[summary.shared for summary in summaries])
+
+        if id(expression) in self.shared:
+            shared = frozenset(variables)
+
+        return Summary(variables, opaque, impure, shared)
+
+    def simplify(self, expression):
+        """
+        Rewrite an expression in a single pass.
+
+        Rebuilding the body of a binding for every variable that we inline
+        would take time quadratic in the length of the function, so we carry
+        the values of the inlined variables down the expression instead, and
+        substitute them when we reach their identifiers. The other rewritings
+        are done on the way back up, once the arguments are simplified.
+
+        We never inline a variable into a sub-expression with several
+        parents, as each parent might see a different value for it: the
+        sub-expression would be copied once for every path which leads to
+        it, i.e. exponentially many times after a sequence of if statements.
+        In exchange, such a sub-expression is rewritten in the same way
+        whichever path we reach it from, so we only rewrite it once.
+        """
+        pending = [(VISIT, expression, {})]
+        results = []
+        done = {}
+
+        while len(pending) > 0:
+            (action, current, state) = pending.pop()
+
+            if action == VISIT:
+                environment = state
+
+                if not isinstance(current, base.Expression):
+                    results.append(current)
+
+                elif isinstance(current, functions.Identifier):
+                    results.append(environment.get(current.name, current))
+
+                elif id(current) in done:
+                    results.append(done[id(current)])
+
+                elif (is_binding(current) and
+                      id(current.function) not in self.shared):
+                    pending.append((BIND, current, environment))
+                    pending.append((VISIT, current.argument, environment))
+
+                else:
+                    if isinstance(current, functions.Lambda):
+                        environment = without(
+                            environment, current.parameter.name)
+
+                    pending.append((REBUILD, current, None))
+                    for field in reversed(current.fields):
+                        pending.append(
+                            (VISIT, getattr(current, field[0]), environment))
+
+            elif action == BIND:
+                environment = state
+                value = results.pop()
+                name = current.function.parameter.name
+                body = current.function.body
+                decision = self.decide_binding(current, value)
+
+                if decision == INLINE:
+                    inner = environment.copy()
+                    inner[name] = value
+                    pending.append((DONE, current, None))
+                    pending.append((VISIT, body, inner))
+                elif decision == DROP:
+                    pending.append((DONE, current, None))
+                    pending.append((VISIT, body, without(environment, name)))
+                else:
+                    pending.append((REBIND, current, (value, decision)))
+                    pending.append((VISIT, body, without(environment, name)))
+
+            elif action == REBIND:
+                (value, decision) = state
+                body = results.pop()
+
+                result = self.keep_binding(current, body, value,
+                                           decision == RENAME)
+
+                # We decided with the summary of the original body, so the
+                # decision can only change if the body did.
+                if ((body is not current.function.body or
+                     decision == RENAME) and
+                        self.decide_binding(result, value) != decision):
+                    self.unsettled = True
+                results.append(result)
+                pending.append((DONE, current, None))
+
+            elif action == REBUILD:
+                count = len(current.fields)
+                arguments = results[len(results) - count:]
+                del results[len(results) - count:]
+
+                results.append(self.simplify_node(current, arguments))
+                pending.append((DONE, current, None))
+
+            elif action == DONE:
+                # The shared expressions are kept alive by self.shared, so
+                # their ids can't be reused.
+                if id(current) in self.shared:
+                    done[id(current)] = results[-1]
+
+        return results[0]
+
+    def simplify_node(self, expression, arguments):
+        """
+        Simplify an expression whose arguments were already simplified.
+        """
+        expression = rebuild(expression, arguments)
+
+        if isinstance(expression,
+                      (algebra.UnaryOperator, algebra.BinaryOperator)):
+            return self.fold_operator(expression)
+        elif isinstance(expression, functions.Conditional):
+            return self.fold_conditional(expression)
+        else:
+            return expression
+
+    def fold_operator(self, expression):
+        """
+        Fold an algebraïc operator whose operands are constants.
+        """
+        operands = [getattr(expression, field[0])
+                    for field in expression.fields]
+
+        if all(is_constant(operand) for operand in operands):
+            try:
+                folded = utils.encode(expression.__class__.operate(
+                    *[operand.value for operand in operands]))
+            except Exception:
+                # We leave the errors (e.g. divisions by zero) to the
+                # evaluator.
+                return expression
+
+            if is_constant(folded):
+                return folded
+            else:
+                return expression
+
+        # Even if only the left operand of a conjunction or disjunction is a
+        # constant, we might be able to short-circuit it.
+        if (isinstance(expression, (algebra.And, algebra.Or)) and
+            isinstance(expression.left, values.Boolean)):
+            absorbing = isinstance(expression, algebra.Or)
+
+            if expression.left.value != absorbing:
+                return expression.right
+            elif not self.summarize(expression.right).impure:
+                return expression.left
+
+        return expression
+
+    def fold_conditional(self, expression):
+        """
+        Prune the branch of a conditional which can't be taken.
+        """
+        if isinstance(expression.condition, values.Boolean):
+            if expression.condition.value:
+                return expression.on_true
+            else:
+                return expression.on_false
+
+        return expression
+
+    def decide_binding(self, expression, value):
+        """
+        Decide how to rewrite the binding of a variable, which the decompiler
+        translates into Application(Lambda(Identifier(name), body), value),
+        once value is simplified.
+
+        Lambdas don't capture their environment when they are evaluated, so
+        the body of a Lambda which is called from inside of body (e.g. the
+        on_loop function of a loop, which reads the variables that were bound
+        before the call) might read the variable as well. As we can't tell
+        which function is going to be called, we leave the binding alone if
+        body calls anything else than a Lambda that it defines itself.
+        """
+        name = expression.function.parameter.name
+        body = expression.function.body
+
+        body_summary = self.summarize(body)
+        value_summary = self.summarize(value)
+
+        if body_summary.opaque:
+            return KEEP
+
+        if name not in body_summary.variables:
+            if value_summary.impure:
+                return KEEP
+            else:
+                return DROP
+
+        (count, binders) = body_summary.variables[name]
+
+        if any(variable in binders for variable in value_summary.variables):
+            # A variable would be captured by a Lambda of body if we inlined
+            # it, e.g. when the loop variables of nested comprehensions have
+            # the same name. As body only calls the Lambdas it defines, we
+            # can rename their parameters instead, and inline it next time.
+            if isinstance(value, functions.Identifier):
+                return RENAME
+            else:
+                return KEEP
+
+        if name in body_summary.shared:
+            return KEEP
+
+        # Constants and variables are cheap enough to be duplicated, but other
+        # values must only be inlined if they would still be evaluated at most
+        # once, i.e. if they are used once and outside of any Lambda.
+        if isinstance(value, (values.Value, functions.Identifier)):
+            return INLINE
+        elif count == 1 and len(binders) == 0 and not value_summary.impure:
+            return INLINE
+        else:
+            return KEEP
+
+    def keep_binding(self, expression, body, value, rename):
+        """
+        Rebuild a binding that we don't inline with its simplified body and
+        value, renaming the parameters of the Lambdas of body which would
+        capture value if rename is True.
+        """
+        function = expression.function
+
+        if rename:
+            body = rename_binders(body, value.name, utils.identifiers(
+                functions.Application(
+                    functions.Lambda(function.parameter, body), value)))
+
+        return rebuild(expression, [rebuild(function, [function.parameter,
+                                                       body]),
+                                    value])
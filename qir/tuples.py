@@ -25,12 +25,22 @@ class TupleNil(TupleConstr):
 
 
 class TupleCons(TupleConstr):
-    """ A QIR expression representing the (::) tuple constructor. """
+    """
+    A QIR expression representing the (::) tuple constructor.
+
+    The tuples output by the grouping operators (see operators.Grouping) can
+    be long, and are looked up once per element after decorrelation, so they
+    also keep a dict from their decoded keys to their values in lookups,
+    which TupleDestr uses instead of walking the tuple. The lookups of every
+    other tuple are None.
+    """
     fields = (
         ('key', base.Expression),
         ('value', base.Expression),
         ('tail', base.Expression))
 
+    lookups = None
+
     def evaluate_locally(self, environment={}):
         return TupleCons(
             self.key.evaluate_locally(environment),
@@ -53,17 +63,35 @@ class TupleDestr(base.Expression):
         input = self.input.evaluate_locally(environment)
         key = self.key.evaluate_locally(environment)
 
-        if not isinstance(key, values.String):
-            return values.Null
-
-        def traverse(input):
-            if isinstance(input, TupleNil):
-                return values.Null
-            elif isinstance(input, TupleCons) and input.key == key:
+        # Records only have String keys, but the tuples built by the grouping
+        # operators can have any key, which we then compare with the decoded
+        # key, using their lookups if we can.
+        if isinstance(input, TupleCons) and input.lookups is not None:
+            try:
+                return input.lookups.get(key.decode(), values.Null())
+            except TypeError:
+                pass
+
+        if isinstance(key, values.String):
+            def matches(other):
+                return (isinstance(other, values.String) and
+                        other.value == key.value)
+        else:
+            decoded = key.decode()
+
+            def matches(other):
+                return (not isinstance(other, values.String) and
+                        other.decode() == decoded)
+
+        # The tuples built by the grouping operators can be long, so we don't
+        # use recursion.
+        while isinstance(input, TupleCons):
+            if matches(input.key):
                 return input.value
-            elif isinstance(input, TupleCons):
-                return traverse(input.tail)
-            else:
-                raise TypeError
 
-        return traverse(input)
+            input = input.tail
+
+        if not isinstance(input, TupleNil):
+            raise TypeError
+
+        return values.Null()
@@ -63,7 +63,7 @@ def unserialize(message):
         raise errors.NotUnserializableError
 
     expression_type = message.WhichOneof('node')
-    expression_class = globals()[expression_type]
+    expression_class = find_expression_class(expression_type)
 
     args = [unserialize(getattr(getattr(message, expression_type), field[0]))
             for field in expression_class.fields]
@@ -71,6 +71,30 @@ def unserialize(message):
     return expression_class(*args)
 
 
+# A mapping from the names of the QIR expression classes to the classes.
+# This will be filled lazily by find_expression_class.
+EXPRESSION_CLASSES = {}
+
+
+def find_expression_class(name):
+    """
+    Find the QIR expression class with the given name.
+
+    We can't simply look the name up in globals(), as this module is imported
+    before most of the QIR expression classes are defined, so we walk the
+    class hierarchy the first time we are asked for a given name.
+    """
+    if name not in EXPRESSION_CLASSES:
+        classes = [base.Expression]
+
+        while len(classes) > 0:
+            current = classes.pop()
+            EXPRESSION_CLASSES[current.__name__] = current
+            classes.extend(current.__subclasses__())
+
+    return EXPRESSION_CLASSES[name]
+
+
 def encode(value):
     if value is None:
         return Null()
@@ -84,18 +108,22 @@ def encode(value):
         return String(value)
     elif isinstance(value, dict):
         return encode_dict(value)
+    elif isinstance(value, range):
+        return encode_range(value)
     elif isinstance(value, collections.Iterable):
         return encode_list(list(value))
     elif isinstance(value, types.FunctionType):
         return encode(value.__code__)
     elif isinstance(value, types.CodeType):
-        from . import decompile
-        return decompile.decompile(value)
+        from . import cache
+        return cache.default_cache.decompile(value)
 
     raise TypeError('Got %s' % value)
 
 
 def encode_dict(source):
+    from .tuples import TupleNil, TupleCons
+
     inner = TupleNil()
     for key in source:
         inner = TupleCons(String(key), encode(source[key]), inner)
@@ -103,25 +131,95 @@ def encode_dict(source):
 
 
 def encode_list(source):
+    from .lists import ListNil, ListCons
+
     inner = ListNil()
-    for value in source:
+    for value in reversed(source):
         inner = ListCons(encode(value), inner)
     return inner
 
 
+def encode_range(source):
+    from .lists import Range
+
+    return Range(
+        Number(source.start), Number(source.stop), Number(source.step))
+
+
 def decode(expression):
     return expression.decode()
 
 
 def substitute(expression, environment):
+    """
+    Replace the identifiers of an expression with their values in the
+    environment.
+
+    The values might use the names of some of the Lambdas of the expression,
+    e.g. when the loop variable of a comprehension is substituted into a
+    nested comprehension whose own loop variable has the same name, so we
+    rename the parameters of those Lambdas to avoid capturing the values.
+    """
+    from .functions import Identifier, Lambda
+
+    captured = set()
+
+    for value in environment.values():
+        captured.update(identifiers(value))
+
+    def traverse(expression):
+        if (isinstance(expression, Identifier) and
+            expression.name in environment):
+            return environment[expression.name]
+
+        elif (isinstance(expression, Lambda) and
+              expression.parameter.name in captured and
+              expression.parameter.name not in environment):
+            parameter = expression.parameter.name
+            avoided = captured | identifiers(expression)
+            suffix = 1
+
+            while parameter + '_' + str(suffix) in avoided:
+                suffix += 1
+
+            renamed = substitute(
+                expression,
+                {parameter: Identifier(parameter + '_' + str(suffix))})
+
+            return traverse(renamed)
+
+        elif isinstance(expression, base.Expression):
+            args = [traverse(getattr(expression, field[0]))
+                    for field in expression.fields]
+            return expression.__class__(*args)
+
+        else:
+            return expression
+
+    return traverse(expression)
+
+
+def identifiers(expression):
+    """
+    Return the set of the names of the identifiers in an expression.
+    """
     from .functions import Identifier
 
-    if (isinstance(expression, Identifier) and
-        expression.name in environment):
-        return environment[expression.name]
-    elif isinstance(expression, base.Expression):
-        args = [substitute(getattr(expression, field[0]), environment)
-                for field in expression.fields]
-        return expression.__class__(*args)
-    else:
-        return expression
+    names = set()
+    pending = [expression]
+    visited = set()
+
+    while len(pending) > 0:
+        current = pending.pop()
+
+        if id(current) in visited or not isinstance(current, base.Expression):
+            continue
+
+        visited.add(id(current))
+
+        if isinstance(current, Identifier):
+            names.add(current.name)
+
+        pending.extend(getattr(current, field[0]) for field in current.fields)
+
+    return names
@@ -1,13 +1,11 @@
+# -*- coding: utf-8 -*-
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: qir.proto
 
-import sys
-_b=sys.version_info[0]<3 and (lambda x:x) or (lambda x:x.encode('latin1'))
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from google.protobuf import reflection as _reflection
 from google.protobuf import symbol_database as _symbol_database
-from google.protobuf import descriptor_pb2
 # @@protoc_insertion_point(imports)
 
 _sym_db = _symbol_database.Default()
@@ -19,9 +17,9 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   name='qir.proto',
   package='',
   syntax='proto3',
-  serialized_pb=_b('\n\tqir.proto\"\x06\n\x04Null\"\x17\n\x06Number\x12\r\n\x05value\x18\x01 \x01(\x05\"\x17\n\x06\x44ouble\x12\r\n\x05value\x18\x01 \x01(\x01\"\x17\n\x06String\x12\r\n\x05value\x18\x01 \x01(\t\"\x18\n\x07\x42oolean\x12\r\n\x05value\x18\x01 \x01(\x08\"\"\n\x04Scan\x12\x1a\n\x05table\x18\x01 \x01(\x0b\x32\x0b.Expression\"B\n\x07Project\x12\x1b\n\x06\x66ormat\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05input\x18\x02 \x01(\x0b\x32\x0b.Expression\"A\n\x06\x46ilter\x12\x1b\n\x06\x66ilter\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05input\x18\x02 \x01(\x0b\x32\x0b.Expression\"]\n\x04Sort\x12\x19\n\x04rows\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1e\n\tascending\x18\x02 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05input\x18\x03 \x01(\x0b\x32\x0b.Expression\"?\n\x05Limit\x12\x1a\n\x05limit\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05input\x18\x02 \x01(\x0b\x32\x0b.Expression\">\n\x05Group\x12\x19\n\x04rows\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05input\x18\x02 \x01(\x0b\x32\x0b.Expression\"Z\n\x04Join\x12\x1b\n\x06\x66ilter\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x19\n\x04left\x18\x02 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x03 \x01(\x0b\x32\x0b.Expression\"#\n\x03Not\x12\x1c\n\x07\x65lement\x18\x01 \x01(\x0b\x32\x0b.Expression\"<\n\x03\x44iv\x12\x19\n\x04left\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x02 \x01(\x0b\x32\x0b.Expression\">\n\x05Minus\x12\x19\n\x04left\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x02 \x01(\x0b\x32\x0b.Expression\"<\n\x03Mod\x12\x19\n\x04left\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x02 \x01(\x0b\x32\x0b.Expression\"=\n\x04Plus\x12\x19\n\x04left\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x02 \x01(\x0b\x32\x0b.Expression\"=\n\x04Star\x12\x19\n\x04left\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x02 \x01(\x0b\x32\x0b.Expression\">\n\x05Power\x12\x19\n\x04left\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x02 \x01(\x0b\x32\x0b.Expression\"<\n\x03\x41nd\x12\x19\n\x04left\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x02 \x01(\x0b\x32\x0b.Expression\";\n\x02Or\x12\x19\n\x04left\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x02 \x01(\x0b\x32\x0b.Expression\">\n\x05\x45qual\x12\x19\n\x04left\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x02 \x01(\x0b\x32\x0b.Expression\"E\n\x0cLowerOrEqual\x12\x19\n\x04left\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x02 \x01(\x0b\x32\x0b.Expression\"B\n\tLowerThan\x12\x19\n\x04left\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x02 \x01(\x0b\x32\x0b.Expression\"G\n\x0eGreaterOrEqual\x12\x19\n\x04left\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x02 \x01(\x0b\x32\x0b.Expression\"D\n\x0bGreaterThan\x12\x19\n\x04left\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x02 \x01(\x0b\x32\x0b.Expression\"\x1a\n\nIdentifier\x12\x0c\n\x04name\x18\x01 \x01(\t\"C\n\x06Lambda\x12\x1e\n\tparameter\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x19\n\x04\x62ody\x18\x02 \x01(\x0b\x32\x0b.Expression\"\x07\n\x05\x46ixed\"K\n\x0b\x41pplication\x12\x1d\n\x08\x66unction\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1d\n\x08\x61rgument\x18\x02 \x01(\x0b\x32\x0b.Expression\"j\n\x0b\x43onditional\x12\x1e\n\tcondition\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1c\n\x07on_true\x18\x02 \x01(\x0b\x32\x0b.Expression\x12\x1d\n\x08on_false\x18\x03 \x01(\x0b\x32\x0b.Expression\"\t\n\x07ListNil\"@\n\x08ListCons\x12\x19\n\x04head\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x19\n\x04tail\x18\x02 \x01(\x0b\x32\x0b.Expression\"b\n\tListDestr\x12\x1a\n\x05input\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1b\n\x06on_nil\x18\x02 \x01(\x0b\x32\x0b.Expression\x12\x1c\n\x07on_cons\x18\x03 \x01(\x0b\x32\x0b.Expression\"\n\n\x08TupleNil\"\\\n\tTupleCons\x12\x18\n\x03key\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05value\x18\x02 \x01(\x0b\x32\x0b.Expression\x12\x19\n\x04tail\x18\x03 \x01(\x0b\x32\x0b.Expression\"B\n\nTupleDestr\x12\x1a\n\x05input\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x18\n\x03key\x18\x02 \x01(\x0b\x32\x0b.Expression\"\'\n\x07\x42uiltin\x12\x0e\n\x06module\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\"\x18\n\x08\x42ytecode\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x0c\"h\n\x08\x44\x61tabase\x12\x0e\n\x06\x64river\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04host\x18\x03 \x01(\t\x12\x0c\n\x04port\x18\x04 \x01(\x05\x12\x10\n\x08username\x18\x05 \x01(\t\x12\x10\n\x08password\x18\x06 \x01(\t\"2\n\x05Table\x12\x1b\n\x08\x64\x61tabase\x18\x01 \x01(\x0b\x32\t.Database\x12\x0c\n\x04name\x18\x02 \x01(\t\"\x96\t\n\nExpression\x12\x15\n\x04Null\x18\x01 \x01(\x0b\x32\x05.NullH\x00\x12\x19\n\x06Number\x18\x02 \x01(\x0b\x32\x07.NumberH\x00\x12\x19\n\x06\x44ouble\x18\x03 \x01(\x0b\x32\x07.DoubleH\x00\x12\x19\n\x06String\x18\x04 \x01(\x0b\x32\x07.StringH\x00\x12\x1b\n\x07\x42oolean\x18\x05 \x01(\x0b\x32\x08.BooleanH\x00\x12\x15\n\x04Scan\x18\x0b \x01(\x0b\x32\x05.ScanH\x00\x12\x19\n\x06\x46ilter\x18\x0c \x01(\x0b\x32\x07.FilterH\x00\x12\x1b\n\x07Project\x18\r \x01(\x0b\x32\x08.ProjectH\x00\x12\x15\n\x04Sort\x18\x0e \x01(\x0b\x32\x05.SortH\x00\x12\x17\n\x05Limit\x18\x0f \x01(\x0b\x32\x06.LimitH\x00\x12\x17\n\x05Group\x18\x10 \x01(\x0b\x32\x06.GroupH\x00\x12\x15\n\x04Join\x18\x11 \x01(\x0b\x32\x05.JoinH\x00\x12\x13\n\x03Not\x18\x15 \x01(\x0b\x32\x04.NotH\x00\x12\x13\n\x03\x44iv\x18\x16 \x01(\x0b\x32\x04.DivH\x00\x12\x17\n\x05Minus\x18\x17 \x01(\x0b\x32\x06.MinusH\x00\x12\x13\n\x03Mod\x18\x18 \x01(\x0b\x32\x04.ModH\x00\x12\x15\n\x04Plus\x18\x19 \x01(\x0b\x32\x05.PlusH\x00\x12\x15\n\x04Star\x18\x1a \x01(\x0b\x32\x05.StarH\x00\x12\x17\n\x05Power\x18\x1b \x01(\x0b\x32\x06.PowerH\x00\x12\x13\n\x03\x41nd\x18\x1c \x01(\x0b\x32\x04.AndH\x00\x12\x11\n\x02Or\x18\x1d \x01(\x0b\x32\x03.OrH\x00\x12\x17\n\x05\x45qual\x18\x1e \x01(\x0b\x32\x06.EqualH\x00\x12%\n\x0cLowerOrEqual\x18\x1f \x01(\x0b\x32\r.LowerOrEqualH\x00\x12\x1f\n\tLowerThan\x18  \x01(\x0b\x32\n.LowerThanH\x00\x12)\n\x0eGreaterOrEqual\x18! \x01(\x0b\x32\x0f.GreaterOrEqualH\x00\x12#\n\x0bGreaterThan\x18\" \x01(\x0b\x32\x0c.GreaterThanH\x00\x12!\n\nIdentifier\x18) \x01(\x0b\x32\x0b.IdentifierH\x00\x12\x19\n\x06Lambda\x18* \x01(\x0b\x32\x07.LambdaH\x00\x12\x18\n\x05\x46ixed\x18+ \x01(\x0b\x32\x07.LambdaH\x00\x12#\n\x0b\x41pplication\x18, \x01(\x0b\x32\x0c.ApplicationH\x00\x12#\n\x0b\x43onditional\x18- \x01(\x0b\x32\x0c.ConditionalH\x00\x12\x1b\n\x07ListNil\x18\x33 \x01(\x0b\x32\x08.ListNilH\x00\x12\x1d\n\x08ListCons\x18\x34 \x01(\x0b\x32\t.ListConsH\x00\x12\x1f\n\tListDestr\x18\x35 \x01(\x0b\x32\n.ListDestrH\x00\x12\x1d\n\x08TupleNil\x18= \x01(\x0b\x32\t.TupleNilH\x00\x12\x1f\n\tTupleCons\x18> \x01(\x0b\x32\n.TupleConsH\x00\x12!\n\nTupleDestr\x18? \x01(\x0b\x32\x0b.TupleDestrH\x00\x12\x1b\n\x07\x42uiltin\x18G \x01(\x0b\x32\x08.BuiltinH\x00\x12\x1d\n\x08\x42ytecode\x18H \x01(\x0b\x32\t.BytecodeH\x00\x12\x1d\n\x08\x44\x61tabase\x18I \x01(\x0b\x32\t.DatabaseH\x00\x12\x17\n\x05Table\x18J \x01(\x0b\x32\x06.TableH\x00\x42\x06\n\x04node23\n\tEvaluator\x12&\n\x08\x45valuate\x12\x0b.Expression\x1a\x0b.Expression\"\x00\x62\x06proto3')
+  serialized_options=None,
+  serialized_pb=b'\n\tqir.proto\"\x06\n\x04Null\"\x17\n\x06Number\x12\r\n\x05value\x18\x01 \x01(\x05\"\x17\n\x06\x44ouble\x12\r\n\x05value\x18\x01 \x01(\x01\"\x17\n\x06String\x12\r\n\x05value\x18\x01 \x01(\t\"\x18\n\x07\x42oolean\x12\r\n\x05value\x18\x01 \x01(\x08\"\"\n\x04Scan\x12\x1a\n\x05table\x18\x01 \x01(\x0b\x32\x0b.Expression\"B\n\x07Project\x12\x1b\n\x06\x66ormat\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05input\x18\x02 \x01(\x0b\x32\x0b.Expression\"A\n\x06\x46ilter\x12\x1b\n\x06\x66ilter\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05input\x18\x02 \x01(\x0b\x32\x0b.Expression\"]\n\x04Sort\x12\x19\n\x04rows\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1e\n\tascending\x18\x02 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05input\x18\x03 \x01(\x0b\x32\x0b.Expression\"?\n\x05Limit\x12\x1a\n\x05limit\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05input\x18\x02 \x01(\x0b\x32\x0b.Expression\"A\n\x06Offset\x12\x1b\n\x06offset\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05input\x18\x02 \x01(\x0b\x32\x0b.Expression\">\n\x05Group\x12\x19\n\x04rows\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05input\x18\x02 \x01(\x0b\x32\x0b.Expression\"[\n\x07GroupBy\x12\x18\n\x03key\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05value\x18\x02 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05input\x18\x03 \x01(\x0b\x32\x0b.Expression\"[\n\x07IndexBy\x12\x18\n\x03key\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05value\x18\x02 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05input\x18\x03 \x01(\x0b\x32\x0b.Expression\"&\n\x08\x44istinct\x12\x1a\n\x05input\x18\x01 \x01(\x0b\x32\x0b.Expression\"%\n\x07\x46latten\x12\x1a\n\x05input\x18\x01 \x01(\x0b\x32\x0b.Expression\"Z\n\x04Join\x12\x1b\n\x06\x66ilter\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x19\n\x04left\x18\x02 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x03 \x01(\x0b\x32\x0b.Expression\"^\n\x08SemiJoin\x12\x1b\n\x06\x66ilter\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x19\n\x04left\x18\x02 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x03 \x01(\x0b\x32\x0b.Expression\"^\n\x08\x41ntiJoin\x12\x1b\n\x06\x66ilter\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x19\n\x04left\x18\x02 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x03 \x01(\x0b\x32\x0b.Expression\"!\n\x03Sum\x12\x1a\n\x05input\x18\x01 \x01(\x0b\x32\x0b.Expression\"#\n\x05\x43ount\x12\x1a\n\x05input\x18\x01 \x01(\x0b\x32\x0b.Expression\"!\n\x03Min\x12\x1a\n\x05input\x18\x01 \x01(\x0b\x32\x0b.Expression\"!\n\x03Max\x12\x1a\n\x05input\x18\x01 \x01(\x0b\x32\x0b.Expression\"!\n\x03\x41ny\x12\x1a\n\x05input\x18\x01 \x01(\x0b\x32\x0b.Expression\"!\n\x03\x41ll\x12\x1a\n\x05input\x18\x01 \x01(\x0b\x32\x0b.Expression\"#\n\x03Not\x12\x1c\n\x07\x65lement\x18\x01 \x01(\x0b\x32\x0b.Expression\"&\n\x06IsNull\x12\x1c\n\x07\x65lement\x18\x01 \x01(\x0b\x32\x0b.Expression\"<\n\x03\x44iv\x12\x19\n\x04left\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x02 \x01(\x0b\x32\x0b.Expression\">\n\x05Minus\x12\x19\n\x04left\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x02 \x01(\x0b\x32\x0b.Expression\"<\n\x03Mod\x12\x19\n\x04left\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x02 \x01(\x0b\x32\x0b.Expression\"=\n\x04Plus\x12\x19\n\x04left\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x02 \x01(\x0b\x32\x0b.Expression\"=\n\x04Star\x12\x19\n\x04left\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x02 \x01(\x0b\x32\x0b.Expression\">\n\x05Power\x12\x19\n\x04left\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x02 \x01(\x0b\x32\x0b.Expression\"<\n\x03\x41nd\x12\x19\n\x04left\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x02 \x01(\x0b\x32\x0b.Expression\";\n\x02Or\x12\x19\n\x04left\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x02 \x01(\x0b\x32\x0b.Expression\">\n\x05\x45qual\x12\x19\n\x04left\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x02 \x01(\x0b\x32\x0b.Expression\"E\n\x0cLowerOrEqual\x12\x19\n\x04left\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x02 \x01(\x0b\x32\x0b.Expression\"B\n\tLowerThan\x12\x19\n\x04left\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x02 \x01(\x0b\x32\x0b.Expression\"G\n\x0eGreaterOrEqual\x12\x19\n\x04left\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x02 \x01(\x0b\x32\x0b.Expression\"D\n\x0bGreaterThan\x12\x19\n\x04left\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05right\x18\x02 \x01(\x0b\x32\x0b.Expression\"=\n\x02In\x12\x1c\n\x07\x65lement\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x19\n\x04list\x18\x02 \x01(\x0b\x32\x0b.Expression\"\x1a\n\nIdentifier\x12\x0c\n\x04name\x18\x01 \x01(\t\"C\n\x06Lambda\x12\x1e\n\tparameter\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x19\n\x04\x62ody\x18\x02 \x01(\x0b\x32\x0b.Expression\"\x07\n\x05\x46ixed\"K\n\x0b\x41pplication\x12\x1d\n\x08\x66unction\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1d\n\x08\x61rgument\x18\x02 \x01(\x0b\x32\x0b.Expression\"j\n\x0b\x43onditional\x12\x1e\n\tcondition\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1c\n\x07on_true\x18\x02 \x01(\x0b\x32\x0b.Expression\x12\x1d\n\x08on_false\x18\x03 \x01(\x0b\x32\x0b.Expression\"\t\n\x07ListNil\"@\n\x08ListCons\x12\x19\n\x04head\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x19\n\x04tail\x18\x02 \x01(\x0b\x32\x0b.Expression\"b\n\tListDestr\x12\x1a\n\x05input\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1b\n\x06on_nil\x18\x02 \x01(\x0b\x32\x0b.Expression\x12\x1c\n\x07on_cons\x18\x03 \x01(\x0b\x32\x0b.Expression\"Y\n\x05Range\x12\x1a\n\x05start\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x19\n\x04stop\x18\x02 \x01(\x0b\x32\x0b.Expression\x12\x19\n\x04step\x18\x03 \x01(\x0b\x32\x0b.Expression\"\n\n\x08TupleNil\"\\\n\tTupleCons\x12\x18\n\x03key\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x1a\n\x05value\x18\x02 \x01(\x0b\x32\x0b.Expression\x12\x19\n\x04tail\x18\x03 \x01(\x0b\x32\x0b.Expression\"B\n\nTupleDestr\x12\x1a\n\x05input\x18\x01 \x01(\x0b\x32\x0b.Expression\x12\x18\n\x03key\x18\x02 \x01(\x0b\x32\x0b.Expression\"\'\n\x07\x42uiltin\x12\x0e\n\x06module\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\"\x18\n\x08\x42ytecode\x12\x0c\n\x04\x63ode\x18\x01 \x01(\x0c\"h\n\x08\x44\x61tabase\x12\x0e\n\x06\x64river\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x0c\n\x04host\x18\x03 \x01(\t\x12\x0c\n\x04port\x18\x04 \x01(\x05\x12\x10\n\x08username\x18\x05 \x01(\t\x12\x10\n\x08password\x18\x06 \x01(\t\"2\n\x05Table\x12\x1b\n\x08\x64\x61tabase\x18\x01 \x01(\x0b\x32\t.Database\x12\x0c\n\x04name\x18\x02 \x01(\t\"\xae\x0c\n\nExpression\x12\x15\n\x04Null\x18\x01 \x01(\x0b\x32\x05.NullH\x00\x12\x19\n\x06Number\x18\x02 \x01(\x0b\x32\x07.NumberH\x00\x12\x19\n\x06\x44ouble\x18\x03 \x01(\x0b\x32\x07.DoubleH\x00\x12\x19\n\x06String\x18\x04 \x01(\x0b\x32\x07.StringH\x00\x12\x1b\n\x07\x42oolean\x18\x05 \x01(\x0b\x32\x08.BooleanH\x00\x12\x15\n\x04Scan\x18\x0b \x01(\x0b\x32\x05.ScanH\x00\x12\x19\n\x06\x46ilter\x18\x0c \x01(\x0b\x32\x07.FilterH\x00\x12\x1b\n\x07Project\x18\r \x01(\x0b\x32\x08.ProjectH\x00\x12\x15\n\x04Sort\x18\x0e \x01(\x0b\x32\x05.SortH\x00\x12\x17\n\x05Limit\x18\x0f \x01(\x0b\x32\x06.LimitH\x00\x12\x17\n\x05Group\x18\x10 \x01(\x0b\x32\x06.GroupH\x00\x12\x15\n\x04Join\x18\x11 \x01(\x0b\x32\x05.JoinH\x00\x12\x1d\n\x08SemiJoin\x18\x12 \x01(\x0b\x32\t.SemiJoinH\x00\x12\x1d\n\x08\x41ntiJoin\x18\x13 \x01(\x0b\x32\t.AntiJoinH\x00\x12\x1d\n\x08\x44istinct\x18\x14 \x01(\x0b\x32\t.DistinctH\x00\x12\x13\n\x03Not\x18\x15 \x01(\x0b\x32\x04.NotH\x00\x12\x13\n\x03\x44iv\x18\x16 \x01(\x0b\x32\x04.DivH\x00\x12\x17\n\x05Minus\x18\x17 \x01(\x0b\x32\x06.MinusH\x00\x12\x13\n\x03Mod\x18\x18 \x01(\x0b\x32\x04.ModH\x00\x12\x15\n\x04Plus\x18\x19 \x01(\x0b\x32\x05.PlusH\x00\x12\x15\n\x04Star\x18\x1a \x01(\x0b\x32\x05.StarH\x00\x12\x17\n\x05Power\x18\x1b \x01(\x0b\x32\x06.PowerH\x00\x12\x13\n\x03\x41nd\x18\x1c \x01(\x0b\x32\x04.AndH\x00\x12\x11\n\x02Or\x18\x1d \x01(\x0b\x32\x03.OrH\x00\x12\x17\n\x05\x45qual\x18\x1e \x01(\x0b\x32\x06.EqualH\x00\x12%\n\x0cLowerOrEqual\x18\x1f \x01(\x0b\x32\r.LowerOrEqualH\x00\x12\x1f\n\tLowerThan\x18  \x01(\x0b\x32\n.LowerThanH\x00\x12)\n\x0eGreaterOrEqual\x18! \x01(\x0b\x32\x0f.GreaterOrEqualH\x00\x12#\n\x0bGreaterThan\x18\" \x01(\x0b\x32\x0c.GreaterThanH\x00\x12\x19\n\x06IsNull\x18# \x01(\x0b\x32\x07.IsNullH\x00\x12\x11\n\x02In\x18$ \x01(\x0b\x32\x03.InH\x00\x12!\n\nIdentifier\x18) \x01(\x0b\x32\x0b.IdentifierH\x00\x12\x19\n\x06Lambda\x18* \x01(\x0b\x32\x07.LambdaH\x00\x12\x18\n\x05\x46ixed\x18+ \x01(\x0b\x32\x07.LambdaH\x00\x12#\n\x0b\x41pplication\x18, \x01(\x0b\x32\x0c.ApplicationH\x00\x12#\n\x0b\x43onditional\x18- \x01(\x0b\x32\x0c.ConditionalH\x00\x12\x1b\n\x07ListNil\x18\x33 \x01(\x0b\x32\x08.ListNilH\x00\x12\x1d\n\x08ListCons\x18\x34 \x01(\x0b\x32\t.ListConsH\x00\x12\x1f\n\tListDestr\x18\x35 \x01(\x0b\x32\n.ListDestrH\x00\x12\x17\n\x05Range\x18\x36 \x01(\x0b\x32\x06.RangeH\x00\x12\x1d\n\x08TupleNil\x18= \x01(\x0b\x32\t.TupleNilH\x00\x12\x1f\n\tTupleCons\x18> \x01(\x0b\x32\n.TupleConsH\x00\x12!\n\nTupleDestr\x18? \x01(\x0b\x32\x0b.TupleDestrH\x00\x12\x1b\n\x07\x42uiltin\x18G \x01(\x0b\x32\x08.BuiltinH\x00\x12\x1d\n\x08\x42ytecode\x18H \x01(\x0b\x32\t.BytecodeH\x00\x12\x1d\n\x08\x44\x61tabase\x18I \x01(\x0b\x32\t.DatabaseH\x00\x12\x17\n\x05Table\x18J \x01(\x0b\x32\x06.TableH\x00\x12\x13\n\x03Sum\x18Q \x01(\x0b\x32\x04.SumH\x00\x12\x17\n\x05\x43ount\x18R \x01(\x0b\x32\x06.CountH\x00\x12\x13\n\x03Min\x18S \x01(\x0b\x32\x04.MinH\x00\x12\x13\n\x03Max\x18T \x01(\x0b\x32\x04.MaxH\x00\x12\x13\n\x03\x41ny\x18U \x01(\x0b\x32\x04.AnyH\x00\x12\x13\n\x03\x41ll\x18V \x01(\x0b\x32\x04.AllH\x00\x12\x1b\n\x07GroupBy\x18[ \x01(\x0b\x32\x08.GroupByH\x00\x12\x1b\n\x07IndexBy\x18\\ \x01(\x0b\x32\x08.IndexByH\x00\x12\x1b\n\x07\x46latten\x18] \x01(\x0b\x32\x08.FlattenH\x00\x12\x19\n\x06Offset\x18^ \x01(\x0b\x32\x07.OffsetH\x00\x42\x06\n\x04node2c\n\tEvaluator\x12&\n\x08\x45valuate\x12\x0b.Expression\x1a\x0b.Expression\"\x00\x12.\n\x0e\x45valuateStream\x12\x0b.Expression\x1a\x0b.Expression\"\x00\x30\x01\x62\x06proto3'
 )
-_sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
 
 
@@ -39,7 +37,7 @@ _NULL = _descriptor.Descriptor(
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
@@ -63,14 +61,14 @@ _NUMBER = _descriptor.Descriptor(
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
@@ -94,14 +92,14 @@ _DOUBLE = _descriptor.Descriptor(
       has_default_value=False, default_value=float(0),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
@@ -122,17 +120,17 @@ _STRING = _descriptor.Descriptor(
     _descriptor.FieldDescriptor(
       name='value', full_name='String.value', index=0,
       number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
@@ -151,330 +149,827 @@ _BOOLEAN = _descriptor.Descriptor(
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='value', full_name='Boolean.value', index=0,
-      number=1, type=8, cpp_type=7, label=1,
-      has_default_value=False, default_value=False,
+      name='value', full_name='Boolean.value', index=0,
+      number=1, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=96,
+  serialized_end=120,
+)
+
+
+_SCAN = _descriptor.Descriptor(
+  name='Scan',
+  full_name='Scan',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='table', full_name='Scan.table', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=122,
+  serialized_end=156,
+)
+
+
+_PROJECT = _descriptor.Descriptor(
+  name='Project',
+  full_name='Project',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='format', full_name='Project.format', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='input', full_name='Project.input', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=158,
+  serialized_end=224,
+)
+
+
+_FILTER = _descriptor.Descriptor(
+  name='Filter',
+  full_name='Filter',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='filter', full_name='Filter.filter', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='input', full_name='Filter.input', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=226,
+  serialized_end=291,
+)
+
+
+_SORT = _descriptor.Descriptor(
+  name='Sort',
+  full_name='Sort',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='rows', full_name='Sort.rows', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='ascending', full_name='Sort.ascending', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='input', full_name='Sort.input', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=293,
+  serialized_end=386,
+)
+
+
+_LIMIT = _descriptor.Descriptor(
+  name='Limit',
+  full_name='Limit',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='limit', full_name='Limit.limit', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='input', full_name='Limit.input', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=388,
+  serialized_end=451,
+)
+
+
+_OFFSET = _descriptor.Descriptor(
+  name='Offset',
+  full_name='Offset',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='offset', full_name='Offset.offset', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='input', full_name='Offset.input', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=453,
+  serialized_end=518,
+)
+
+
+_GROUP = _descriptor.Descriptor(
+  name='Group',
+  full_name='Group',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='rows', full_name='Group.rows', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='input', full_name='Group.input', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=520,
+  serialized_end=582,
+)
+
+
+_GROUPBY = _descriptor.Descriptor(
+  name='GroupBy',
+  full_name='GroupBy',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='GroupBy.key', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='GroupBy.value', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='input', full_name='GroupBy.input', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=584,
+  serialized_end=675,
+)
+
+
+_INDEXBY = _descriptor.Descriptor(
+  name='IndexBy',
+  full_name='IndexBy',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='key', full_name='IndexBy.key', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='value', full_name='IndexBy.value', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='input', full_name='IndexBy.input', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=677,
+  serialized_end=768,
+)
+
+
+_DISTINCT = _descriptor.Descriptor(
+  name='Distinct',
+  full_name='Distinct',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='input', full_name='Distinct.input', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=770,
+  serialized_end=808,
+)
+
+
+_FLATTEN = _descriptor.Descriptor(
+  name='Flatten',
+  full_name='Flatten',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='input', full_name='Flatten.input', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=810,
+  serialized_end=847,
+)
+
+
+_JOIN = _descriptor.Descriptor(
+  name='Join',
+  full_name='Join',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='filter', full_name='Join.filter', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='left', full_name='Join.left', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='right', full_name='Join.right', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=849,
+  serialized_end=939,
+)
+
+
+_SEMIJOIN = _descriptor.Descriptor(
+  name='SemiJoin',
+  full_name='SemiJoin',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='filter', full_name='SemiJoin.filter', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='left', full_name='SemiJoin.left', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='right', full_name='SemiJoin.right', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=941,
+  serialized_end=1035,
+)
+
+
+_ANTIJOIN = _descriptor.Descriptor(
+  name='AntiJoin',
+  full_name='AntiJoin',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='filter', full_name='AntiJoin.filter', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='left', full_name='AntiJoin.left', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='right', full_name='AntiJoin.right', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=96,
-  serialized_end=120,
+  serialized_start=1037,
+  serialized_end=1131,
 )
 
 
-_SCAN = _descriptor.Descriptor(
-  name='Scan',
-  full_name='Scan',
+_SUM = _descriptor.Descriptor(
+  name='Sum',
+  full_name='Sum',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='table', full_name='Scan.table', index=0,
+      name='input', full_name='Sum.input', index=0,
       number=1, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=122,
-  serialized_end=156,
+  serialized_start=1133,
+  serialized_end=1166,
 )
 
 
-_PROJECT = _descriptor.Descriptor(
-  name='Project',
-  full_name='Project',
+_COUNT = _descriptor.Descriptor(
+  name='Count',
+  full_name='Count',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='format', full_name='Project.format', index=0,
+      name='input', full_name='Count.input', index=0,
       number=1, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='input', full_name='Project.input', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=158,
-  serialized_end=224,
+  serialized_start=1168,
+  serialized_end=1203,
 )
 
 
-_FILTER = _descriptor.Descriptor(
-  name='Filter',
-  full_name='Filter',
+_MIN = _descriptor.Descriptor(
+  name='Min',
+  full_name='Min',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='filter', full_name='Filter.filter', index=0,
+      name='input', full_name='Min.input', index=0,
       number=1, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='input', full_name='Filter.input', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=226,
-  serialized_end=291,
+  serialized_start=1205,
+  serialized_end=1238,
 )
 
 
-_SORT = _descriptor.Descriptor(
-  name='Sort',
-  full_name='Sort',
+_MAX = _descriptor.Descriptor(
+  name='Max',
+  full_name='Max',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='rows', full_name='Sort.rows', index=0,
+      name='input', full_name='Max.input', index=0,
       number=1, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='ascending', full_name='Sort.ascending', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='input', full_name='Sort.input', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=293,
-  serialized_end=386,
+  serialized_start=1240,
+  serialized_end=1273,
 )
 
 
-_LIMIT = _descriptor.Descriptor(
-  name='Limit',
-  full_name='Limit',
+_ANY = _descriptor.Descriptor(
+  name='Any',
+  full_name='Any',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='limit', full_name='Limit.limit', index=0,
+      name='input', full_name='Any.input', index=0,
       number=1, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='input', full_name='Limit.input', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=388,
-  serialized_end=451,
+  serialized_start=1275,
+  serialized_end=1308,
 )
 
 
-_GROUP = _descriptor.Descriptor(
-  name='Group',
-  full_name='Group',
+_ALL = _descriptor.Descriptor(
+  name='All',
+  full_name='All',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='rows', full_name='Group.rows', index=0,
+      name='input', full_name='All.input', index=0,
       number=1, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='input', full_name='Group.input', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=453,
-  serialized_end=515,
+  serialized_start=1310,
+  serialized_end=1343,
 )
 
 
-_JOIN = _descriptor.Descriptor(
-  name='Join',
-  full_name='Join',
+_NOT = _descriptor.Descriptor(
+  name='Not',
+  full_name='Not',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='filter', full_name='Join.filter', index=0,
+      name='element', full_name='Not.element', index=0,
       number=1, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='left', full_name='Join.left', index=1,
-      number=2, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
-    _descriptor.FieldDescriptor(
-      name='right', full_name='Join.right', index=2,
-      number=3, type=11, cpp_type=10, label=1,
-      has_default_value=False, default_value=None,
-      message_type=None, enum_type=None, containing_type=None,
-      is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=517,
-  serialized_end=607,
+  serialized_start=1345,
+  serialized_end=1380,
 )
 
 
-_NOT = _descriptor.Descriptor(
-  name='Not',
-  full_name='Not',
+_ISNULL = _descriptor.Descriptor(
+  name='IsNull',
+  full_name='IsNull',
   filename=None,
   file=DESCRIPTOR,
   containing_type=None,
   fields=[
     _descriptor.FieldDescriptor(
-      name='element', full_name='Not.element', index=0,
+      name='element', full_name='IsNull.element', index=0,
       number=1, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=609,
-  serialized_end=644,
+  serialized_start=1382,
+  serialized_end=1420,
 )
 
 
@@ -491,28 +986,28 @@ _DIV = _descriptor.Descriptor(
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='right', full_name='Div.right', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=646,
-  serialized_end=706,
+  serialized_start=1422,
+  serialized_end=1482,
 )
 
 
@@ -529,28 +1024,28 @@ _MINUS = _descriptor.Descriptor(
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='right', full_name='Minus.right', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=708,
-  serialized_end=770,
+  serialized_start=1484,
+  serialized_end=1546,
 )
 
 
@@ -567,28 +1062,28 @@ _MOD = _descriptor.Descriptor(
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='right', full_name='Mod.right', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=772,
-  serialized_end=832,
+  serialized_start=1548,
+  serialized_end=1608,
 )
 
 
@@ -605,28 +1100,28 @@ _PLUS = _descriptor.Descriptor(
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='right', full_name='Plus.right', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=834,
-  serialized_end=895,
+  serialized_start=1610,
+  serialized_end=1671,
 )
 
 
@@ -643,28 +1138,28 @@ _STAR = _descriptor.Descriptor(
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='right', full_name='Star.right', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=897,
-  serialized_end=958,
+  serialized_start=1673,
+  serialized_end=1734,
 )
 
 
@@ -681,28 +1176,28 @@ _POWER = _descriptor.Descriptor(
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='right', full_name='Power.right', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=960,
-  serialized_end=1022,
+  serialized_start=1736,
+  serialized_end=1798,
 )
 
 
@@ -719,28 +1214,28 @@ _AND = _descriptor.Descriptor(
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='right', full_name='And.right', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1024,
-  serialized_end=1084,
+  serialized_start=1800,
+  serialized_end=1860,
 )
 
 
@@ -757,28 +1252,28 @@ _OR = _descriptor.Descriptor(
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='right', full_name='Or.right', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1086,
-  serialized_end=1145,
+  serialized_start=1862,
+  serialized_end=1921,
 )
 
 
@@ -795,28 +1290,28 @@ _EQUAL = _descriptor.Descriptor(
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='right', full_name='Equal.right', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1147,
-  serialized_end=1209,
+  serialized_start=1923,
+  serialized_end=1985,
 )
 
 
@@ -833,28 +1328,28 @@ _LOWEROREQUAL = _descriptor.Descriptor(
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='right', full_name='LowerOrEqual.right', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1211,
-  serialized_end=1280,
+  serialized_start=1987,
+  serialized_end=2056,
 )
 
 
@@ -871,28 +1366,28 @@ _LOWERTHAN = _descriptor.Descriptor(
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='right', full_name='LowerThan.right', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1282,
-  serialized_end=1348,
+  serialized_start=2058,
+  serialized_end=2124,
 )
 
 
@@ -909,28 +1404,28 @@ _GREATEROREQUAL = _descriptor.Descriptor(
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='right', full_name='GreaterOrEqual.right', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1350,
-  serialized_end=1421,
+  serialized_start=2126,
+  serialized_end=2197,
 )
 
 
@@ -947,28 +1442,66 @@ _GREATERTHAN = _descriptor.Descriptor(
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='right', full_name='GreaterThan.right', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2199,
+  serialized_end=2267,
+)
+
+
+_IN = _descriptor.Descriptor(
+  name='In',
+  full_name='In',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='element', full_name='In.element', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='list', full_name='In.list', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1423,
-  serialized_end=1491,
+  serialized_start=2269,
+  serialized_end=2330,
 )
 
 
@@ -982,24 +1515,24 @@ _IDENTIFIER = _descriptor.Descriptor(
     _descriptor.FieldDescriptor(
       name='name', full_name='Identifier.name', index=0,
       number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1493,
-  serialized_end=1519,
+  serialized_start=2332,
+  serialized_end=2358,
 )
 
 
@@ -1016,28 +1549,28 @@ _LAMBDA = _descriptor.Descriptor(
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='body', full_name='Lambda.body', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1521,
-  serialized_end=1588,
+  serialized_start=2360,
+  serialized_end=2427,
 )
 
 
@@ -1054,14 +1587,14 @@ _FIXED = _descriptor.Descriptor(
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1590,
-  serialized_end=1597,
+  serialized_start=2429,
+  serialized_end=2436,
 )
 
 
@@ -1078,28 +1611,28 @@ _APPLICATION = _descriptor.Descriptor(
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='argument', full_name='Application.argument', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1599,
-  serialized_end=1674,
+  serialized_start=2438,
+  serialized_end=2513,
 )
 
 
@@ -1116,35 +1649,35 @@ _CONDITIONAL = _descriptor.Descriptor(
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='on_true', full_name='Conditional.on_true', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='on_false', full_name='Conditional.on_false', index=2,
       number=3, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1676,
-  serialized_end=1782,
+  serialized_start=2515,
+  serialized_end=2621,
 )
 
 
@@ -1161,14 +1694,14 @@ _LISTNIL = _descriptor.Descriptor(
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1784,
-  serialized_end=1793,
+  serialized_start=2623,
+  serialized_end=2632,
 )
 
 
@@ -1185,28 +1718,28 @@ _LISTCONS = _descriptor.Descriptor(
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='tail', full_name='ListCons.tail', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1795,
-  serialized_end=1859,
+  serialized_start=2634,
+  serialized_end=2698,
 )
 
 
@@ -1223,35 +1756,80 @@ _LISTDESTR = _descriptor.Descriptor(
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='on_nil', full_name='ListDestr.on_nil', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='on_cons', full_name='ListDestr.on_cons', index=2,
       number=3, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=2700,
+  serialized_end=2798,
+)
+
+
+_RANGE = _descriptor.Descriptor(
+  name='Range',
+  full_name='Range',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='start', full_name='Range.start', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='stop', full_name='Range.stop', index=1,
+      number=2, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='step', full_name='Range.step', index=2,
+      number=3, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1861,
-  serialized_end=1959,
+  serialized_start=2800,
+  serialized_end=2889,
 )
 
 
@@ -1268,14 +1846,14 @@ _TUPLENIL = _descriptor.Descriptor(
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1961,
-  serialized_end=1971,
+  serialized_start=2891,
+  serialized_end=2901,
 )
 
 
@@ -1292,35 +1870,35 @@ _TUPLECONS = _descriptor.Descriptor(
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='value', full_name='TupleCons.value', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='tail', full_name='TupleCons.tail', index=2,
       number=3, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=1973,
-  serialized_end=2065,
+  serialized_start=2903,
+  serialized_end=2995,
 )
 
 
@@ -1337,28 +1915,28 @@ _TUPLEDESTR = _descriptor.Descriptor(
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='key', full_name='TupleDestr.key', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2067,
-  serialized_end=2133,
+  serialized_start=2997,
+  serialized_end=3063,
 )
 
 
@@ -1372,31 +1950,31 @@ _BUILTIN = _descriptor.Descriptor(
     _descriptor.FieldDescriptor(
       name='module', full_name='Builtin.module', index=0,
       number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='name', full_name='Builtin.name', index=1,
       number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2135,
-  serialized_end=2174,
+  serialized_start=3065,
+  serialized_end=3104,
 )
 
 
@@ -1410,24 +1988,24 @@ _BYTECODE = _descriptor.Descriptor(
     _descriptor.FieldDescriptor(
       name='code', full_name='Bytecode.code', index=0,
       number=1, type=12, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b(""),
+      has_default_value=False, default_value=b"",
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2176,
-  serialized_end=2200,
+  serialized_start=3106,
+  serialized_end=3130,
 )
 
 
@@ -1441,59 +2019,59 @@ _DATABASE = _descriptor.Descriptor(
     _descriptor.FieldDescriptor(
       name='driver', full_name='Database.driver', index=0,
       number=1, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='name', full_name='Database.name', index=1,
       number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='host', full_name='Database.host', index=2,
       number=3, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='port', full_name='Database.port', index=3,
       number=4, type=5, cpp_type=1, label=1,
       has_default_value=False, default_value=0,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='username', full_name='Database.username', index=4,
       number=5, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='password', full_name='Database.password', index=5,
       number=6, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2202,
-  serialized_end=2306,
+  serialized_start=3132,
+  serialized_end=3236,
 )
 
 
@@ -1510,28 +2088,28 @@ _TABLE = _descriptor.Descriptor(
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='name', full_name='Table.name', index=1,
       number=2, type=9, cpp_type=9, label=1,
-      has_default_value=False, default_value=_b("").decode('utf-8'),
+      has_default_value=False, default_value=b"".decode('utf-8'),
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=2308,
-  serialized_end=2358,
+  serialized_start=3238,
+  serialized_end=3288,
 )
 
 
@@ -1548,294 +2126,406 @@ _EXPRESSION = _descriptor.Descriptor(
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='Number', full_name='Expression.Number', index=1,
       number=2, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='Double', full_name='Expression.Double', index=2,
       number=3, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='String', full_name='Expression.String', index=3,
       number=4, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='Boolean', full_name='Expression.Boolean', index=4,
       number=5, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='Scan', full_name='Expression.Scan', index=5,
       number=11, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='Filter', full_name='Expression.Filter', index=6,
       number=12, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='Project', full_name='Expression.Project', index=7,
       number=13, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='Sort', full_name='Expression.Sort', index=8,
       number=14, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='Limit', full_name='Expression.Limit', index=9,
       number=15, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='Group', full_name='Expression.Group', index=10,
       number=16, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
       name='Join', full_name='Expression.Join', index=11,
       number=17, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='SemiJoin', full_name='Expression.SemiJoin', index=12,
+      number=18, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='AntiJoin', full_name='Expression.AntiJoin', index=13,
+      number=19, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='Not', full_name='Expression.Not', index=12,
+      name='Distinct', full_name='Expression.Distinct', index=14,
+      number=20, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Not', full_name='Expression.Not', index=15,
       number=21, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='Div', full_name='Expression.Div', index=13,
+      name='Div', full_name='Expression.Div', index=16,
       number=22, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='Minus', full_name='Expression.Minus', index=14,
+      name='Minus', full_name='Expression.Minus', index=17,
       number=23, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='Mod', full_name='Expression.Mod', index=15,
+      name='Mod', full_name='Expression.Mod', index=18,
       number=24, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='Plus', full_name='Expression.Plus', index=16,
+      name='Plus', full_name='Expression.Plus', index=19,
       number=25, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='Star', full_name='Expression.Star', index=17,
+      name='Star', full_name='Expression.Star', index=20,
       number=26, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='Power', full_name='Expression.Power', index=18,
+      name='Power', full_name='Expression.Power', index=21,
       number=27, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='And', full_name='Expression.And', index=19,
+      name='And', full_name='Expression.And', index=22,
       number=28, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='Or', full_name='Expression.Or', index=20,
+      name='Or', full_name='Expression.Or', index=23,
       number=29, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='Equal', full_name='Expression.Equal', index=21,
+      name='Equal', full_name='Expression.Equal', index=24,
       number=30, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='LowerOrEqual', full_name='Expression.LowerOrEqual', index=22,
+      name='LowerOrEqual', full_name='Expression.LowerOrEqual', index=25,
       number=31, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='LowerThan', full_name='Expression.LowerThan', index=23,
+      name='LowerThan', full_name='Expression.LowerThan', index=26,
       number=32, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='GreaterOrEqual', full_name='Expression.GreaterOrEqual', index=24,
+      name='GreaterOrEqual', full_name='Expression.GreaterOrEqual', index=27,
       number=33, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='GreaterThan', full_name='Expression.GreaterThan', index=25,
+      name='GreaterThan', full_name='Expression.GreaterThan', index=28,
       number=34, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='IsNull', full_name='Expression.IsNull', index=29,
+      number=35, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='Identifier', full_name='Expression.Identifier', index=26,
+      name='In', full_name='Expression.In', index=30,
+      number=36, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Identifier', full_name='Expression.Identifier', index=31,
       number=41, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='Lambda', full_name='Expression.Lambda', index=27,
+      name='Lambda', full_name='Expression.Lambda', index=32,
       number=42, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='Fixed', full_name='Expression.Fixed', index=28,
+      name='Fixed', full_name='Expression.Fixed', index=33,
       number=43, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='Application', full_name='Expression.Application', index=29,
+      name='Application', full_name='Expression.Application', index=34,
       number=44, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='Conditional', full_name='Expression.Conditional', index=30,
+      name='Conditional', full_name='Expression.Conditional', index=35,
       number=45, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='ListNil', full_name='Expression.ListNil', index=31,
+      name='ListNil', full_name='Expression.ListNil', index=36,
       number=51, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='ListCons', full_name='Expression.ListCons', index=32,
+      name='ListCons', full_name='Expression.ListCons', index=37,
       number=52, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='ListDestr', full_name='Expression.ListDestr', index=33,
+      name='ListDestr', full_name='Expression.ListDestr', index=38,
       number=53, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Range', full_name='Expression.Range', index=39,
+      number=54, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='TupleNil', full_name='Expression.TupleNil', index=34,
+      name='TupleNil', full_name='Expression.TupleNil', index=40,
       number=61, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='TupleCons', full_name='Expression.TupleCons', index=35,
+      name='TupleCons', full_name='Expression.TupleCons', index=41,
       number=62, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='TupleDestr', full_name='Expression.TupleDestr', index=36,
+      name='TupleDestr', full_name='Expression.TupleDestr', index=42,
       number=63, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='Builtin', full_name='Expression.Builtin', index=37,
+      name='Builtin', full_name='Expression.Builtin', index=43,
       number=71, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='Bytecode', full_name='Expression.Bytecode', index=38,
+      name='Bytecode', full_name='Expression.Bytecode', index=44,
       number=72, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='Database', full_name='Expression.Database', index=39,
+      name='Database', full_name='Expression.Database', index=45,
       number=73, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
     _descriptor.FieldDescriptor(
-      name='Table', full_name='Expression.Table', index=40,
+      name='Table', full_name='Expression.Table', index=46,
       number=74, type=11, cpp_type=10, label=1,
       has_default_value=False, default_value=None,
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
-      options=None),
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Sum', full_name='Expression.Sum', index=47,
+      number=81, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Count', full_name='Expression.Count', index=48,
+      number=82, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Min', full_name='Expression.Min', index=49,
+      number=83, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Max', full_name='Expression.Max', index=50,
+      number=84, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Any', full_name='Expression.Any', index=51,
+      number=85, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='All', full_name='Expression.All', index=52,
+      number=86, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='GroupBy', full_name='Expression.GroupBy', index=53,
+      number=91, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='IndexBy', full_name='Expression.IndexBy', index=54,
+      number=92, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Flatten', full_name='Expression.Flatten', index=55,
+      number=93, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
+    _descriptor.FieldDescriptor(
+      name='Offset', full_name='Expression.Offset', index=56,
+      number=94, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR),
   ],
   extensions=[
   ],
   nested_types=[],
   enum_types=[
   ],
-  options=None,
+  serialized_options=None,
   is_extendable=False,
   syntax='proto3',
   extension_ranges=[],
@@ -1844,8 +2534,8 @@ _EXPRESSION = _descriptor.Descriptor(
       name='node', full_name='Expression.node',
       index=0, containing_type=None, fields=[]),
   ],
-  serialized_start=2361,
-  serialized_end=3535,
+  serialized_start=3291,
+  serialized_end=4873,
 )
 
 _SCAN.fields_by_name['table'].message_type = _EXPRESSION
@@ -1858,12 +2548,35 @@ _SORT.fields_by_name['ascending'].message_type = _EXPRESSION
 _SORT.fields_by_name['input'].message_type = _EXPRESSION
 _LIMIT.fields_by_name['limit'].message_type = _EXPRESSION
 _LIMIT.fields_by_name['input'].message_type = _EXPRESSION
+_OFFSET.fields_by_name['offset'].message_type = _EXPRESSION
+_OFFSET.fields_by_name['input'].message_type = _EXPRESSION
 _GROUP.fields_by_name['rows'].message_type = _EXPRESSION
 _GROUP.fields_by_name['input'].message_type = _EXPRESSION
+_GROUPBY.fields_by_name['key'].message_type = _EXPRESSION
+_GROUPBY.fields_by_name['value'].message_type = _EXPRESSION
+_GROUPBY.fields_by_name['input'].message_type = _EXPRESSION
+_INDEXBY.fields_by_name['key'].message_type = _EXPRESSION
+_INDEXBY.fields_by_name['value'].message_type = _EXPRESSION
+_INDEXBY.fields_by_name['input'].message_type = _EXPRESSION
+_DISTINCT.fields_by_name['input'].message_type = _EXPRESSION
+_FLATTEN.fields_by_name['input'].message_type = _EXPRESSION
 _JOIN.fields_by_name['filter'].message_type = _EXPRESSION
 _JOIN.fields_by_name['left'].message_type = _EXPRESSION
 _JOIN.fields_by_name['right'].message_type = _EXPRESSION
+_SEMIJOIN.fields_by_name['filter'].message_type = _EXPRESSION
+_SEMIJOIN.fields_by_name['left'].message_type = _EXPRESSION
+_SEMIJOIN.fields_by_name['right'].message_type = _EXPRESSION
+_ANTIJOIN.fields_by_name['filter'].message_type = _EXPRESSION
+_ANTIJOIN.fields_by_name['left'].message_type = _EXPRESSION
+_ANTIJOIN.fields_by_name['right'].message_type = _EXPRESSION
+_SUM.fields_by_name['input'].message_type = _EXPRESSION
+_COUNT.fields_by_name['input'].message_type = _EXPRESSION
+_MIN.fields_by_name['input'].message_type = _EXPRESSION
+_MAX.fields_by_name['input'].message_type = _EXPRESSION
+_ANY.fields_by_name['input'].message_type = _EXPRESSION
+_ALL.fields_by_name['input'].message_type = _EXPRESSION
 _NOT.fields_by_name['element'].message_type = _EXPRESSION
+_ISNULL.fields_by_name['element'].message_type = _EXPRESSION
 _DIV.fields_by_name['left'].message_type = _EXPRESSION
 _DIV.fields_by_name['right'].message_type = _EXPRESSION
 _MINUS.fields_by_name['left'].message_type = _EXPRESSION
@@ -1890,6 +2603,8 @@ _GREATEROREQUAL.fields_by_name['left'].message_type = _EXPRESSION
 _GREATEROREQUAL.fields_by_name['right'].message_type = _EXPRESSION
 _GREATERTHAN.fields_by_name['left'].message_type = _EXPRESSION
 _GREATERTHAN.fields_by_name['right'].message_type = _EXPRESSION
+_IN.fields_by_name['element'].message_type = _EXPRESSION
+_IN.fields_by_name['list'].message_type = _EXPRESSION
 _LAMBDA.fields_by_name['parameter'].message_type = _EXPRESSION
 _LAMBDA.fields_by_name['body'].message_type = _EXPRESSION
 _APPLICATION.fields_by_name['function'].message_type = _EXPRESSION
@@ -1902,6 +2617,9 @@ _LISTCONS.fields_by_name['tail'].message_type = _EXPRESSION
 _LISTDESTR.fields_by_name['input'].message_type = _EXPRESSION
 _LISTDESTR.fields_by_name['on_nil'].message_type = _EXPRESSION
 _LISTDESTR.fields_by_name['on_cons'].message_type = _EXPRESSION
+_RANGE.fields_by_name['start'].message_type = _EXPRESSION
+_RANGE.fields_by_name['stop'].message_type = _EXPRESSION
+_RANGE.fields_by_name['step'].message_type = _EXPRESSION
 _TUPLECONS.fields_by_name['key'].message_type = _EXPRESSION
 _TUPLECONS.fields_by_name['value'].message_type = _EXPRESSION
 _TUPLECONS.fields_by_name['tail'].message_type = _EXPRESSION
@@ -1920,6 +2638,9 @@ _EXPRESSION.fields_by_name['Sort'].message_type = _SORT
 _EXPRESSION.fields_by_name['Limit'].message_type = _LIMIT
 _EXPRESSION.fields_by_name['Group'].message_type = _GROUP
 _EXPRESSION.fields_by_name['Join'].message_type = _JOIN
+_EXPRESSION.fields_by_name['SemiJoin'].message_type = _SEMIJOIN
+_EXPRESSION.fields_by_name['AntiJoin'].message_type = _ANTIJOIN
+_EXPRESSION.fields_by_name['Distinct'].message_type = _DISTINCT
 _EXPRESSION.fields_by_name['Not'].message_type = _NOT
 _EXPRESSION.fields_by_name['Div'].message_type = _DIV
 _EXPRESSION.fields_by_name['Minus'].message_type = _MINUS
@@ -1934,6 +2655,8 @@ _EXPRESSION.fields_by_name['LowerOrEqual'].message_type = _LOWEROREQUAL
 _EXPRESSION.fields_by_name['LowerThan'].message_type = _LOWERTHAN
 _EXPRESSION.fields_by_name['GreaterOrEqual'].message_type = _GREATEROREQUAL
 _EXPRESSION.fields_by_name['GreaterThan'].message_type = _GREATERTHAN
+_EXPRESSION.fields_by_name['IsNull'].message_type = _ISNULL
+_EXPRESSION.fields_by_name['In'].message_type = _IN
 _EXPRESSION.fields_by_name['Identifier'].message_type = _IDENTIFIER
 _EXPRESSION.fields_by_name['Lambda'].message_type = _LAMBDA
 _EXPRESSION.fields_by_name['Fixed'].message_type = _LAMBDA
@@ -1942,6 +2665,7 @@ _EXPRESSION.fields_by_name['Conditional'].message_type = _CONDITIONAL
 _EXPRESSION.fields_by_name['ListNil'].message_type = _LISTNIL
 _EXPRESSION.fields_by_name['ListCons'].message_type = _LISTCONS
 _EXPRESSION.fields_by_name['ListDestr'].message_type = _LISTDESTR
+_EXPRESSION.fields_by_name['Range'].message_type = _RANGE
 _EXPRESSION.fields_by_name['TupleNil'].message_type = _TUPLENIL
 _EXPRESSION.fields_by_name['TupleCons'].message_type = _TUPLECONS
 _EXPRESSION.fields_by_name['TupleDestr'].message_type = _TUPLEDESTR
@@ -1949,6 +2673,16 @@ _EXPRESSION.fields_by_name['Builtin'].message_type = _BUILTIN
 _EXPRESSION.fields_by_name['Bytecode'].message_type = _BYTECODE
 _EXPRESSION.fields_by_name['Database'].message_type = _DATABASE
 _EXPRESSION.fields_by_name['Table'].message_type = _TABLE
+_EXPRESSION.fields_by_name['Sum'].message_type = _SUM
+_EXPRESSION.fields_by_name['Count'].message_type = _COUNT
+_EXPRESSION.fields_by_name['Min'].message_type = _MIN
+_EXPRESSION.fields_by_name['Max'].message_type = _MAX
+_EXPRESSION.fields_by_name['Any'].message_type = _ANY
+_EXPRESSION.fields_by_name['All'].message_type = _ALL
+_EXPRESSION.fields_by_name['GroupBy'].message_type = _GROUPBY
+_EXPRESSION.fields_by_name['IndexBy'].message_type = _INDEXBY
+_EXPRESSION.fields_by_name['Flatten'].message_type = _FLATTEN
+_EXPRESSION.fields_by_name['Offset'].message_type = _OFFSET
 _EXPRESSION.oneofs_by_name['node'].fields.append(
   _EXPRESSION.fields_by_name['Null'])
 _EXPRESSION.fields_by_name['Null'].containing_oneof = _EXPRESSION.oneofs_by_name['node']
@@ -1985,6 +2719,15 @@ _EXPRESSION.fields_by_name['Group'].containing_oneof = _EXPRESSION.oneofs_by_nam
 _EXPRESSION.oneofs_by_name['node'].fields.append(
   _EXPRESSION.fields_by_name['Join'])
 _EXPRESSION.fields_by_name['Join'].containing_oneof = _EXPRESSION.oneofs_by_name['node']
+_EXPRESSION.oneofs_by_name['node'].fields.append(
+  _EXPRESSION.fields_by_name['SemiJoin'])
+_EXPRESSION.fields_by_name['SemiJoin'].containing_oneof = _EXPRESSION.oneofs_by_name['node']
+_EXPRESSION.oneofs_by_name['node'].fields.append(
+  _EXPRESSION.fields_by_name['AntiJoin'])
+_EXPRESSION.fields_by_name['AntiJoin'].containing_oneof = _EXPRESSION.oneofs_by_name['node']
+_EXPRESSION.oneofs_by_name['node'].fields.append(
+  _EXPRESSION.fields_by_name['Distinct'])
+_EXPRESSION.fields_by_name['Distinct'].containing_oneof = _EXPRESSION.oneofs_by_name['node']
 _EXPRESSION.oneofs_by_name['node'].fields.append(
   _EXPRESSION.fields_by_name['Not'])
 _EXPRESSION.fields_by_name['Not'].containing_oneof = _EXPRESSION.oneofs_by_name['node']
@@ -2027,6 +2770,12 @@ _EXPRESSION.fields_by_name['GreaterOrEqual'].containing_oneof = _EXPRESSION.oneo
 _EXPRESSION.oneofs_by_name['node'].fields.append(
   _EXPRESSION.fields_by_name['GreaterThan'])
 _EXPRESSION.fields_by_name['GreaterThan'].containing_oneof = _EXPRESSION.oneofs_by_name['node']
+_EXPRESSION.oneofs_by_name['node'].fields.append(
+  _EXPRESSION.fields_by_name['IsNull'])
+_EXPRESSION.fields_by_name['IsNull'].containing_oneof = _EXPRESSION.oneofs_by_name['node']
+_EXPRESSION.oneofs_by_name['node'].fields.append(
+  _EXPRESSION.fields_by_name['In'])
+_EXPRESSION.fields_by_name['In'].containing_oneof = _EXPRESSION.oneofs_by_name['node']
 _EXPRESSION.oneofs_by_name['node'].fields.append(
   _EXPRESSION.fields_by_name['Identifier'])
 _EXPRESSION.fields_by_name['Identifier'].containing_oneof = _EXPRESSION.oneofs_by_name['node']
@@ -2051,6 +2800,9 @@ _EXPRESSION.fields_by_name['ListCons'].containing_oneof = _EXPRESSION.oneofs_by_
 _EXPRESSION.oneofs_by_name['node'].fields.append(
   _EXPRESSION.fields_by_name['ListDestr'])
 _EXPRESSION.fields_by_name['ListDestr'].containing_oneof = _EXPRESSION.oneofs_by_name['node']
+_EXPRESSION.oneofs_by_name['node'].fields.append(
+  _EXPRESSION.fields_by_name['Range'])
+_EXPRESSION.fields_by_name['Range'].containing_oneof = _EXPRESSION.oneofs_by_name['node']
 _EXPRESSION.oneofs_by_name['node'].fields.append(
   _EXPRESSION.fields_by_name['TupleNil'])
 _EXPRESSION.fields_by_name['TupleNil'].containing_oneof = _EXPRESSION.oneofs_by_name['node']
@@ -2072,6 +2824,36 @@ _EXPRESSION.fields_by_name['Database'].containing_oneof = _EXPRESSION.oneofs_by_
 _EXPRESSION.oneofs_by_name['node'].fields.append(
   _EXPRESSION.fields_by_name['Table'])
 _EXPRESSION.fields_by_name['Table'].containing_oneof = _EXPRESSION.oneofs_by_name['node']
+_EXPRESSION.oneofs_by_name['node'].fields.append(
+  _EXPRESSION.fields_by_name['Sum'])
+_EXPRESSION.fields_by_name['Sum'].containing_oneof = _EXPRESSION.oneofs_by_name['node']
+_EXPRESSION.oneofs_by_name['node'].fields.append(
+  _EXPRESSION.fields_by_name['Count'])
+_EXPRESSION.fields_by_name['Count'].containing_oneof = _EXPRESSION.oneofs_by_name['node']
+_EXPRESSION.oneofs_by_name['node'].fields.append(
+  _EXPRESSION.fields_by_name['Min'])
+_EXPRESSION.fields_by_name['Min'].containing_oneof = _EXPRESSION.oneofs_by_name['node']
+_EXPRESSION.oneofs_by_name['node'].fields.append(
+  _EXPRESSION.fields_by_name['Max'])
+_EXPRESSION.fields_by_name['Max'].containing_oneof = _EXPRESSION.oneofs_by_name['node']
+_EXPRESSION.oneofs_by_name['node'].fields.append(
+  _EXPRESSION.fields_by_name['Any'])
+_EXPRESSION.fields_by_name['Any'].containing_oneof = _EXPRESSION.oneofs_by_name['node']
+_EXPRESSION.oneofs_by_name['node'].fields.append(
+  _EXPRESSION.fields_by_name['All'])
+_EXPRESSION.fields_by_name['All'].containing_oneof = _EXPRESSION.oneofs_by_name['node']
+_EXPRESSION.oneofs_by_name['node'].fields.append(
+  _EXPRESSION.fields_by_name['GroupBy'])
+_EXPRESSION.fields_by_name['GroupBy'].containing_oneof = _EXPRESSION.oneofs_by_name['node']
+_EXPRESSION.oneofs_by_name['node'].fields.append(
+  _EXPRESSION.fields_by_name['IndexBy'])
+_EXPRESSION.fields_by_name['IndexBy'].containing_oneof = _EXPRESSION.oneofs_by_name['node']
+_EXPRESSION.oneofs_by_name['node'].fields.append(
+  _EXPRESSION.fields_by_name['Flatten'])
+_EXPRESSION.fields_by_name['Flatten'].containing_oneof = _EXPRESSION.oneofs_by_name['node']
+_EXPRESSION.oneofs_by_name['node'].fields.append(
+  _EXPRESSION.fields_by_name['Offset'])
+_EXPRESSION.fields_by_name['Offset'].containing_oneof = _EXPRESSION.oneofs_by_name['node']
 DESCRIPTOR.message_types_by_name['Null'] = _NULL
 DESCRIPTOR.message_types_by_name['Number'] = _NUMBER
 DESCRIPTOR.message_types_by_name['Double'] = _DOUBLE
@@ -2082,9 +2864,23 @@ DESCRIPTOR.message_types_by_name['Project'] = _PROJECT
 DESCRIPTOR.message_types_by_name['Filter'] = _FILTER
 DESCRIPTOR.message_types_by_name['Sort'] = _SORT
 DESCRIPTOR.message_types_by_name['Limit'] = _LIMIT
+DESCRIPTOR.message_types_by_name['Offset'] = _OFFSET
 DESCRIPTOR.message_types_by_name['Group'] = _GROUP
+DESCRIPTOR.message_types_by_name['GroupBy'] = _GROUPBY
+DESCRIPTOR.message_types_by_name['IndexBy'] = _INDEXBY
+DESCRIPTOR.message_types_by_name['Distinct'] = _DISTINCT
+DESCRIPTOR.message_types_by_name['Flatten'] = _FLATTEN
 DESCRIPTOR.message_types_by_name['Join'] = _JOIN
+DESCRIPTOR.message_types_by_name['SemiJoin'] = _SEMIJOIN
+DESCRIPTOR.message_types_by_name['AntiJoin'] = _ANTIJOIN
+DESCRIPTOR.message_types_by_name['Sum'] = _SUM
+DESCRIPTOR.message_types_by_name['Count'] = _COUNT
+DESCRIPTOR.message_types_by_name['Min'] = _MIN
+DESCRIPTOR.message_types_by_name['Max'] = _MAX
+DESCRIPTOR.message_types_by_name['Any'] = _ANY
+DESCRIPTOR.message_types_by_name['All'] = _ALL
 DESCRIPTOR.message_types_by_name['Not'] = _NOT
+DESCRIPTOR.message_types_by_name['IsNull'] = _ISNULL
 DESCRIPTOR.message_types_by_name['Div'] = _DIV
 DESCRIPTOR.message_types_by_name['Minus'] = _MINUS
 DESCRIPTOR.message_types_by_name['Mod'] = _MOD
@@ -2098,6 +2894,7 @@ DESCRIPTOR.message_types_by_name['LowerOrEqual'] = _LOWEROREQUAL
 DESCRIPTOR.message_types_by_name['LowerThan'] = _LOWERTHAN
 DESCRIPTOR.message_types_by_name['GreaterOrEqual'] = _GREATEROREQUAL
 DESCRIPTOR.message_types_by_name['GreaterThan'] = _GREATERTHAN
+DESCRIPTOR.message_types_by_name['In'] = _IN
 DESCRIPTOR.message_types_by_name['Identifier'] = _IDENTIFIER
 DESCRIPTOR.message_types_by_name['Lambda'] = _LAMBDA
 DESCRIPTOR.message_types_by_name['Fixed'] = _FIXED
@@ -2106,6 +2903,7 @@ DESCRIPTOR.message_types_by_name['Conditional'] = _CONDITIONAL
 DESCRIPTOR.message_types_by_name['ListNil'] = _LISTNIL
 DESCRIPTOR.message_types_by_name['ListCons'] = _LISTCONS
 DESCRIPTOR.message_types_by_name['ListDestr'] = _LISTDESTR
+DESCRIPTOR.message_types_by_name['Range'] = _RANGE
 DESCRIPTOR.message_types_by_name['TupleNil'] = _TUPLENIL
 DESCRIPTOR.message_types_by_name['TupleCons'] = _TUPLECONS
 DESCRIPTOR.message_types_by_name['TupleDestr'] = _TUPLEDESTR
@@ -2114,417 +2912,446 @@ DESCRIPTOR.message_types_by_name['Bytecode'] = _BYTECODE
 DESCRIPTOR.message_types_by_name['Database'] = _DATABASE
 DESCRIPTOR.message_types_by_name['Table'] = _TABLE
 DESCRIPTOR.message_types_by_name['Expression'] = _EXPRESSION
+_sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
-Null = _reflection.GeneratedProtocolMessageType('Null', (_message.Message,), dict(
-  DESCRIPTOR = _NULL,
-  __module__ = 'qir_pb2'
+Null = _reflection.GeneratedProtocolMessageType('Null', (_message.Message,), {
+  'DESCRIPTOR' : _NULL,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Null)
-  ))
+  })
 _sym_db.RegisterMessage(Null)
 
-Number = _reflection.GeneratedProtocolMessageType('Number', (_message.Message,), dict(
-  DESCRIPTOR = _NUMBER,
-  __module__ = 'qir_pb2'
+Number = _reflection.GeneratedProtocolMessageType('Number', (_message.Message,), {
+  'DESCRIPTOR' : _NUMBER,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Number)
-  ))
+  })
 _sym_db.RegisterMessage(Number)
 
-Double = _reflection.GeneratedProtocolMessageType('Double', (_message.Message,), dict(
-  DESCRIPTOR = _DOUBLE,
-  __module__ = 'qir_pb2'
+Double = _reflection.GeneratedProtocolMessageType('Double', (_message.Message,), {
+  'DESCRIPTOR' : _DOUBLE,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Double)
-  ))
+  })
 _sym_db.RegisterMessage(Double)
 
-String = _reflection.GeneratedProtocolMessageType('String', (_message.Message,), dict(
-  DESCRIPTOR = _STRING,
-  __module__ = 'qir_pb2'
+String = _reflection.GeneratedProtocolMessageType('String', (_message.Message,), {
+  'DESCRIPTOR' : _STRING,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:String)
-  ))
+  })
 _sym_db.RegisterMessage(String)
 
-Boolean = _reflection.GeneratedProtocolMessageType('Boolean', (_message.Message,), dict(
-  DESCRIPTOR = _BOOLEAN,
-  __module__ = 'qir_pb2'
+Boolean = _reflection.GeneratedProtocolMessageType('Boolean', (_message.Message,), {
+  'DESCRIPTOR' : _BOOLEAN,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Boolean)
-  ))
+  })
 _sym_db.RegisterMessage(Boolean)
 
-Scan = _reflection.GeneratedProtocolMessageType('Scan', (_message.Message,), dict(
-  DESCRIPTOR = _SCAN,
-  __module__ = 'qir_pb2'
+Scan = _reflection.GeneratedProtocolMessageType('Scan', (_message.Message,), {
+  'DESCRIPTOR' : _SCAN,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Scan)
-  ))
+  })
 _sym_db.RegisterMessage(Scan)
 
-Project = _reflection.GeneratedProtocolMessageType('Project', (_message.Message,), dict(
-  DESCRIPTOR = _PROJECT,
-  __module__ = 'qir_pb2'
+Project = _reflection.GeneratedProtocolMessageType('Project', (_message.Message,), {
+  'DESCRIPTOR' : _PROJECT,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Project)
-  ))
+  })
 _sym_db.RegisterMessage(Project)
 
-Filter = _reflection.GeneratedProtocolMessageType('Filter', (_message.Message,), dict(
-  DESCRIPTOR = _FILTER,
-  __module__ = 'qir_pb2'
+Filter = _reflection.GeneratedProtocolMessageType('Filter', (_message.Message,), {
+  'DESCRIPTOR' : _FILTER,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Filter)
-  ))
+  })
 _sym_db.RegisterMessage(Filter)
 
-Sort = _reflection.GeneratedProtocolMessageType('Sort', (_message.Message,), dict(
-  DESCRIPTOR = _SORT,
-  __module__ = 'qir_pb2'
+Sort = _reflection.GeneratedProtocolMessageType('Sort', (_message.Message,), {
+  'DESCRIPTOR' : _SORT,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Sort)
-  ))
+  })
 _sym_db.RegisterMessage(Sort)
 
-Limit = _reflection.GeneratedProtocolMessageType('Limit', (_message.Message,), dict(
-  DESCRIPTOR = _LIMIT,
-  __module__ = 'qir_pb2'
+Limit = _reflection.GeneratedProtocolMessageType('Limit', (_message.Message,), {
+  'DESCRIPTOR' : _LIMIT,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Limit)
-  ))
+  })
 _sym_db.RegisterMessage(Limit)
 
-Group = _reflection.GeneratedProtocolMessageType('Group', (_message.Message,), dict(
-  DESCRIPTOR = _GROUP,
-  __module__ = 'qir_pb2'
+Offset = _reflection.GeneratedProtocolMessageType('Offset', (_message.Message,), {
+  'DESCRIPTOR' : _OFFSET,
+  '__module__' : 'qir_pb2'
+  # @@protoc_insertion_point(class_scope:Offset)
+  })
+_sym_db.RegisterMessage(Offset)
+
+Group = _reflection.GeneratedProtocolMessageType('Group', (_message.Message,), {
+  'DESCRIPTOR' : _GROUP,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Group)
-  ))
+  })
 _sym_db.RegisterMessage(Group)
 
-Join = _reflection.GeneratedProtocolMessageType('Join', (_message.Message,), dict(
-  DESCRIPTOR = _JOIN,
-  __module__ = 'qir_pb2'
+GroupBy = _reflection.GeneratedProtocolMessageType('GroupBy', (_message.Message,), {
+  'DESCRIPTOR' : _GROUPBY,
+  '__module__' : 'qir_pb2'
+  # @@protoc_insertion_point(class_scope:GroupBy)
+  })
+_sym_db.RegisterMessage(GroupBy)
+
+IndexBy = _reflection.GeneratedProtocolMessageType('IndexBy', (_message.Message,), {
+  'DESCRIPTOR' : _INDEXBY,
+  '__module__' : 'qir_pb2'
+  # @@protoc_insertion_point(class_scope:IndexBy)
+  })
+_sym_db.RegisterMessage(IndexBy)
+
+Distinct = _reflection.GeneratedProtocolMessageType('Distinct', (_message.Message,), {
+  'DESCRIPTOR' : _DISTINCT,
+  '__module__' : 'qir_pb2'
+  # @@protoc_insertion_point(class_scope:Distinct)
+  })
+_sym_db.RegisterMessage(Distinct)
+
+Flatten = _reflection.GeneratedProtocolMessageType('Flatten', (_message.Message,), {
+  'DESCRIPTOR' : _FLATTEN,
+  '__module__' : 'qir_pb2'
+  # @@protoc_insertion_point(class_scope:Flatten)
+  })
+_sym_db.RegisterMessage(Flatten)
+
+Join = _reflection.GeneratedProtocolMessageType('Join', (_message.Message,), {
+  'DESCRIPTOR' : _JOIN,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Join)
-  ))
+  })
 _sym_db.RegisterMessage(Join)
 
-Not = _reflection.GeneratedProtocolMessageType('Not', (_message.Message,), dict(
-  DESCRIPTOR = _NOT,
-  __module__ = 'qir_pb2'
+SemiJoin = _reflection.GeneratedProtocolMessageType('SemiJoin', (_message.Message,), {
+  'DESCRIPTOR' : _SEMIJOIN,
+  '__module__' : 'qir_pb2'
+  # @@protoc_insertion_point(class_scope:SemiJoin)
+  })
+_sym_db.RegisterMessage(SemiJoin)
+
+AntiJoin = _reflection.GeneratedProtocolMessageType('AntiJoin', (_message.Message,), {
+  'DESCRIPTOR' : _ANTIJOIN,
+  '__module__' : 'qir_pb2'
+  # @@protoc_insertion_point(class_scope:AntiJoin)
+  })
+_sym_db.RegisterMessage(AntiJoin)
+
+Sum = _reflection.GeneratedProtocolMessageType('Sum', (_message.Message,), {
+  'DESCRIPTOR' : _SUM,
+  '__module__' : 'qir_pb2'
+  # @@protoc_insertion_point(class_scope:Sum)
+  })
+_sym_db.RegisterMessage(Sum)
+
+Count = _reflection.GeneratedProtocolMessageType('Count', (_message.Message,), {
+  'DESCRIPTOR' : _COUNT,
+  '__module__' : 'qir_pb2'
+  # @@protoc_insertion_point(class_scope:Count)
+  })
+_sym_db.RegisterMessage(Count)
+
+Min = _reflection.GeneratedProtocolMessageType('Min', (_message.Message,), {
+  'DESCRIPTOR' : _MIN,
+  '__module__' : 'qir_pb2'
+  # @@protoc_insertion_point(class_scope:Min)
+  })
+_sym_db.RegisterMessage(Min)
+
+Max = _reflection.GeneratedProtocolMessageType('Max', (_message.Message,), {
+  'DESCRIPTOR' : _MAX,
+  '__module__' : 'qir_pb2'
+  # @@protoc_insertion_point(class_scope:Max)
+  })
+_sym_db.RegisterMessage(Max)
+
+Any = _reflection.GeneratedProtocolMessageType('Any', (_message.Message,), {
+  'DESCRIPTOR' : _ANY,
+  '__module__' : 'qir_pb2'
+  # @@protoc_insertion_point(class_scope:Any)
+  })
+_sym_db.RegisterMessage(Any)
+
+All = _reflection.GeneratedProtocolMessageType('All', (_message.Message,), {
+  'DESCRIPTOR' : _ALL,
+  '__module__' : 'qir_pb2'
+  # @@protoc_insertion_point(class_scope:All)
+  })
+_sym_db.RegisterMessage(All)
+
+Not = _reflection.GeneratedProtocolMessageType('Not', (_message.Message,), {
+  'DESCRIPTOR' : _NOT,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Not)
-  ))
+  })
 _sym_db.RegisterMessage(Not)
 
-Div = _reflection.GeneratedProtocolMessageType('Div', (_message.Message,), dict(
-  DESCRIPTOR = _DIV,
-  __module__ = 'qir_pb2'
+IsNull = _reflection.GeneratedProtocolMessageType('IsNull', (_message.Message,), {
+  'DESCRIPTOR' : _ISNULL,
+  '__module__' : 'qir_pb2'
+  # @@protoc_insertion_point(class_scope:IsNull)
+  })
+_sym_db.RegisterMessage(IsNull)
+
+Div = _reflection.GeneratedProtocolMessageType('Div', (_message.Message,), {
+  'DESCRIPTOR' : _DIV,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Div)
-  ))
+  })
 _sym_db.RegisterMessage(Div)
 
-Minus = _reflection.GeneratedProtocolMessageType('Minus', (_message.Message,), dict(
-  DESCRIPTOR = _MINUS,
-  __module__ = 'qir_pb2'
+Minus = _reflection.GeneratedProtocolMessageType('Minus', (_message.Message,), {
+  'DESCRIPTOR' : _MINUS,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Minus)
-  ))
+  })
 _sym_db.RegisterMessage(Minus)
 
-Mod = _reflection.GeneratedProtocolMessageType('Mod', (_message.Message,), dict(
-  DESCRIPTOR = _MOD,
-  __module__ = 'qir_pb2'
+Mod = _reflection.GeneratedProtocolMessageType('Mod', (_message.Message,), {
+  'DESCRIPTOR' : _MOD,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Mod)
-  ))
+  })
 _sym_db.RegisterMessage(Mod)
 
-Plus = _reflection.GeneratedProtocolMessageType('Plus', (_message.Message,), dict(
-  DESCRIPTOR = _PLUS,
-  __module__ = 'qir_pb2'
+Plus = _reflection.GeneratedProtocolMessageType('Plus', (_message.Message,), {
+  'DESCRIPTOR' : _PLUS,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Plus)
-  ))
+  })
 _sym_db.RegisterMessage(Plus)
 
-Star = _reflection.GeneratedProtocolMessageType('Star', (_message.Message,), dict(
-  DESCRIPTOR = _STAR,
-  __module__ = 'qir_pb2'
+Star = _reflection.GeneratedProtocolMessageType('Star', (_message.Message,), {
+  'DESCRIPTOR' : _STAR,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Star)
-  ))
+  })
 _sym_db.RegisterMessage(Star)
 
-Power = _reflection.GeneratedProtocolMessageType('Power', (_message.Message,), dict(
-  DESCRIPTOR = _POWER,
-  __module__ = 'qir_pb2'
+Power = _reflection.GeneratedProtocolMessageType('Power', (_message.Message,), {
+  'DESCRIPTOR' : _POWER,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Power)
-  ))
+  })
 _sym_db.RegisterMessage(Power)
 
-And = _reflection.GeneratedProtocolMessageType('And', (_message.Message,), dict(
-  DESCRIPTOR = _AND,
-  __module__ = 'qir_pb2'
+And = _reflection.GeneratedProtocolMessageType('And', (_message.Message,), {
+  'DESCRIPTOR' : _AND,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:And)
-  ))
+  })
 _sym_db.RegisterMessage(And)
 
-Or = _reflection.GeneratedProtocolMessageType('Or', (_message.Message,), dict(
-  DESCRIPTOR = _OR,
-  __module__ = 'qir_pb2'
+Or = _reflection.GeneratedProtocolMessageType('Or', (_message.Message,), {
+  'DESCRIPTOR' : _OR,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Or)
-  ))
+  })
 _sym_db.RegisterMessage(Or)
 
-Equal = _reflection.GeneratedProtocolMessageType('Equal', (_message.Message,), dict(
-  DESCRIPTOR = _EQUAL,
-  __module__ = 'qir_pb2'
+Equal = _reflection.GeneratedProtocolMessageType('Equal', (_message.Message,), {
+  'DESCRIPTOR' : _EQUAL,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Equal)
-  ))
+  })
 _sym_db.RegisterMessage(Equal)
 
-LowerOrEqual = _reflection.GeneratedProtocolMessageType('LowerOrEqual', (_message.Message,), dict(
-  DESCRIPTOR = _LOWEROREQUAL,
-  __module__ = 'qir_pb2'
+LowerOrEqual = _reflection.GeneratedProtocolMessageType('LowerOrEqual', (_message.Message,), {
+  'DESCRIPTOR' : _LOWEROREQUAL,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:LowerOrEqual)
-  ))
+  })
 _sym_db.RegisterMessage(LowerOrEqual)
 
-LowerThan = _reflection.GeneratedProtocolMessageType('LowerThan', (_message.Message,), dict(
-  DESCRIPTOR = _LOWERTHAN,
-  __module__ = 'qir_pb2'
+LowerThan = _reflection.GeneratedProtocolMessageType('LowerThan', (_message.Message,), {
+  'DESCRIPTOR' : _LOWERTHAN,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:LowerThan)
-  ))
+  })
 _sym_db.RegisterMessage(LowerThan)
 
-GreaterOrEqual = _reflection.GeneratedProtocolMessageType('GreaterOrEqual', (_message.Message,), dict(
-  DESCRIPTOR = _GREATEROREQUAL,
-  __module__ = 'qir_pb2'
+GreaterOrEqual = _reflection.GeneratedProtocolMessageType('GreaterOrEqual', (_message.Message,), {
+  'DESCRIPTOR' : _GREATEROREQUAL,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:GreaterOrEqual)
-  ))
+  })
 _sym_db.RegisterMessage(GreaterOrEqual)
 
-GreaterThan = _reflection.GeneratedProtocolMessageType('GreaterThan', (_message.Message,), dict(
-  DESCRIPTOR = _GREATERTHAN,
-  __module__ = 'qir_pb2'
+GreaterThan = _reflection.GeneratedProtocolMessageType('GreaterThan', (_message.Message,), {
+  'DESCRIPTOR' : _GREATERTHAN,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:GreaterThan)
-  ))
+  })
 _sym_db.RegisterMessage(GreaterThan)
 
-Identifier = _reflection.GeneratedProtocolMessageType('Identifier', (_message.Message,), dict(
-  DESCRIPTOR = _IDENTIFIER,
-  __module__ = 'qir_pb2'
+In = _reflection.GeneratedProtocolMessageType('In', (_message.Message,), {
+  'DESCRIPTOR' : _IN,
+  '__module__' : 'qir_pb2'
+  # @@protoc_insertion_point(class_scope:In)
+  })
+_sym_db.RegisterMessage(In)
+
+Identifier = _reflection.GeneratedProtocolMessageType('Identifier', (_message.Message,), {
+  'DESCRIPTOR' : _IDENTIFIER,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Identifier)
-  ))
+  })
 _sym_db.RegisterMessage(Identifier)
 
-Lambda = _reflection.GeneratedProtocolMessageType('Lambda', (_message.Message,), dict(
-  DESCRIPTOR = _LAMBDA,
-  __module__ = 'qir_pb2'
+Lambda = _reflection.GeneratedProtocolMessageType('Lambda', (_message.Message,), {
+  'DESCRIPTOR' : _LAMBDA,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Lambda)
-  ))
+  })
 _sym_db.RegisterMessage(Lambda)
 
-Fixed = _reflection.GeneratedProtocolMessageType('Fixed', (_message.Message,), dict(
-  DESCRIPTOR = _FIXED,
-  __module__ = 'qir_pb2'
+Fixed = _reflection.GeneratedProtocolMessageType('Fixed', (_message.Message,), {
+  'DESCRIPTOR' : _FIXED,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Fixed)
-  ))
+  })
 _sym_db.RegisterMessage(Fixed)
 
-Application = _reflection.GeneratedProtocolMessageType('Application', (_message.Message,), dict(
-  DESCRIPTOR = _APPLICATION,
-  __module__ = 'qir_pb2'
+Application = _reflection.GeneratedProtocolMessageType('Application', (_message.Message,), {
+  'DESCRIPTOR' : _APPLICATION,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Application)
-  ))
+  })
 _sym_db.RegisterMessage(Application)
 
-Conditional = _reflection.GeneratedProtocolMessageType('Conditional', (_message.Message,), dict(
-  DESCRIPTOR = _CONDITIONAL,
-  __module__ = 'qir_pb2'
+Conditional = _reflection.GeneratedProtocolMessageType('Conditional', (_message.Message,), {
+  'DESCRIPTOR' : _CONDITIONAL,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Conditional)
-  ))
+  })
 _sym_db.RegisterMessage(Conditional)
 
-ListNil = _reflection.GeneratedProtocolMessageType('ListNil', (_message.Message,), dict(
-  DESCRIPTOR = _LISTNIL,
-  __module__ = 'qir_pb2'
+ListNil = _reflection.GeneratedProtocolMessageType('ListNil', (_message.Message,), {
+  'DESCRIPTOR' : _LISTNIL,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:ListNil)
-  ))
+  })
 _sym_db.RegisterMessage(ListNil)
 
-ListCons = _reflection.GeneratedProtocolMessageType('ListCons', (_message.Message,), dict(
-  DESCRIPTOR = _LISTCONS,
-  __module__ = 'qir_pb2'
+ListCons = _reflection.GeneratedProtocolMessageType('ListCons', (_message.Message,), {
+  'DESCRIPTOR' : _LISTCONS,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:ListCons)
-  ))
+  })
 _sym_db.RegisterMessage(ListCons)
 
-ListDestr = _reflection.GeneratedProtocolMessageType('ListDestr', (_message.Message,), dict(
-  DESCRIPTOR = _LISTDESTR,
-  __module__ = 'qir_pb2'
+ListDestr = _reflection.GeneratedProtocolMessageType('ListDestr', (_message.Message,), {
+  'DESCRIPTOR' : _LISTDESTR,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:ListDestr)
-  ))
+  })
 _sym_db.RegisterMessage(ListDestr)
 
-TupleNil = _reflection.GeneratedProtocolMessageType('TupleNil', (_message.Message,), dict(
-  DESCRIPTOR = _TUPLENIL,
-  __module__ = 'qir_pb2'
+Range = _reflection.GeneratedProtocolMessageType('Range', (_message.Message,), {
+  'DESCRIPTOR' : _RANGE,
+  '__module__' : 'qir_pb2'
+  # @@protoc_insertion_point(class_scope:Range)
+  })
+_sym_db.RegisterMessage(Range)
+
+TupleNil = _reflection.GeneratedProtocolMessageType('TupleNil', (_message.Message,), {
+  'DESCRIPTOR' : _TUPLENIL,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:TupleNil)
-  ))
+  })
 _sym_db.RegisterMessage(TupleNil)
 
-TupleCons = _reflection.GeneratedProtocolMessageType('TupleCons', (_message.Message,), dict(
-  DESCRIPTOR = _TUPLECONS,
-  __module__ = 'qir_pb2'
+TupleCons = _reflection.GeneratedProtocolMessageType('TupleCons', (_message.Message,), {
+  'DESCRIPTOR' : _TUPLECONS,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:TupleCons)
-  ))
+  })
 _sym_db.RegisterMessage(TupleCons)
 
-TupleDestr = _reflection.GeneratedProtocolMessageType('TupleDestr', (_message.Message,), dict(
-  DESCRIPTOR = _TUPLEDESTR,
-  __module__ = 'qir_pb2'
+TupleDestr = _reflection.GeneratedProtocolMessageType('TupleDestr', (_message.Message,), {
+  'DESCRIPTOR' : _TUPLEDESTR,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:TupleDestr)
-  ))
+  })
 _sym_db.RegisterMessage(TupleDestr)
 
-Builtin = _reflection.GeneratedProtocolMessageType('Builtin', (_message.Message,), dict(
-  DESCRIPTOR = _BUILTIN,
-  __module__ = 'qir_pb2'
+Builtin = _reflection.GeneratedProtocolMessageType('Builtin', (_message.Message,), {
+  'DESCRIPTOR' : _BUILTIN,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Builtin)
-  ))
+  })
 _sym_db.RegisterMessage(Builtin)
 
-Bytecode = _reflection.GeneratedProtocolMessageType('Bytecode', (_message.Message,), dict(
-  DESCRIPTOR = _BYTECODE,
-  __module__ = 'qir_pb2'
+Bytecode = _reflection.GeneratedProtocolMessageType('Bytecode', (_message.Message,), {
+  'DESCRIPTOR' : _BYTECODE,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Bytecode)
-  ))
+  })
 _sym_db.RegisterMessage(Bytecode)
 
-Database = _reflection.GeneratedProtocolMessageType('Database', (_message.Message,), dict(
-  DESCRIPTOR = _DATABASE,
-  __module__ = 'qir_pb2'
+Database = _reflection.GeneratedProtocolMessageType('Database', (_message.Message,), {
+  'DESCRIPTOR' : _DATABASE,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Database)
-  ))
+  })
 _sym_db.RegisterMessage(Database)
 
-Table = _reflection.GeneratedProtocolMessageType('Table', (_message.Message,), dict(
-  DESCRIPTOR = _TABLE,
-  __module__ = 'qir_pb2'
+Table = _reflection.GeneratedProtocolMessageType('Table', (_message.Message,), {
+  'DESCRIPTOR' : _TABLE,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Table)
-  ))
+  })
 _sym_db.RegisterMessage(Table)
 
-Expression = _reflection.GeneratedProtocolMessageType('Expression', (_message.Message,), dict(
-  DESCRIPTOR = _EXPRESSION,
-  __module__ = 'qir_pb2'
+Expression = _reflection.GeneratedProtocolMessageType('Expression', (_message.Message,), {
+  'DESCRIPTOR' : _EXPRESSION,
+  '__module__' : 'qir_pb2'
   # @@protoc_insertion_point(class_scope:Expression)
-  ))
+  })
 _sym_db.RegisterMessage(Expression)
 
 
-try:
-  # THESE ELEMENTS WILL BE DEPRECATED.
-  # Please use the generated *_pb2_grpc.py files instead.
-  import grpc
-  from grpc.beta import implementations as beta_implementations
-  from grpc.beta import interfaces as beta_interfaces
-  from grpc.framework.common import cardinality
-  from grpc.framework.interfaces.face import utilities as face_utilities
-
-
-  class EvaluatorStub(object):
-    """*
-    A remote QIR evaluation service.
-    """
-
-    def __init__(self, channel):
-      """Constructor.
-
-      Args:
-        channel: A grpc.Channel.
-      """
-      self.Evaluate = channel.unary_unary(
-          '/Evaluator/Evaluate',
-          request_serializer=Expression.SerializeToString,
-          response_deserializer=Expression.FromString,
-          )
-
-
-  class EvaluatorServicer(object):
-    """*
-    A remote QIR evaluation service.
-    """
-
-    def Evaluate(self, request, context):
-      context.set_code(grpc.StatusCode.UNIMPLEMENTED)
-      context.set_details('Method not implemented!')
-      raise NotImplementedError('Method not implemented!')
-
-
-  def add_EvaluatorServicer_to_server(servicer, server):
-    rpc_method_handlers = {
-        'Evaluate': grpc.unary_unary_rpc_method_handler(
-            servicer.Evaluate,
-            request_deserializer=Expression.FromString,
-            response_serializer=Expression.SerializeToString,
-        ),
-    }
-    generic_handler = grpc.method_handlers_generic_handler(
-        'Evaluator', rpc_method_handlers)
-    server.add_generic_rpc_handlers((generic_handler,))
-
-
-  class BetaEvaluatorServicer(object):
-    """The Beta API is deprecated for 0.15.0 and later.
-
-    It is recommended to use the GA API (classes and functions in this
-    file not marked beta) for all further purposes. This class was generated
-    only to ease transition from grpcio<0.15.0 to grpcio>=0.15.0."""
-    """*
-    A remote QIR evaluation service.
-    """
-    def Evaluate(self, request, context):
-      context.code(beta_interfaces.StatusCode.UNIMPLEMENTED)
-
-
-  class BetaEvaluatorStub(object):
-    """The Beta API is deprecated for 0.15.0 and later.
-
-    It is recommended to use the GA API (classes and functions in this
-    file not marked beta) for all further purposes. This class was generated
-    only to ease transition from grpcio<0.15.0 to grpcio>=0.15.0."""
-    """*
-    A remote QIR evaluation service.
-    """
-    def Evaluate(self, request, timeout, metadata=None, with_call=False, protocol_options=None):
-      raise NotImplementedError()
-    Evaluate.future = None
-
-
-  def beta_create_Evaluator_server(servicer, pool=None, pool_size=None, default_timeout=None, maximum_timeout=None):
-    """The Beta API is deprecated for 0.15.0 and later.
-
-    It is recommended to use the GA API (classes and functions in this
-    file not marked beta) for all further purposes. This function was
-    generated only to ease transition from grpcio<0.15.0 to grpcio>=0.15.0"""
-    request_deserializers = {
-      ('Evaluator', 'Evaluate'): Expression.FromString,
-    }
-    response_serializers = {
-      ('Evaluator', 'Evaluate'): Expression.SerializeToString,
-    }
-    method_implementations = {
-      ('Evaluator', 'Evaluate'): face_utilities.unary_unary_inline(servicer.Evaluate),
-    }
-    server_options = beta_implementations.server_options(request_deserializers=request_deserializers, response_serializers=response_serializers, thread_pool=pool, thread_pool_size=pool_size, default_timeout=default_timeout, maximum_timeout=maximum_timeout)
-    return beta_implementations.server(method_implementations, options=server_options)
-
-
-  def beta_create_Evaluator_stub(channel, host=None, metadata_transformer=None, pool=None, pool_size=None):
-    """The Beta API is deprecated for 0.15.0 and later.
-
-    It is recommended to use the GA API (classes and functions in this
-    file not marked beta) for all further purposes. This function was
-    generated only to ease transition from grpcio<0.15.0 to grpcio>=0.15.0"""
-    request_serializers = {
-      ('Evaluator', 'Evaluate'): Expression.SerializeToString,
-    }
-    response_deserializers = {
-      ('Evaluator', 'Evaluate'): Expression.FromString,
-    }
-    cardinalities = {
-      'Evaluate': cardinality.Cardinality.UNARY_UNARY,
-    }
-    stub_options = beta_implementations.stub_options(host=host, metadata_transformer=metadata_transformer, request_serializers=request_serializers, response_deserializers=response_deserializers, thread_pool=pool, thread_pool_size=pool_size)
-    return beta_implementations.dynamic_stub(channel, 'Evaluator', cardinalities, options=stub_options)
-except ImportError:
-  pass
+
+_EVALUATOR = _descriptor.ServiceDescriptor(
+  name='Evaluator',
+  full_name='Evaluator',
+  file=DESCRIPTOR,
+  index=0,
+  serialized_options=None,
+  serialized_start=4875,
+  serialized_end=4974,
+  methods=[
+  _descriptor.MethodDescriptor(
+    name='Evaluate',
+    full_name='Evaluator.Evaluate',
+    index=0,
+    containing_service=None,
+    input_type=_EXPRESSION,
+    output_type=_EXPRESSION,
+    serialized_options=None,
+  ),
+  _descriptor.MethodDescriptor(
+    name='EvaluateStream',
+    full_name='Evaluator.EvaluateStream',
+    index=1,
+    containing_service=None,
+    input_type=_EXPRESSION,
+    output_type=_EXPRESSION,
+    serialized_options=None,
+  ),
+])
+_sym_db.RegisterServiceDescriptor(_EVALUATOR)
+
+DESCRIPTOR.services_by_name['Evaluator'] = _EVALUATOR
+
 # @@protoc_insertion_point(module_scope)
@@ -20,6 +20,11 @@ class EvaluatorStub(object):
         request_serializer=qir__pb2.Expression.SerializeToString,
         response_deserializer=qir__pb2.Expression.FromString,
         )
+    self.EvaluateStream = channel.unary_stream(
+        '/Evaluator/EvaluateStream',
+        request_serializer=qir__pb2.Expression.SerializeToString,
+        response_deserializer=qir__pb2.Expression.FromString,
+        )
 
 
 class EvaluatorServicer(object):
@@ -28,6 +33,16 @@ class EvaluatorServicer(object):
   """
 
   def Evaluate(self, request, context):
+    # missing associated documentation comment in .proto file
+    pass
+    context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+    context.set_details('Method not implemented!')
+    raise NotImplementedError('Method not implemented!')
+
+  def EvaluateStream(self, request, context):
+    """Evaluates an expression which corresponds to a list, and streams the
+    elements of the list back as soon as they are produced.
+    """
     context.set_code(grpc.StatusCode.UNIMPLEMENTED)
     context.set_details('Method not implemented!')
     raise NotImplementedError('Method not implemented!')
@@ -40,6 +55,11 @@ def add_EvaluatorServicer_to_server(servicer, server):
           request_deserializer=qir__pb2.Expression.FromString,
           response_serializer=qir__pb2.Expression.SerializeToString,
       ),
+      'EvaluateStream': grpc.unary_stream_rpc_method_handler(
+          servicer.EvaluateStream,
+          request_deserializer=qir__pb2.Expression.FromString,
+          response_serializer=qir__pb2.Expression.SerializeToString,
+      ),
   }
   generic_handler = grpc.method_handlers_generic_handler(
       'Evaluator', rpc_method_handlers)
@@ -1,5 +1,12 @@
 from qir import *
+from qir.utils import identifiers, serialize, unserialize
+import qir.decompile
+import qir.avalanche
+import types
 import inspect
+import warnings
+import itertools
+import collections
 
 
 def case_1(x, z):
@@ -51,6 +58,756 @@ def case_6(x, y, z):
     return u
 
 
+class Record(dict):
+    """ A dictionary whose values can also be read as attributes. """
+    __getattr__ = dict.__getitem__
+
+
+def normalize(value):
+    """
+    Turn a native Python value into the value we get by decoding its QIR
+    encoding, in which lists are decoded into tuples.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(normalize(item) for item in value)
+    elif isinstance(value, dict):
+        return {key: normalize(item) for (key, item) in value.items()}
+    else:
+        return value
+
+
+def check(function, *args, **options):
+    """
+    Check that evaluating a function as a query directly in Python gives the
+    same result as calling it.
+    """
+    expected = function(*args)
+    result = query(function, **options).local(*args)
+
+    # Sets are decoded into tuples, in an order which Python doesn't define.
+    if isinstance(expected, (set, frozenset)):
+        (expected, result) = (set(expected), set(result))
+
+    print('%s: %r' % (function.__name__, result))
+    assert normalize(result) == normalize(expected), (result, expected)
+
+
+def check_inlined(function, name, inlined):
+    """
+    Check whether the calls of a function to the helper function name are
+    inlined when it is decompiled with inline=True.
+    """
+    prepared = query(function, inline=True)
+    prepared.prepare()
+
+    print('%s: %r' % (function.__name__, prepared.template))
+    assert (name not in identifiers(prepared.template)) == inlined
+
+
+def join_case_1(xs, ys):
+    return [a * b for a in xs for b in ys]
+
+
+def join_case_2(xs, ys):
+    return [a * b for a in xs for b in ys if a == b]
+
+
+def join_case_3(xs, ys):
+    return [(a, b) for a in xs if a > 1 for b in ys if b < a * 10]
+
+
+def join_case_4(xs, ys, zs):
+    return [a + b + c for a in xs for b in ys for c in zs]
+
+
+def join_case_5(users, orders):
+    return [{'name': u.name, 'total': o.total}
+            for u in users for o in orders if u.id == o.user]
+
+
+def flatten_case_1(rows):
+    return [c for r in rows for c in r]
+
+
+def flatten_case_2(rows):
+    return [i * 2 for r in rows if r.id > 1 for i in r.tags if i != 3]
+
+
+def flatten_case_3(xs):
+    return [c for a in xs for b in a for c in b]
+
+
+def group_case_1(users, orders):
+    return [{'name': u.name,
+             'totals': [o.total for o in orders if o.user == u.id]}
+            for u in users]
+
+
+def group_case_2(users, orders):
+    return [[o.total for o in orders if u.id == o.user and o.total > 6]
+            for u in users]
+
+
+def group_case_3(users, orders):
+    return [[o.total + u.id for o in orders if o.user == u.id]
+            for u in users]
+
+
+def group_case_4(xs, ys):
+    return [[b for b in ys if b > a] for a in xs]
+
+
+def loop_case_1(xs):
+    result = []
+    for x in xs:
+        result.append(x * 2)
+    return result
+
+
+def loop_case_2(users):
+    names = []
+    for u in users:
+        if u.id > 1:
+            names.append(u.name)
+    return names
+
+
+def loop_case_3(xs):
+    total = 0
+    for x in xs:
+        total += x * x
+    return total
+
+
+def loop_case_4(xs):
+    total = 0.5
+    for x in xs:
+        if x % 2 == 0:
+            total += x
+    return total
+
+
+def aggregate_case_1(xs):
+    return sum(x * 2 for x in xs)
+
+
+def aggregate_case_2(xs):
+    return len([x for x in xs if x > 1])
+
+
+def aggregate_case_3(xs):
+    return min([x for x in xs]), max(x - 1 for x in xs)
+
+
+def aggregate_case_4(xs):
+    return any(x > 2 for x in xs), all([x > 0 for x in xs])
+
+
+def aggregate_case_5(orders):
+    return sum(o.total for o in orders if o.user == 1) + 0.5
+
+
+def aggregate_case_6(orders):
+    return len({o.user: o.total for o in orders})
+
+
+def sort_case_1(xs):
+    return sorted(x * 2 for x in xs)
+
+
+def sort_case_2(xs):
+    return sorted([x for x in xs], reverse=True)[:2]
+
+
+def sort_case_3(orders):
+    return sorted([o for o in orders], key=lambda o: o.total)[:2]
+
+
+def sort_case_4(xs):
+    return [x for x in xs if x > 1][:2]
+
+
+def sort_case_5(s):
+    return sorted(s)
+
+
+def sort_case_6(s):
+    return sorted(s, reverse=True)
+
+
+def slice_case_1(xs):
+    return [x for x in xs if x > 1][1:]
+
+
+def slice_case_2(xs):
+    return sorted([x for x in xs])[1:3]
+
+
+def slice_case_3(xs):
+    return [x * 2 for x in xs][1:-1]
+
+
+def slice_case_4(xs):
+    return [x for x in xs][-2:]
+
+
+def semijoin_case_1(users, orders):
+    return [u.name for u in users if any(o.user == u.id for o in orders)]
+
+
+def semijoin_case_2(users, orders):
+    return [u.name for u in users
+            if u.id > 1 and any(o.user == u.id for o in orders
+                                if o.total < 6)]
+
+
+def semijoin_case_3(users, orders):
+    return [u.name for u in users if u.id in [o.user for o in orders]]
+
+
+def antijoin_case_1(users, orders):
+    return [u.name for u in users if not any(o.user == u.id for o in orders)]
+
+
+def antijoin_case_2(users, orders):
+    return [u.name for u in users
+            if all(o.total > 6 for o in orders if o.user == u.id)]
+
+
+def antijoin_case_3(users, orders):
+    return [u.name for u in users if u.id not in [o.user for o in orders]]
+
+
+def compare_case_1(users):
+    return [u.name for u in users if u.age is not None and u.age >= 18]
+
+
+def compare_case_2(users):
+    return [u.name for u in users if u.age is None]
+
+
+def compare_case_3(users):
+    return [u.name for u in users if u.id > 1 and u.id != 2]
+
+
+def compare_case_4(users):
+    return [u.name for u in users if u.id in (1, 3)]
+
+
+def compare_case_5(users):
+    return [u.name for u in users if u.name not in {'bob', 'eve'}]
+
+
+def compare_case_6(users, ids):
+    return [u.id for u in users if u.id in ids and 'v' in u.name]
+
+
+def compare_case_7(users):
+    return [u.id for u in users if u.id in range(2, 5)]
+
+
+def compare_case_8(orders, user):
+    return user in {o.user: o.total for o in orders}
+
+
+def filter_case_1(xs):
+    return [x for x in xs if x]
+
+
+def dict_case_1(orders):
+    return {o.user: o.total for o in orders}
+
+
+def dict_case_2(orders):
+    return {o.user: o.total for o in orders if o.total > 5}
+
+
+def dict_case_3(orders):
+    groups = collections.defaultdict(list)
+    for o in orders:
+        groups[o.user].append(o.total)
+    return groups
+
+
+def dict_case_5(xs, ys):
+    return {a: b for a in xs for b in ys if a < b}
+
+
+def dict_case_4(orders):
+    groups = {}
+    for o in orders:
+        if o.total > 5:
+            groups.setdefault(o.user, []).append(o.total)
+    return groups
+
+
+def set_case_1(orders):
+    return {o.user for o in orders}
+
+
+def set_case_2(xs):
+    return {x % 3 for x in xs if x > 1}
+
+
+def set_case_3(orders):
+    return len({o.user for o in orders})
+
+
+def branch_case_1(x):
+    y = 0
+    if 0 < x:
+        y = y + 1
+    if 1 < x:
+        y = y + 1
+    if 2 < x:
+        y = y + 1
+    if 3 < x:
+        y = y + 1
+    if 4 < x:
+        y = y + 1
+    if 5 < x:
+        y = y + 1
+    if 6 < x:
+        y = y + 1
+    if 7 < x:
+        y = y + 1
+    if 8 < x:
+        y = y + 1
+    if 9 < x:
+        y = y + 1
+    if 10 < x:
+        y = y + 1
+    if 11 < x:
+        y = y + 1
+    if 12 < x:
+        y = y + 1
+    if 13 < x:
+        y = y + 1
+    if 14 < x:
+        y = y + 1
+    if 15 < x:
+        y = y + 1
+    if 16 < x:
+        y = y + 1
+    if 17 < x:
+        y = y + 1
+    if 18 < x:
+        y = y + 1
+    if 19 < x:
+        y = y + 1
+    return y
+
+
+def closure_case_1():
+    x = 1
+    return lambda: x
+
+
+def closure_case_2():
+    y = 1
+    return lambda: y
+
+
+def stream_case_1(xs, threshold):
+    return local(x * 10 for x in xs if x > threshold)
+
+
+def stream_case_2(xs):
+    return [x * 2 for x in xs if x % 2 == 1]
+
+
+def avalanche_helper_1(user):
+    return [o.total for o in ORDERS if o.user == user]
+
+
+def avalanche_case_1(users):
+    return [avalanche_helper_1(u.id) for u in users]
+
+
+def avalanche_case_2(users):
+    return [len(u.name) for u in users]
+
+
+def failure_case_1(x):
+    global COUNTER
+    COUNTER = x
+
+
+def failure_case_2(xs):
+    return [(lambda k=x: k) for x in xs]
+
+
+def inline_helper_1(x, y):
+    return x * y + 1
+
+
+def inline_helper_2(x, k=10):
+    return x + k
+
+
+def inline_helper_3(x, *, k=1):
+    return x + k
+
+
+def inline_helper_4(*xs):
+    return len(xs)
+
+
+def inline_case_1(xs):
+    return [inline_helper_1(x, 2) for x in xs]
+
+
+def inline_case_2(xs):
+    return [inline_helper_2(x) for x in xs]
+
+
+def inline_case_3(xs):
+    return [inline_helper_3(x) for x in xs]
+
+
+def inline_case_4(xs):
+    return [inline_helper_4(x, x) for x in xs]
+
+
+def inline_case_5(xs):
+    return [inline_helper_1(x) for x in xs]
+
+
+# The helpers of another module read their own global variables, even when
+# the caller has variables with the same names.
+inline_module = types.ModuleType('inline_module')
+exec('LIMIT = 5\n'
+     'BOUNDS = [5]\n'
+     'def inline_helper_5(x):\n'
+     '    return x < LIMIT\n'
+     'def inline_helper_6(x):\n'
+     '    return x < BOUNDS[0]\n', inline_module.__dict__)
+inline_helper_5 = inline_module.inline_helper_5
+inline_helper_6 = inline_module.inline_helper_6
+LIMIT = 100
+
+
+def make_inline_helper_7(k):
+    def inline_helper_7(x):
+        return x > k
+    return inline_helper_7
+
+
+inline_helper_7 = make_inline_helper_7(20)
+
+
+def inline_case_6(xs):
+    return [x for x in xs if inline_helper_5(x) and x < LIMIT]
+
+
+def inline_case_7(xs):
+    return [x for x in xs if inline_helper_6(x)]
+
+
+def inline_case_8(xs):
+    return [x for x in xs if inline_helper_7(x)]
+
+
+def global_case_1(age):
+    return [{'name': u.name} for u in USERS if u.id < age]
+
+
+def global_case_2(xs):
+    return [normalize(x) for x in xs]
+
+
+def resolve_case_1(users):
+    return [u.name for u in users if u.id in ADMINS]
+
+
+def resolve_case_2():
+    return [u.name for u in GUESTS]
+
+
+USERS = [Record(id=1, name='ada', age=36), Record(id=2, name='bob', age=17),
+         Record(id=3, name='eve', age=None)]
+ORDERS = [Record(user=1, total=10), Record(user=3, total=5),
+          Record(user=1, total=7)]
+
+print('==== Queries evaluated locally ====')
+check(join_case_1, [1, 2], [10, 20])
+check(join_case_1, [], [10, 20])
+check(join_case_2, [1, 2, 3], [2, 3, 3, 4])
+check(join_case_3, [1, 2, 3], [10, 15, 25])
+check(join_case_4, [1, 2], [10, 20], [100, 200])
+check(join_case_5, USERS, ORDERS)
+check(flatten_case_1, [[1, 2], [], [3]])
+check(flatten_case_2, [Record(id=1, tags=[1]), Record(id=2, tags=[2, 3]),
+                       Record(id=3, tags=[4])])
+check(flatten_case_3, [[[1], [2, 3]], [], [[], [4]]])
+check(group_case_1, USERS, ORDERS)
+check(group_case_1, USERS + USERS, ORDERS)
+check(group_case_2, USERS, ORDERS)
+check(group_case_3, USERS, ORDERS)
+check(group_case_4, [1, 2], [1, 2, 3])
+check(loop_case_1, [1, 2, 3])
+check(loop_case_1, [])
+check(loop_case_2, USERS)
+check(loop_case_3, [1, 2, 3])
+check(loop_case_3, [])
+check(loop_case_4, [1, 2, 3, 4])
+check(aggregate_case_1, [1, 2, 3])
+check(aggregate_case_1, [])
+check(aggregate_case_2, [1, 2, 3])
+check(aggregate_case_3, [4, 2, 9])
+check(aggregate_case_4, [1, 2, 3])
+check(aggregate_case_4, [])
+check(aggregate_case_5, ORDERS)
+check(sort_case_1, [3, 1, 2])
+check(sort_case_2, [3, 1, 2, 5])
+check(sort_case_2, [3])
+check(sort_case_3, ORDERS)
+check(sort_case_4, [1, 2, 3, 4])
+check(slice_case_1, [1, 2, 3, 4])
+check(slice_case_1, [])
+check(slice_case_2, [3, 1, 2, 5])
+check(slice_case_2, [3])
+check(slice_case_3, [1, 2, 3, 4])
+check(slice_case_3, [1])
+check(semijoin_case_1, USERS, ORDERS)
+check(semijoin_case_2, USERS, ORDERS)
+check(semijoin_case_3, USERS, ORDERS)
+check(antijoin_case_1, USERS, ORDERS)
+check(antijoin_case_1, USERS, [])
+check(antijoin_case_2, USERS, ORDERS)
+check(antijoin_case_3, USERS, ORDERS)
+check(compare_case_1, USERS)
+check(compare_case_2, USERS)
+check(compare_case_3, USERS)
+check(compare_case_4, USERS)
+check(compare_case_5, USERS)
+check(compare_case_6, USERS, [2, 3])
+check(compare_case_7, USERS)
+check(filter_case_1, [0, 1, '', 'a', [], [2], None])
+check(dict_case_1, ORDERS)
+check(dict_case_2, ORDERS)
+check(dict_case_3, ORDERS)
+check(dict_case_3, [])
+check(dict_case_4, ORDERS)
+check(set_case_1, ORDERS)
+check(set_case_2, [1, 2, 3, 4, 5, 6])
+check(set_case_3, ORDERS)
+check(branch_case_1, 7)
+check(branch_case_1, 25)
+check(global_case_1, 3)
+print()
+
+# The global function can't be encoded, so the query can only be evaluated
+# by calling global_case_2 itself.
+print('==== Queries evaluated natively ====')
+result = query(global_case_2)([1, [2]])
+print('global_case_2: %r' % (result,))
+assert result == [1, (2,)], result
+
+# Nested dict comprehensions, len() and in on dict comprehensions, slices
+# with a negative start, and sorted() on values which might not be lists
+# aren't translated.
+for (function, args) in [(aggregate_case_6, [ORDERS]),
+                          (compare_case_8, [ORDERS, 3]),
+                          (compare_case_8, [ORDERS, 2]),
+                          (dict_case_5, [[1, 2], [2, 3]]),
+                          (slice_case_4, [[1, 2, 3]]),
+                          (sort_case_5, ['cba']),
+                          (sort_case_5, [{'b': 1, 'a': 2}]),
+                          (sort_case_6, ['abc'])]:
+    result = query(function)(*args)
+    print('%s: %r' % (function.__name__, result))
+    assert result == function(*args), result
+
+assert 'Sort(' not in repr(encode(sort_case_5))
+
+try:
+    encode(dict_case_5)
+    assert False, 'dict_case_5 should not be translated'
+except NotImplementedError:
+    pass
+print()
+
+print('==== Resolved globals ====')
+ADMINS = (1, 3)
+GUESTS = [Record(id=4, name='joe', age=50)]
+check(resolve_case_1, USERS, resolve=True)
+check(global_case_1, 3, resolve=True)
+
+# Only immutable values are resolved into constants, so mutating a list
+# in place is seen by the next call.
+resolved = query(resolve_case_2, resolve=True)
+assert resolved.local() == ('joe',)
+GUESTS.append(Record(id=5, name='sue', age=20))
+print('resolve_case_2: %r' % (resolved.local(),))
+assert resolved.local() == ('joe', 'sue')
+
+resolved = query(resolve_case_1, resolve=True)
+assert 'ADMINS' not in identifiers(resolved.bind(USERS))
+print()
+
+print('==== Inlined calls ====')
+check(inline_case_1, [1, 2, 3], inline=True)
+check_inlined(inline_case_1, 'inline_helper_1', True)
+check_inlined(inline_case_2, 'inline_helper_2', False)
+check_inlined(inline_case_3, 'inline_helper_3', False)
+check_inlined(inline_case_4, 'inline_helper_4', False)
+check_inlined(inline_case_5, 'inline_helper_1', False)
+check(inline_case_6, [1, 10, 50], inline=True)
+check_inlined(inline_case_6, 'inline_helper_5', True)
+check_inlined(inline_case_7, 'inline_helper_6', False)
+check(inline_case_8, [1, 10, 50], inline=True)
+check_inlined(inline_case_8, 'inline_helper_7', True)
+print()
+
+# Both closures have the same bytecode, but not the same free variables, so
+# the cache must not return the expression of the first one for the second.
+print('==== Cached closures ====')
+closures = [encode(closure_case_1()), encode(closure_case_2())]
+print(closures)
+assert repr(closures) == "[Identifier('x'), Identifier('y')]", closures
+print()
+
+# Grouping loops, dict comprehensions and decorrelated comprehensions have
+# their own operators, which can be sent to a QIR server.
+print('==== Serialized groupings ====')
+for (function, operator) in [(dict_case_1, IndexBy), (dict_case_3, GroupBy),
+                             (group_case_1, GroupBy)]:
+    expression = encode(function)
+    assert operator.__name__ + '(' in repr(expression), expression
+    assert repr(unserialize(serialize(expression))) == repr(expression)
+    print('%s: %s' % (function.__name__, operator.__name__))
+print()
+
+# Generator expressions are decompiled without being run, along with the
+# variables they capture and the position of their source iterator, and only
+# the elements which are asked for are computed.
+print('==== Streamed generator expressions ====')
+rows = stream_case_1([1, 2, 3, 4], 2)
+assert not isinstance(rows, list), rows
+rows = list(rows)
+print('stream_case_1: %r' % (rows,))
+assert rows == [30, 40], rows
+
+rows = list(itertools.islice(local(x * 2 for x in range(10 ** 12)), 3))
+print('range: %r' % (rows,))
+assert rows == [0, 2, 4], rows
+
+source = iter([1, 2, 3])
+next(source)
+rows = list(local(x + 1 for x in source))
+print('advanced: %r' % (rows,))
+assert rows == [3, 4], rows
+
+# Generator expressions which call functions are iterated in Python, without
+# consuming their source beforehand.
+rows = list(local(inline_helper_2(x) for x in [1, 2]))
+print('helper: %r' % (rows,))
+assert rows == [11, 12], rows
+
+source = iter([1, 2])
+rows = list(local(str(x) for x in source))
+print('builtin: %r' % (rows,))
+assert rows == ['1', '2'], rows
+
+started = (x for x in [1, 2])
+next(started)
+try:
+    local(started)
+    assert False, 'started generators should not be translated'
+except TypeError:
+    pass
+
+# Without a QIR server, the query falls back to streaming it locally.
+rows = list(query(stream_case_2).iterate([1, 2, 3]))
+print('stream_case_2: %r' % (rows,))
+assert rows == [2, 6], rows
+print()
+
+# Calls to functions which weren't inlined and tables under a per-element
+# function are reported, and estimated to take a round trip per element.
+print('==== Query avalanches ====')
+with warnings.catch_warnings(record=True) as caught:
+    warnings.simplefilter('always')
+    query(avalanche_case_1, avalanche='warn')
+    query(avalanche_case_1, inline=True, avalanche='warn')
+    query(avalanche_case_2, avalanche='warn')
+print('avalanche_case_1: %s' % caught[0].message)
+assert [warning.category for warning in caught] == \
+    [errors.QueryAvalancheWarning], caught
+
+try:
+    query(avalanche_case_1, avalanche='error')
+    assert False, 'avalanche_case_1 should raise a QueryAvalancheError'
+except errors.QueryAvalancheError:
+    pass
+
+database = Database('postgresql', 'shop', 'localhost', 5432, 'qir', '')
+users = qir.specials.Table(database, 'users')
+orders = qir.specials.Table(database, 'orders')
+nested = Project(
+    Lambda(Identifier('u'), Filter(
+        Lambda(Identifier('o'), Equal(
+            TupleDestr(Identifier('o'), String('user')),
+            TupleDestr(Identifier('u'), String('id')))),
+        orders)),
+    Filter(Lambda(Identifier('u'), Boolean(True)), users))
+report = qir.avalanche.analyze(nested, {'users': 50})
+print('nested: %d round trips' % report.round_trips)
+assert [access.kind for access in report.accesses] == ['table'], report
+assert report.accesses[0].expression is orders, report
+assert report.round_trips == 51, report
+
+report = qir.avalanche.analyze(
+    Project(Lambda(Identifier('u'), Identifier('u')), users))
+assert report == ([], 1), report
+
+# Builtins have a third field, which isn't serialized.
+measured = Project(Lambda(Identifier('u'), Application(
+    qir.specials.Builtin('builtins', 'len', len), Identifier('u'))), users)
+report = qir.avalanche.analyze(measured)
+assert report == ([], 1), report
+assert identifiers(measured) == {'u'}
+print()
+
+# Unsupported instructions are found before decompiling, even in nested
+# code objects, and the errors they raise are cached, unlike errors which
+# might not happen again.
+print('==== Cached failures ====')
+assert qir.decompile.find_unsupported(failure_case_1.__code__) == \
+    'STORE_GLOBAL'
+assert qir.decompile.find_unsupported(failure_case_2.__code__) == \
+    'MAKE_FUNCTION'
+assert qir.decompile.find_unsupported(global_case_1.__code__) is None
+
+cache = DecompilationCache()
+failures = []
+for _ in range(2):
+    try:
+        cache.decompile(failure_case_1.__code__)
+        assert False, 'failure_case_1 should not be translated'
+    except NotImplementedError as error:
+        failures.append(error)
+print('failure_case_1: %r' % (failures[0],))
+assert failures[0] is failures[1] and len(cache.failures) == 1
+
+
+def exhausted(code):
+    raise RecursionError
+
+decompile_code = qir.decompile.decompile
+qir.decompile.decompile = exhausted
+try:
+    cache.decompile(global_case_1.__code__)
+    assert False, 'global_case_1 should raise a RecursionError'
+except RecursionError:
+    pass
+finally:
+    qir.decompile.decompile = decompile_code
+assert len(cache.failures) == 1
+print('global_case_1: %r' % (cache.decompile(global_case_1.__code__),))
+print()
+
 for i in range(6):
     case = globals()['case_' + str(i + 1)]
     print('==== Test case n°%d ====' % i)